@@ -0,0 +1,17 @@
+from typing import Optional
+
+from osdu_commons.clients.aio.rest_client import AsyncRestClient
+from osdu_commons.clients.rest_client import ConnectionPoolConfig
+
+
+class AsyncCognitoAwareRestClient(AsyncRestClient):
+
+    def __init__(self, base_url: str, cognito_headers: dict = None, timeout_seconds=None,
+                 pool_config: ConnectionPoolConfig = None, trusted_decode: Optional[bool] = None):
+        super().__init__(base_url, timeout_seconds, pool_config, trusted_decode)
+        self._cognito_headers = cognito_headers if cognito_headers is not None else {}
+
+    async def post(self, *args, **kwargs):
+        headers = kwargs.get('headers', {})
+        kwargs['headers'] = {**headers, **self._cognito_headers}
+        return await super().post(*args, **kwargs)
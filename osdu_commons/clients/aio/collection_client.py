@@ -0,0 +1,74 @@
+import logging
+from typing import List
+
+from osdu_commons.clients.aio.cognito_aware_rest_client import AsyncCognitoAwareRestClient
+from osdu_commons.clients.aio.retry import aio_osdu_retry
+from osdu_commons.clients.collection_client import Collection, CollectionClient
+from osdu_commons.utils.srn import SRN
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCollectionClient(AsyncCognitoAwareRestClient):
+
+    @aio_osdu_retry()
+    async def create_collection(self, owner_id: str, name: str, description: str = None,
+                                workspace_srn: SRN = None, resources: List[SRN] = None,
+                                filter_specification: List[dict] = None) -> SRN:
+        logger.info(f'Create collection {name} with owner {owner_id}')
+        response = await self.post(
+            path='CreateCollection',
+            json=CollectionClient._collection_body(
+                owner_id, name, description, workspace_srn, resources, filter_specification)
+        )
+
+        return SRN.from_string(response.json()['SRN'])
+
+    @aio_osdu_retry()
+    async def update_collection(self, collection_srn: SRN, owner_id: str, name: str,
+                                description: str = None, workspace_srn: SRN = None,
+                                resources: List[SRN] = None, filter_specification: List[dict] = None) -> SRN:
+        logger.info(f'Update collection {str(collection_srn)}')
+        response = await self.post(
+            path='UpdateCollection',
+            json={
+                'SRN': str(collection_srn),
+                **CollectionClient._collection_body(
+                    owner_id, name, description, workspace_srn, resources, filter_specification)
+            }
+        )
+
+        return SRN.from_string(response.json()['SRN'])
+
+    @aio_osdu_retry()
+    async def get_collection(self, collection_srn: SRN) -> Collection:
+        response = await self.post(
+            path='GetCollection',
+            json={
+                'SRN': str(collection_srn)
+            }
+        )
+
+        return Collection.from_json(response.json(), self.trusted_decode)
+
+    @aio_osdu_retry()
+    async def list_collections(self, owner_id: str) -> List[Collection]:
+        # pagination is not yet implemented in Collection Service
+        response = await self.post(
+            path='ListCollection',
+            json={
+                'OwnerID': owner_id
+            }
+        )
+        collections = response.json()['collections']
+        return [Collection.from_json(collection, self.trusted_decode) for collection in collections]
+
+    @aio_osdu_retry()
+    async def delete_collection(self, collection_srn: SRN) -> None:
+        logger.info(f'Delete collection {str(collection_srn)}')
+        await self.post(
+            path='DeleteCollection',
+            json={
+                'SRN': str(collection_srn)
+            }
+        )
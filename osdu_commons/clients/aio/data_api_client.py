@@ -0,0 +1,47 @@
+import logging
+import os
+from typing import List
+
+from osdu_commons.clients.aio.rest_client import AsyncRestClient
+from osdu_commons.clients.aio.retry import aio_osdu_retry
+from osdu_commons.clients.data_api_client import DataAPIClient, GetResourcesResult
+from osdu_commons.clients.rest_client import HttpClientException
+from osdu_commons.model.resource import ResourceInit, Resource, ResourceUpdate
+from osdu_commons.utils.srn import SRN
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDataAPIClient(AsyncRestClient):
+    TIMEOUT = DataAPIClient.TIMEOUT
+
+    @classmethod
+    def from_environ(cls) -> 'AsyncDataAPIClient':
+        return cls(
+            base_url=os.environ['DATA_API_BASE_URL']
+        )
+
+    @aio_osdu_retry()
+    async def create_resources(self, resource_inits: List[ResourceInit], region_id: SRN) -> List[Resource]:
+        body = DataAPIClient._create_resources_body(resource_inits, region_id)
+        try:
+            response = await self.post(body, path='v1/createresources')
+        except HttpClientException as e:
+            DataAPIClient._handle_create_resources_client_error(e, resource_inits)
+            raise
+
+        return DataAPIClient._get_resources_from_api_response(response, self.trusted_decode)
+
+    @aio_osdu_retry()
+    async def update_resources(self, resource_updates: List[ResourceUpdate], region_id: SRN) -> List[Resource]:
+        body = DataAPIClient._update_resources_body(resource_updates, region_id)
+        response = await self.post(body, path='v1/updateresources')
+
+        return DataAPIClient._get_resources_from_api_response(response, self.trusted_decode)
+
+    @aio_osdu_retry()
+    async def get_resources(self, resource_ids: List[SRN]) -> GetResourcesResult:
+        body = DataAPIClient._get_resources_body(resource_ids)
+        response = await self.post(body, path='v1/getresources')
+
+        return DataAPIClient._get_resources_result(response, self.trusted_decode)
@@ -0,0 +1,35 @@
+import logging
+from typing import List, Union
+
+from osdu_commons.clients.aio.cognito_aware_rest_client import AsyncCognitoAwareRestClient
+from osdu_commons.clients.aio.rest_client import AsyncRestResponse
+from osdu_commons.clients.aio.retry import aio_osdu_retry
+from osdu_commons.clients.delivery_client import DeliveryClient, GetResourcesResponseSuccess, \
+    GetResourcesResponseNotFound, GetResourcesException
+from osdu_commons.clients.rest_client import HttpException, HttpNotFoundException
+from osdu_commons.utils.srn import SRN
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDeliveryClient(AsyncCognitoAwareRestClient):
+    MAX_GET_RESOURCES_BATCH_SIZE = DeliveryClient.MAX_GET_RESOURCES_BATCH_SIZE
+
+    @aio_osdu_retry()
+    async def _get_resources(self, srns_to_fetch: List[str], target_region_id: str) -> AsyncRestResponse:
+        logger.debug(f'Getting resources with srns: {srns_to_fetch}')
+        return await self.post(
+            path='GetResources',
+            json=DeliveryClient._get_resources_body(srns_to_fetch, target_region_id),
+        )
+
+    async def get_resources(self, srns_to_fetch: List[SRN], target_region_id: str = 'srn:dummy:dummy:') \
+            -> Union[GetResourcesResponseSuccess, GetResourcesResponseNotFound]:
+        srns_to_fetch = [str(srn) for srn in srns_to_fetch]
+        try:
+            response = await self._get_resources(srns_to_fetch, target_region_id)
+            return DeliveryClient._handle_get_resources_200(response, self.trusted_decode)
+        except HttpNotFoundException as e:
+            return DeliveryClient._handle_get_resources_404(e.response)
+        except HttpException as e:
+            raise GetResourcesException(e.response.text)
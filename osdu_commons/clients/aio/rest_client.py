@@ -0,0 +1,92 @@
+import json as json_module
+import logging
+from typing import Optional
+from urllib.parse import urljoin
+
+import aiohttp
+
+from osdu_commons.clients.rest_client import RestClient, ConnectionPoolConfig
+from osdu_commons.utils.trusted import resolve_trusted_decode
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRestRequest:
+    def __init__(self, url: str, json):
+        self.url = url
+        self._json = json
+
+    @property
+    def body(self) -> str:
+        return json_module.dumps(self._json)
+
+
+class AsyncRestResponse:
+    """ Fully read response exposing the subset of requests.Response used by clients and HttpException """
+
+    def __init__(self, status_code: int, text: str, request: AsyncRestRequest):
+        self.status_code = status_code
+        self.text = text
+        self.request = request
+
+    def json(self):
+        return json_module.loads(self.text)
+
+    def raise_for_status(self):
+        RestClient._check_response(self)
+
+
+class AsyncRestClient:
+    TIMEOUT = RestClient.TIMEOUT
+
+    def __init__(self, base_url, timeout_seconds=None, pool_config: ConnectionPoolConfig = None,
+                 trusted_decode: Optional[bool] = None):
+        self._base_url = base_url if base_url.endswith('/') else f'{base_url}/'
+        self._timeout_seconds = self.TIMEOUT if timeout_seconds is None else timeout_seconds
+        self._pool_config = pool_config if pool_config is not None else ConnectionPoolConfig()
+        self._trusted_decode = trusted_decode
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def post(self, json, path=None, params=None, headers=None) -> AsyncRestResponse:
+        url = self._make_url(path=path)
+        async with self._get_session().post(url=url, json=json, params=params, headers=headers) as response:
+            text = await response.text()
+
+        rest_response = AsyncRestResponse(
+            status_code=response.status,
+            text=text,
+            request=AsyncRestRequest(url=str(response.url), json=json)
+        )
+        RestClient._check_response(rest_response)
+        return rest_response
+
+    @property
+    def trusted_decode(self) -> bool:
+        return resolve_trusted_decode(self._trusted_decode)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Session has to be created inside of the running event loop
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._pool_config.pool_size * self._pool_config.max_connections_per_host,
+                    limit_per_host=self._pool_config.max_connections_per_host,
+                    force_close=not self._pool_config.keep_alive,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self._timeout_seconds),
+            )
+        return self._session
+
+    def _make_url(self, path):
+        return urljoin(self._base_url, '' if path is None else path)
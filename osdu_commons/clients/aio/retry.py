@@ -0,0 +1,43 @@
+import asyncio
+import logging
+import random
+from functools import wraps
+
+import aiohttp
+
+from osdu_commons.clients.retry import MAX_RETRIES, WAIT_FIXED, WAIT_RANDOM_MIN, WAIT_RANDOM_MAX, \
+    TIMEOUT_EXCEPTIONS, should_be_retried
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'aio_osdu_retry',
+]
+
+AIO_TIMEOUT_EXCEPTIONS = TIMEOUT_EXCEPTIONS + (asyncio.TimeoutError, aiohttp.ServerTimeoutError)
+
+
+def aio_osdu_retry(
+        max_retries=MAX_RETRIES,
+        wait_fixed=WAIT_FIXED,
+        wait_random_min=WAIT_RANDOM_MIN,
+        wait_random_max=WAIT_RANDOM_MAX,
+):
+    def wait_seconds():
+        # the same as combined wait_fixed and wait_random strategies of retrying
+        return max(wait_fixed, random.randint(wait_random_min, wait_random_max)) / 1000
+
+    def decorator(f):
+        @wraps(f)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(1, max_retries + 1):
+                try:
+                    return await f(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_retries or not should_be_retried(e, AIO_TIMEOUT_EXCEPTIONS):
+                        raise
+                await asyncio.sleep(wait_seconds())
+
+        return wrapper
+
+    return decorator
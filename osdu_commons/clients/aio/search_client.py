@@ -0,0 +1,33 @@
+import logging
+from typing import AsyncIterable
+
+from osdu_commons.clients.aio.cognito_aware_rest_client import AsyncCognitoAwareRestClient
+from osdu_commons.clients.aio.retry import aio_osdu_retry
+from osdu_commons.clients.search_client import SearchRequest, SearchResponse, SearchResult
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSearchClient(AsyncCognitoAwareRestClient):
+
+    @aio_osdu_retry()
+    async def index_search(self, search_request: SearchRequest) -> SearchResponse:
+        logger.debug(f'Searching for {search_request.asdict()}')
+        response = await self.post(
+            path='indexSearch',
+            json=search_request.asdict(),
+            headers=self._cognito_headers,
+        )
+
+        return SearchResponse.from_json(response.json(), self.trusted_decode)
+
+    async def iter_index_search(self, search_request: SearchRequest) -> AsyncIterable[SearchResult]:
+        search_response = SearchResponse(results=[], total_hits=1, facets={}, start=0, count=0)
+
+        while search_response.has_results_left:
+            search_request.start = search_response.end
+
+            search_response = await self.index_search(search_request)
+            logger.debug(search_response)
+            for search_result in search_response.results:
+                yield search_result
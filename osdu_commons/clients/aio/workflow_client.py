@@ -0,0 +1,53 @@
+import logging
+
+from osdu_commons.clients.aio.cognito_aware_rest_client import AsyncCognitoAwareRestClient
+from osdu_commons.clients.aio.retry import aio_osdu_retry
+from osdu_commons.clients.workflow_client import WorkflowClient, StartWorkflowResponse, WorkflowJobDescription, \
+    Workflows
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWorkflowClient(AsyncCognitoAwareRestClient):
+    TIMEOUT = WorkflowClient.TIMEOUT
+
+    async def start_smds_workflow(self, manifest_json: dict) -> StartWorkflowResponse:
+        resource_type_id = manifest_json['ResourceTypeID']
+        logger.info(f'Starting SMDS workflow for {resource_type_id}')
+        response = await self.post(
+            path=WorkflowClient.START_SMDS_WORKFLOW_ENDPOINT,
+            json=WorkflowClient._start_workflow_body(manifest_json, resource_type_id)
+        )
+        response.raise_for_status()
+
+        return StartWorkflowResponse.from_json(response.json(), self.trusted_decode)
+
+    async def start_swps_workflow(self, manifest_json: dict) -> StartWorkflowResponse:
+        resource_type_id = manifest_json['WorkProduct']['ResourceTypeID']
+        logger.info(f'Starting SWPS workflow for {resource_type_id}')
+        response = await self.post(
+            path=WorkflowClient.START_SWPS_WORKFLOW_ENDPOINT,
+            json=WorkflowClient._start_workflow_body(manifest_json, resource_type_id)
+        )
+        response.raise_for_status()
+
+        return StartWorkflowResponse.from_json(response.json(), self.trusted_decode)
+
+    @aio_osdu_retry()
+    async def describe_workflow(self, workflow_id: str) -> WorkflowJobDescription:
+        logger.debug(f'Calling describe workflow with id: {workflow_id}')
+        response = await self.post(
+            path=WorkflowClient.DESCRIBE_ENDPOINT,
+            json=WorkflowClient._describe_workflow_body(workflow_id)
+        )
+        return WorkflowJobDescription.from_json(response.json(), self.trusted_decode)
+
+    @aio_osdu_retry()
+    async def list_workflows(self, filters: dict = None, next_token: str = None,
+                             max_page_size: int = None) -> Workflows:
+        logger.info(f'Calling list workflows with {filters or "no"} filters')
+        response = await self.post(
+            path=WorkflowClient.LIST_ENDPOINT,
+            json=WorkflowClient._list_workflows_body(filters, next_token, max_page_size)
+        )
+        return Workflows.from_json(response.json(), self.trusted_decode)
@@ -4,11 +4,11 @@ from typing import Dict
 import attr
 from attr.validators import instance_of
 
-from osdu_commons.clients.rest_client import RestClient
+from osdu_commons.clients.rest_client import RestClient, ConnectionPoolConfig
 from osdu_commons.clients.retry import osdu_retry
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class AuthHeaders:
     access_token: str = attr.ib(validator=instance_of(str))
     id_token: str = attr.ib(validator=instance_of(str))
@@ -31,7 +31,7 @@ class AuthHeaders:
         )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class AuthRequest:
     action: str = attr.ib(validator=instance_of(str))
     method_arn: str = attr.ib(validator=instance_of(str))
@@ -41,7 +41,7 @@ class AuthRequest:
         return attr.asdict(self)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class AuthResponse:
     policy: Dict = attr.ib(validator=instance_of(Dict))
 
@@ -51,8 +51,8 @@ class AuthResponse:
 
 
 class AuthClient(RestClient):
-    def __init__(self, base_url, timeout_seconds=1):
-        super().__init__(base_url, timeout_seconds)
+    def __init__(self, base_url, timeout_seconds=1, pool_config: ConnectionPoolConfig = None):
+        super().__init__(base_url, timeout_seconds, pool_config)
 
     @osdu_retry(
         max_retries=3,
@@ -1,10 +1,14 @@
-from osdu_commons.clients.rest_client import RestClient
+from typing import Optional
+
+from osdu_commons.clients.rest_client import RestClient, ConnectionPoolConfig
 
 
 class CognitoAwareRestClient(RestClient):
 
-    def __init__(self, base_url: str, cognito_headers: dict = None, timeout_seconds=None):
-        super().__init__(base_url, timeout_seconds)
+    def __init__(self, base_url: str, cognito_headers: dict = None, timeout_seconds=None,
+                 pool_config: ConnectionPoolConfig = None, coalesce_requests: bool = False,
+                 trusted_decode: Optional[bool] = None):
+        super().__init__(base_url, timeout_seconds, pool_config, coalesce_requests, trusted_decode)
         self._cognito_headers = cognito_headers if cognito_headers is not None else {}
 
     def post(self, *args, **kwargs):
@@ -31,7 +31,7 @@ def create_cognito_client_from_config(config):
     return CognitoClient(cognito_client, user_pool_id, app_client_id, app_client_secret)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class AuthTokens:
     access_token: str = attr.ib(validator=instance_of(str))
     id_token: str = attr.ib(validator=instance_of(str))
@@ -52,7 +52,7 @@ class AuthTokens:
         )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class CognitoUser:
     name: str = attr.ib(validator=instance_of(str))
     password: str = attr.ib(validator=instance_of(str))
@@ -6,13 +6,15 @@ from attr.validators import instance_of, optional
 
 from osdu_commons.clients.cognito_aware_rest_client import CognitoAwareRestClient
 from osdu_commons.clients.retry import osdu_retry
+from osdu_commons.utils.single_flight import single_flight
 from osdu_commons.utils.srn import SRN
+from osdu_commons.utils.trusted import constructor
 from osdu_commons.utils.validators import list_of
 
 logger = logging.getLogger(__name__)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class Collection:
     srn: SRN = attr.ib(validator=instance_of(SRN))
     owner_id: Optional[str] = attr.ib(validator=optional(instance_of(str)))
@@ -23,8 +25,8 @@ class Collection:
     filter_specification: List[dict] = attr.ib(validator=list_of(dict))
 
     @classmethod
-    def from_json(cls, json_object):
-        return cls(
+    def from_json(cls, json_object, trusted: bool = False):
+        return constructor(cls, trusted)(
             srn=SRN.from_string(json_object['SRN']),
             owner_id=json_object.get('OwnerID'),
             name=json_object.get('Name'),
@@ -47,14 +49,7 @@ class CollectionClient(CognitoAwareRestClient):
         logger.info(f'Create collection {name} with owner {owner_id}')
         response_json = self.post(
             path='CreateCollection',
-            json={
-                'OwnerID': owner_id,
-                'Name': name,
-                'Description': description,
-                'WorkSpaceSRN': str(workspace_srn) if workspace_srn else None,
-                'Resources': [str(srn) for srn in resources] if resources is not None else None,
-                'FilterSpecification': filter_specification
-            }
+            json=self._collection_body(owner_id, name, description, workspace_srn, resources, filter_specification)
         ).json()
 
         return SRN.from_string(response_json['SRN'])
@@ -68,17 +63,13 @@ class CollectionClient(CognitoAwareRestClient):
             path='UpdateCollection',
             json={
                 'SRN': str(collection_srn),
-                'OwnerID': owner_id,
-                'Name': name,
-                'Description': description,
-                'WorkSpaceSRN': str(workspace_srn) if workspace_srn else None,
-                'Resources': [str(srn) for srn in resources] if resources is not None else None,
-                'FilterSpecification': filter_specification
+                **self._collection_body(owner_id, name, description, workspace_srn, resources, filter_specification)
             }
         ).json()
 
         return SRN.from_string(response_json['SRN'])
 
+    @single_flight(lambda collection_srn: str(collection_srn))
     @osdu_retry()
     def get_collection(self, collection_srn: SRN) -> Collection:
         response_json = self.post(
@@ -88,7 +79,7 @@ class CollectionClient(CognitoAwareRestClient):
             }
         ).json()
 
-        return Collection.from_json(response_json)
+        return Collection.from_json(response_json, self.trusted_decode)
 
     @osdu_retry()
     def list_collections(self, owner_id: str) -> List[Collection]:
@@ -100,7 +91,7 @@ class CollectionClient(CognitoAwareRestClient):
             }
         ).json()
         collections = response_json['collections']
-        return [Collection.from_json(collection) for collection in collections]
+        return [Collection.from_json(collection, self.trusted_decode) for collection in collections]
 
     @osdu_retry()
     def delete_collection(self, collection_srn: SRN) -> None:
@@ -111,3 +102,15 @@ class CollectionClient(CognitoAwareRestClient):
                 'SRN': str(collection_srn)
             }
         )
+
+    @staticmethod
+    def _collection_body(owner_id: str, name: str, description: Optional[str], workspace_srn: Optional[SRN],
+                         resources: Optional[List[SRN]], filter_specification: Optional[List[dict]]) -> dict:
+        return {
+            'OwnerID': owner_id,
+            'Name': name,
+            'Description': description,
+            'WorkSpaceSRN': str(workspace_srn) if workspace_srn else None,
+            'Resources': [str(srn) for srn in resources] if resources is not None else None,
+            'FilterSpecification': filter_specification
+        }
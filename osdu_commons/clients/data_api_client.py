@@ -1,7 +1,8 @@
 import json
 import logging
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
 
 import attr
 from attr.validators import instance_of
@@ -11,20 +12,37 @@ from osdu_commons.clients.rest_client import RestClient, HttpClientException
 from osdu_commons.clients.retry import osdu_retry
 from osdu_commons.model.aws import S3Location
 from osdu_commons.model.resource import ResourceInit, Resource, ResourceUpdate
+from osdu_commons.model.resource_batch import ResourceBatch
+from osdu_commons.utils.single_flight import single_flight
 from osdu_commons.utils.srn import SRN
+from osdu_commons.utils.trusted import constructor
 from osdu_commons.utils.validators import list_of
 
 logger = logging.getLogger(__name__)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class GetResourcesResult:
     resources: List[Resource] = attr.ib(validator=list_of(instance_of(Resource)))
     unprocessed_srns: List[SRN] = attr.ib(validator=list_of(instance_of(SRN)))
 
 
+@attr.s(frozen=True, slots=True)
+class GetResourceBatchResult:
+    resources: ResourceBatch = attr.ib(validator=instance_of(ResourceBatch))
+    unprocessed_srns: List[SRN] = attr.ib(validator=list_of(instance_of(SRN)))
+
+
 class DataAPIClient(RestClient):
     TIMEOUT = 7
+    WRITE_BATCH_SIZE = 100
+    MAX_CONCURRENT_WRITES = 4
+
+    def __init__(self, base_url, *args, write_batch_size: int = None, max_concurrent_writes: int = None, **kwargs):
+        super().__init__(base_url, *args, **kwargs)
+        self._write_batch_size = self.WRITE_BATCH_SIZE if write_batch_size is None else write_batch_size
+        self._max_concurrent_writes = self.MAX_CONCURRENT_WRITES if max_concurrent_writes is None \
+            else max_concurrent_writes
 
     @classmethod
     def from_environ(cls) -> 'DataAPIClient':
@@ -32,31 +50,98 @@ class DataAPIClient(RestClient):
             base_url=os.environ['DATA_API_BASE_URL']
         )
 
-    @osdu_retry()
     def create_resources(self, resource_inits: List[ResourceInit], region_id: SRN) -> List[Resource]:
+        return self._write_in_chunks(
+            resource_inits, lambda chunk: self._create_resources_chunk(resource_inits=chunk, region_id=region_id)
+        )
+
+    def update_resources(self, resource_updates: List[ResourceUpdate], region_id: SRN) -> List[Resource]:
+        return self._write_in_chunks(
+            resource_updates, lambda chunk: self._update_resources_chunk(resource_updates=chunk, region_id=region_id)
+        )
+
+    @osdu_retry()
+    def _create_resources_chunk(self, resource_inits: List[ResourceInit], region_id: SRN) -> List[Resource]:
+        body = self._create_resources_body(resource_inits, region_id)
+        try:
+            response = self.post(body, path='v1/createresources')
+        except HttpClientException as e:
+            self._handle_create_resources_client_error(e, resource_inits)
+            raise
+
+        return self._get_resources_from_api_response(response, self.trusted_decode)
+
+    @osdu_retry()
+    def _update_resources_chunk(self, resource_updates: List[ResourceUpdate], region_id: SRN) -> List[Resource]:
+        body = self._update_resources_body(resource_updates, region_id)
+        response = self.post(body, path='v1/updateresources')
+
+        old_resources = self._get_resources_from_api_response(response, self.trusted_decode)
+        return old_resources
+
+    @single_flight(lambda resource_ids: tuple(str(rid) for rid in resource_ids))
+    @osdu_retry()
+    def get_resources(self, resource_ids: List[SRN]) -> GetResourcesResult:
+        body = self._get_resources_body(resource_ids)
+        response = self.post(body, path='v1/getresources')
+
+        return self._get_resources_result(response, self.trusted_decode)
+
+    @single_flight(lambda resource_ids: ('batch',) + tuple(str(rid) for rid in resource_ids))
+    @osdu_retry()
+    def get_resources_as_batch(self, resource_ids: List[SRN]) -> GetResourceBatchResult:
+        body = self._get_resources_body(resource_ids)
+        response = self.post(body, path='v1/getresources')
+
+        response_json = response.json()
+        return GetResourceBatchResult(
+            resources=ResourceBatch.from_data_api_response(response_json),
+            unprocessed_srns=[SRN.from_string(srn) for srn in response_json.get('UnprocessedSRNs', [])]
+        )
+
+    def _write_in_chunks(self, items: list, write: Callable[[list], List[Resource]]) -> List[Resource]:
+        if len(items) <= self._write_batch_size:
+            return write(items)
+
+        starts = range(0, len(items), self._write_batch_size)
+        max_workers = min(len(starts), self._max_concurrent_writes)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(write, items[start:start + self._write_batch_size]) for start in starts]
+
+        resources, failed_chunks = {}, []
+        for start, future in zip(starts, futures):
+            try:
+                resources.update(enumerate(future.result(), start))
+            except Exception as e:
+                failed_chunks.append((list(range(start, min(start + self._write_batch_size, len(items)))), e))
+
+        if failed_chunks:
+            if all(isinstance(e, ResourceExists) for _, e in failed_chunks):
+                raise BatchResourceExists(failed_chunks, resources)
+            raise BatchWriteError(failed_chunks, resources)
+        return [resources[i] for i in sorted(resources)]
+
+    @staticmethod
+    def _create_resources_body(resource_inits: List[ResourceInit], region_id: SRN) -> dict:
         types = [str(r.type) for r in resource_inits]
 
         logger.info(f'Creating resources of types: {types}')
-        body = {
+        return {
             'ResourceType': types,
             'NewVersion': [r.new_version for r in resource_inits],
             'RegionID': str(region_id),
             'Keys': [r.key for r in resource_inits],
             'ResourceIDs': [str(r.id) if r.id is not None else None for r in resource_inits],
         }
-        try:
-            response = self.post(body, path='v1/createresources')
-        except HttpClientException as e:
-            if e.http_status == 409:
-                logger.exception(f'Resource exists (at least one existing key from {[r.key for r in resource_inits]})')
-                raise ResourceExists() from e
-            else:
-                raise
 
-        return self._get_resources_from_api_response(response)
+    @staticmethod
+    def _handle_create_resources_client_error(e: HttpClientException, resource_inits: List[ResourceInit]):
+        if e.http_status == 409:
+            logger.exception(f'Resource exists (at least one existing key from {[r.key for r in resource_inits]})')
+            raise ResourceExists() from e
 
-    @osdu_retry()
-    def update_resources(self, resource_updates: List[ResourceUpdate], region_id: SRN) -> List[Resource]:
+    @staticmethod
+    def _update_resources_body(resource_updates: List[ResourceUpdate], region_id: SRN) -> dict:
         resource_ids = [str(r.id) for r in resource_updates]
         logger.info(f'Updating resources: {resource_ids}')
 
@@ -77,58 +162,83 @@ class DataAPIClient(RestClient):
             'RegionID': str(region_id)
         }
         logger.debug(f'Updating {resource_ids} with {body}')
-        response = self.post(body, path='v1/updateresources')
-
-        old_resources = self._get_resources_from_api_response(response)
-        return old_resources
+        return body
 
-    @osdu_retry()
-    def get_resources(self, resource_ids: List[SRN]) -> GetResourcesResult:
+    @staticmethod
+    def _get_resources_body(resource_ids: List[SRN]) -> dict:
         resource_ids = [str(rid) for rid in resource_ids]
         logger.info(f'Getting resources: {resource_ids}')
 
-        body = {
+        return {
             'ResourceIDs': resource_ids
         }
-        response = self.post(body, path='v1/getresources')
 
-        resources = self._get_resources_from_api_response(response)
+    @classmethod
+    def _get_resources_result(cls, response: Response, trusted: bool = False) -> GetResourcesResult:
+        response_json = response.json()
 
-        return GetResourcesResult(
-            resources=resources,
-            unprocessed_srns=[SRN.from_string(srn) for srn in response.json().get('UnprocessedSRNs', [])]
+        return constructor(GetResourcesResult, trusted)(
+            resources=cls._decode_resources(response_json, trusted),
+            unprocessed_srns=[SRN.from_string(srn) for srn in response_json.get('UnprocessedSRNs', [])]
         )
 
     @staticmethod
-    def _parse_data_api_location(data_api_s3_location: str) -> S3Location:
+    def _parse_data_api_location(data_api_s3_location: str, trusted: bool = False) -> S3Location:
         data_api_location_split = data_api_s3_location[5:].split('/', 1)
-        return S3Location(
+        return constructor(S3Location, trusted)(
             bucket=data_api_location_split[0],
             key=data_api_location_split[1]
         )
 
-    def _get_resources_from_api_response(self, response: Response) -> List[Resource]:
-        resources = []
-        for i, resource_id in enumerate(response.json()['ResourceIDs']):
-            resource_body = response.json()['ResourceData'][i]
-            s3_locations = response.json().get('S3Location', [None] * len(response.json()['ResourceIDs']))
-
-            resources.append(
-                Resource(
-                    id=resource_id,
-                    type_id=resource_body['ResourceTypeID'],
-                    home_region_id=resource_body['ResourceHomeRegionID'],
-                    hosting_region_ids=resource_body['ResourceHostRegionIDs'],
-                    object_creation_date_time=resource_body['ResourceObjectCreationDatetime'],
-                    version_creation_date_time=resource_body['ResourceVersionCreationDatetime'],
-                    curation_status=resource_body['ResourceCurationStatus'],
-                    lifecycle_status=resource_body['ResourceLifecycleStatus'],
-                    data=resource_body['Data'],
-                    s3_location=self._parse_data_api_location(s3_locations[i]) if s3_locations[i] is not None else None
-                )
+    @classmethod
+    def _get_resources_from_api_response(cls, response: Response, trusted: bool = False) -> List[Resource]:
+        return cls._decode_resources(response.json(), trusted)
+
+    @classmethod
+    def _decode_resources(cls, response_json: dict, trusted: bool = False) -> List[Resource]:
+        resource_ids = response_json['ResourceIDs']
+        resource_bodies = response_json['ResourceData']
+        s3_locations = response_json.get('S3Location') or [None] * len(resource_ids)
+        if not len(resource_ids) == len(resource_bodies) == len(s3_locations):
+            raise ValueError(
+                f'Data API response has {len(resource_ids)} ResourceIDs, {len(resource_bodies)} ResourceData and '
+                f'{len(s3_locations)} S3Location items'
             )
-        return resources
+        resource_constructor = constructor(Resource, trusted)
+
+        return [
+            resource_constructor(
+                id=resource_id,
+                type_id=resource_body['ResourceTypeID'],
+                home_region_id=resource_body['ResourceHomeRegionID'],
+                hosting_region_ids=resource_body['ResourceHostRegionIDs'],
+                object_creation_date_time=resource_body['ResourceObjectCreationDatetime'],
+                version_creation_date_time=resource_body['ResourceVersionCreationDatetime'],
+                curation_status=resource_body['ResourceCurationStatus'],
+                lifecycle_status=resource_body['ResourceLifecycleStatus'],
+                data=resource_body['Data'],
+                s3_location=cls._parse_data_api_location(s3_location, trusted) if s3_location is not None else None
+            )
+            for resource_id, resource_body, s3_location in zip(resource_ids, resource_bodies, s3_locations)
+        ]
 
 
 class ResourceExists(Exception):
     pass
+
+
+class BatchWriteError(Exception):
+    """ Raised when some chunks of a chunked write failed, resources of successful chunks are kept by input index. """
+
+    def __init__(self, failed_chunks: List[Tuple[List[int], Exception]], resources: Dict[int, Resource]):
+        self.failed_chunks = failed_chunks
+        self.resources = resources
+        super().__init__(f'{len(failed_chunks)} write chunks failed, failed items: {self.failed_indices}')
+
+    @property
+    def failed_indices(self) -> List[int]:
+        return [index for indices, _ in self.failed_chunks for index in indices]
+
+
+class BatchResourceExists(BatchWriteError, ResourceExists):
+    """ BatchWriteError of chunks that all failed with ResourceExists, so that it is handled like a single write. """
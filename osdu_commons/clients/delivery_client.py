@@ -11,7 +11,9 @@ from osdu_commons.clients.rest_client import HttpException, HttpNotFoundExceptio
 from osdu_commons.clients.retry import osdu_retry
 from osdu_commons.model.aws import S3Location
 from osdu_commons.utils import convert
+from osdu_commons.utils.single_flight import single_flight
 from osdu_commons.utils.srn import SRN
+from osdu_commons.utils.trusted import constructor
 from osdu_commons.utils.validators import list_of
 
 MAX_RESOURCES_FETCHING_ATTEMPTS = 5
@@ -19,7 +21,7 @@ MAX_RESOURCES_FETCHING_ATTEMPTS = 5
 logger = logging.getLogger(__name__)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class GetResourcesResultItem:
     srn: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
     data: Optional[dict] = attr.ib(validator=optional(instance_of(dict)), default=None)
@@ -29,18 +31,18 @@ class GetResourcesResultItem:
         default=None)
 
     @staticmethod
-    def convert(item):
+    def convert(item, trusted: bool = False):
         if isinstance(item, GetResourcesResultItem):
             return item
 
-        return GetResourcesResultItem(
+        return constructor(GetResourcesResultItem, trusted)(
             srn=item['SRN'],
             data=item.get('Data'),
             s3_location=item.get('S3Location')
         )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class GetResourcesResponseSuccess:
     result: List[GetResourcesResultItem] = attr.ib(
         validator=list_of(instance_of(GetResourcesResultItem)),
@@ -49,7 +51,7 @@ class GetResourcesResponseSuccess:
     temporary_credentials: dict = attr.ib(validator=instance_of(dict))
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class GetResourcesResponseNotFound:
     not_found_resource_ids: List[SRN] = attr.ib(
         validator=list_of(instance_of(SRN)),
@@ -68,37 +70,44 @@ class DeliveryClient(CognitoAwareRestClient):
         logger.debug(f'Getting resources with srns: {srns_to_fetch}')
         return self.post(
             path='GetResources',
-            json={
-                'SRNS': srns_to_fetch,
-                'TargetRegionID': target_region_id
-            },
+            json=self._get_resources_body(srns_to_fetch, target_region_id),
         )
 
+    @single_flight(lambda srns_to_fetch, target_region_id='srn:dummy:dummy:': (
+        tuple(str(srn) for srn in srns_to_fetch), target_region_id))
     def get_resources(self, srns_to_fetch: List[SRN], target_region_id: str = 'srn:dummy:dummy:') \
             -> Union[GetResourcesResponseSuccess, GetResourcesResponseNotFound]:
         srns_to_fetch = [str(srn) for srn in srns_to_fetch]
         try:
             response = self._get_resources(srns_to_fetch, target_region_id)
-            return self._handle_get_resources_200(response)
+            return self._handle_get_resources_200(response, self.trusted_decode)
         except HttpNotFoundException as e:
             return self._handle_get_resources_404(e.response)
         except HttpException as e:
             raise GetResourcesException(e.response.text)
 
     @staticmethod
-    def _handle_get_resources_200(response: requests.Response) -> GetResourcesResponseSuccess:
+    def _get_resources_body(srns_to_fetch: List[str], target_region_id: str) -> dict:
+        return {
+            'SRNS': srns_to_fetch,
+            'TargetRegionID': target_region_id
+        }
+
+    @staticmethod
+    def _handle_get_resources_200(response: requests.Response, trusted: bool = False) -> GetResourcesResponseSuccess:
         response_json = response.json()
         temporary_credentials = response_json.get('TemporaryCredentials', {})
 
-        return GetResourcesResponseSuccess(
-            result=response_json['Result'],
+        return constructor(GetResourcesResponseSuccess, trusted)(
+            result=[GetResourcesResultItem.convert(item, trusted) for item in response_json['Result']],
             unprocessed_srn=response_json.get('UnprocessedSRNs', []),
             temporary_credentials=temporary_credentials
         )
 
-    def _handle_get_resources_404(self, response: requests.Response) -> GetResourcesResponseNotFound:
+    @classmethod
+    def _handle_get_resources_404(cls, response: requests.Response) -> GetResourcesResponseNotFound:
         response_json = response.json()
-        not_found_srns = self._parse_not_found_resources_error_msg(response_json['Error'])
+        not_found_srns = cls._parse_not_found_resources_error_msg(response_json['Error'])
 
         logger.info(f'Getting resources failed for {not_found_srns}')
         return GetResourcesResponseNotFound(
@@ -1,20 +1,45 @@
 import logging
+import threading
+from typing import Optional
 from urllib.parse import urljoin
 
+import attr
 import requests
+from attr.validators import instance_of
+from requests.adapters import HTTPAdapter
+
+from osdu_commons.utils.single_flight import SingleFlight, SingleFlightStats
+from osdu_commons.utils.trusted import resolve_trusted_decode
 
 logger = logging.getLogger(__name__)
 
 
+@attr.s(frozen=True, slots=True)
+class ConnectionPoolConfig:
+    pool_size: int = attr.ib(validator=instance_of(int), default=10)
+    max_connections_per_host: int = attr.ib(validator=instance_of(int), default=10)
+    block_when_exhausted: bool = attr.ib(validator=instance_of(bool), default=False)
+    keep_alive: bool = attr.ib(validator=instance_of(bool), default=True)
+
+
 class RestClient:
     TIMEOUT = 10
 
-    def __init__(self, base_url, timeout_seconds=None):
+    def __init__(self, base_url, timeout_seconds=None, pool_config: ConnectionPoolConfig = None,
+                 coalesce_requests: bool = False, trusted_decode: Optional[bool] = None):
         self._base_url = base_url if base_url.endswith('/') else f'{base_url}/'
         self._timeout_seconds = self.TIMEOUT if timeout_seconds is None else timeout_seconds
+        self._pool_config = pool_config if pool_config is not None else ConnectionPoolConfig()
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._trusted_decode = trusted_decode
+
+        # Connection pool is shared by all threads, sessions are per thread as requests.Session is not thread-safe
+        self._adapter = None
+        self._adapter_lock = threading.Lock()
+        self._local = threading.local()
 
     def post(self, json, path=None, params=None, headers=None):
-        response = requests.post(
+        response = self._get_session().post(
             url=self._make_url(path=path),
             json=json,
             params=params,
@@ -25,6 +50,56 @@ class RestClient:
         self._check_response(response)
         return response
 
+    @property
+    def trusted_decode(self) -> bool:
+        """ Whether responses are decoded without validators, None passed to __init__ follows set_trusted_decode. """
+        return resolve_trusted_decode(self._trusted_decode)
+
+    @property
+    def single_flight_stats(self) -> SingleFlightStats:
+        if self._single_flight is None:
+            return SingleFlightStats(hits=0, misses=0)
+        return self._single_flight.stats
+
+    def close(self):
+        with self._adapter_lock:
+            if self._adapter is not None:
+                self._adapter.close()
+            self._adapter = None
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _get_session(self) -> requests.Session:
+        adapter = self._get_adapter()
+        session = getattr(self._local, 'session', None)
+        if session is None or session.adapters.get('https://') is not adapter:
+            session = self._create_session(adapter)
+            self._local.session = session
+        return session
+
+    def _get_adapter(self) -> HTTPAdapter:
+        with self._adapter_lock:
+            if self._adapter is None:
+                self._adapter = HTTPAdapter(
+                    pool_connections=self._pool_config.pool_size,
+                    pool_maxsize=self._pool_config.max_connections_per_host,
+                    pool_block=self._pool_config.block_when_exhausted,
+                )
+            return self._adapter
+
+    def _create_session(self, adapter: HTTPAdapter) -> requests.Session:
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not self._pool_config.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
     @staticmethod
     def _check_response(response):
         status_code = response.status_code
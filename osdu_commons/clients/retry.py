@@ -12,6 +12,7 @@ logger = logging.getLogger(__name__)
 
 __all__ = [
     'osdu_retry',
+    'should_be_retried',
 ]
 
 MAX_RETRIES = 5
@@ -20,27 +21,31 @@ WAIT_RANDOM_MIN = 0
 WAIT_RANDOM_MAX = 1000
 
 
+TIMEOUT_EXCEPTIONS = (requests.exceptions.Timeout, urllib3.exceptions.ReadTimeoutError)
+
+
+def should_be_retried(e, timeout_exceptions=TIMEOUT_EXCEPTIONS):
+    is_timeout = isinstance(e, timeout_exceptions)
+    is_http_exception = isinstance(e, (requests.exceptions.HTTPError, HttpException))
+    is_server_error = is_http_exception and e.response.status_code // 100 == 5
+    retry = is_timeout or is_server_error
+    if retry:
+        logger.info(f'Retrying request due to the {e.__class__.__name__}')
+    else:
+        logger.warning(f'Not retrying request because exception is of type {e.__class__.__name__}')
+    return retry
+
+
 def osdu_retry(
         max_retries=MAX_RETRIES,
         wait_fixed=WAIT_FIXED,
         wait_random_min=WAIT_RANDOM_MIN,
         wait_random_max=WAIT_RANDOM_MAX,
 ):
-    def retry_on_exception(e):
-        is_timeout = isinstance(e, (requests.exceptions.Timeout, urllib3.exceptions.ReadTimeoutError))
-        is_http_exception = isinstance(e, (requests.exceptions.HTTPError, HttpException))
-        is_server_error = is_http_exception and e.response.status_code // 100 == 5
-        should_be_retried = is_timeout or is_server_error
-        if should_be_retried:
-            logger.info(f'Retrying request due to the {e.__class__.__name__}')
-        else:
-            logger.warning(f'Not retrying request because exception is of type {e.__class__.__name__}')
-        return should_be_retried
-
     def decorator(f):
         @wraps(f)
         @retry(
-            retry_on_exception=retry_on_exception,
+            retry_on_exception=should_be_retried,
             stop_max_attempt_number=max_retries,
             wait_fixed=wait_fixed,
             wait_random_min=wait_random_min,
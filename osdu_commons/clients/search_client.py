@@ -7,6 +7,7 @@ from attr.validators import instance_of, optional
 from osdu_commons.clients.cognito_aware_rest_client import CognitoAwareRestClient
 from osdu_commons.clients.retry import osdu_retry
 from osdu_commons.utils import convert
+from osdu_commons.utils.trusted import constructor
 from osdu_commons.utils.validators import list_of
 
 logger = logging.getLogger(__name__)
@@ -14,16 +15,16 @@ logger = logging.getLogger(__name__)
 MAX_REQUEST_COUNT = 100
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class SearchResultFile:
     filename: str = attr.ib(validator=instance_of(str))
     srn: str = attr.ib(validator=instance_of(str))
 
     @classmethod
-    def converter(cls, item):
+    def converter(cls, item, trusted: bool = False):
         if isinstance(item, SearchResultFile):
             return item
-        return cls(item['filename'], item['srn'])
+        return constructor(cls, trusted)(filename=item['filename'], srn=item['srn'])
 
     def asdict(self):
         return {
@@ -32,7 +33,7 @@ class SearchResultFile:
         }
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class SearchResult:
     files: List[SearchResultFile] = attr.ib(
         validator=list_of(instance_of(SearchResultFile)),
@@ -42,13 +43,13 @@ class SearchResult:
     data: Dict = attr.ib(validator=instance_of(Dict))
 
     @classmethod
-    def converter(cls, item):
+    def converter(cls, item, trusted: bool = False):
         if isinstance(item, SearchResult):
             return item
         data = item.copy()
-        files = data.pop('files', [])
+        files = [SearchResultFile.converter(file, trusted) for file in data.pop('files', [])]
         srn = data.pop('srn')
-        return cls(files=files, srn=srn, data=data)
+        return constructor(cls, trusted)(files=files, srn=srn, data=data)
 
     def asdict(self):
         result = self.data.copy()
@@ -57,17 +58,24 @@ class SearchResult:
         return result
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class SearchResponse:
     results: List[SearchResult] = attr.ib(
         validator=list_of(instance_of(SearchResult)),
         converter=convert.list_(SearchResult.converter)
     )
     total_hits: int = attr.ib(validator=instance_of(int), converter=int)
-    facets: dict = attr.ib(validator=instance_of(dict), converter=convert.copy)
+    facets: dict = attr.ib(validator=instance_of(dict), converter=convert.freeze)
     start: int = attr.ib(validator=instance_of(int), converter=int)
     count: int = attr.ib(validator=instance_of(int), converter=int)
 
+    @classmethod
+    def from_json(cls, response_json: dict, trusted: bool = False) -> 'SearchResponse':
+        fields = dict(response_json)
+        if 'results' in fields:
+            fields['results'] = [SearchResult.converter(result, trusted) for result in fields['results']]
+        return constructor(cls, trusted)(**fields)
+
     @property
     def has_results_left(self):
         return self.end < self.total_hits
@@ -81,10 +89,10 @@ class SearchResponse:
             f'total {self.total_hits}>'
 
 
-@attr.s()
+@attr.s(slots=True)
 class SearchRequest:
-    metadata: Optional[Dict] = attr.ib(validator=optional(instance_of(Dict)), converter=convert.copy, default=None)
-    geo_location: Optional[Dict] = attr.ib(validator=optional(instance_of(Dict)), converter=convert.copy, default=None)
+    metadata: Optional[Dict] = attr.ib(validator=optional(instance_of(Dict)), converter=convert.freeze, default=None)
+    geo_location: Optional[Dict] = attr.ib(validator=optional(instance_of(Dict)), converter=convert.freeze, default=None)
     geo_centroid: Optional[List[List[float]]] = attr.ib(
         validator=optional(list_of(list_of(instance_of(float)))),
         converter=attr.converters.optional(convert.list_(convert.list_())),
@@ -128,7 +136,7 @@ class SearchClient(CognitoAwareRestClient):
             headers=self._cognito_headers,
         )
 
-        return SearchResponse(**response.json())
+        return SearchResponse.from_json(response.json(), self.trusted_decode)
 
     def iter_index_search(self, search_request: SearchRequest) -> Iterable[SearchResult]:
         search_response = SearchResponse(results=[], total_hits=1, facets={}, start=0, count=0)
@@ -8,7 +8,9 @@ from attr.validators import instance_of, optional
 from osdu_commons.clients.cognito_aware_rest_client import CognitoAwareRestClient
 from osdu_commons.clients.retry import osdu_retry
 from osdu_commons.utils import convert
+from osdu_commons.utils.single_flight import single_flight
 from osdu_commons.utils.srn import SRN
+from osdu_commons.utils.trusted import constructor
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +33,7 @@ class WorkflowStatus(enum.Enum):
         return self not in [self.RUNNING, self.CREATED]
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class WorkflowJobDescription:
     workflow_job_id: str = attr.ib()
     state: WorkflowStatus = attr.ib(validator=optional(instance_of(WorkflowStatus)))
@@ -40,8 +42,8 @@ class WorkflowJobDescription:
         validator=optional(instance_of(SRN)), converter=attr.converters.optional(convert.srn), default=None)
 
     @classmethod
-    def from_json(cls, response_json):
-        return cls(
+    def from_json(cls, response_json, trusted: bool = False):
+        return constructor(cls, trusted)(
             workflow_job_id=response_json['WorkflowJobID'],
             state=WorkflowStatus(response_json['State']),
             work_product_id=response_json.get('WorkProductID'),
@@ -49,27 +51,27 @@ class WorkflowJobDescription:
         )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class Workflows:
     batch: List[WorkflowJobDescription] = attr.ib()
     next_token: Optional[str] = attr.ib()
 
     @classmethod
-    def from_json(cls, response_json):
-        return cls(
-            batch=[WorkflowJobDescription.from_json(job) for job in response_json['Batch']],
+    def from_json(cls, response_json, trusted: bool = False):
+        return constructor(cls, trusted)(
+            batch=[WorkflowJobDescription.from_json(job, trusted) for job in response_json['Batch']],
             next_token=response_json['NextToken']
         )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class StartWorkflowResponse:
     workflow_job_id: str = attr.ib()
     presigned_urls: Optional[dict] = attr.ib(default=None)
 
     @classmethod
-    def from_json(cls, response_json):
-        return cls(
+    def from_json(cls, response_json, trusted: bool = False):
+        return constructor(cls, trusted)(
             workflow_job_id=response_json['WorkflowJobID'],
             presigned_urls=response_json.get('PresignedUrls')
         )
@@ -87,49 +89,59 @@ class WorkflowClient(CognitoAwareRestClient):
         logger.info(f'Starting SMDS workflow for {resource_type_id}')
         response = self.post(
             path=self.START_SMDS_WORKFLOW_ENDPOINT,
-            json={
-                'Manifest': manifest_json,
-                'ResourceTypeID': resource_type_id
-            }
+            json=self._start_workflow_body(manifest_json, resource_type_id)
         )
         response.raise_for_status()
 
-        return StartWorkflowResponse.from_json(response.json())
+        return StartWorkflowResponse.from_json(response.json(), self.trusted_decode)
 
     def start_swps_workflow(self, manifest_json: dict) -> StartWorkflowResponse:
         resource_type_id = manifest_json['WorkProduct']['ResourceTypeID']
         logger.info(f'Starting SWPS workflow for {resource_type_id}')
         response = self.post(
             path=self.START_SWPS_WORKFLOW_ENDPOINT,
-            json={
-                'Manifest': manifest_json,
-                'ResourceTypeID': resource_type_id
-            }
+            json=self._start_workflow_body(manifest_json, resource_type_id)
         )
         response.raise_for_status()
 
-        return StartWorkflowResponse.from_json(response.json())
+        return StartWorkflowResponse.from_json(response.json(), self.trusted_decode)
 
+    @single_flight(lambda workflow_id: workflow_id)
     @osdu_retry()
     def describe_workflow(self, workflow_id: str) -> WorkflowJobDescription:
         logger.debug(f'Calling describe workflow with id: {workflow_id}')
         response = self.post(
             path=self.DESCRIBE_ENDPOINT,
-            json={
-                'WorkflowJobID': workflow_id
-            }
+            json=self._describe_workflow_body(workflow_id)
         )
-        return WorkflowJobDescription.from_json(response.json())
+        return WorkflowJobDescription.from_json(response.json(), self.trusted_decode)
 
     @osdu_retry()
     def list_workflows(self, filters: dict = None, next_token: str = None, max_page_size: int = None) -> Workflows:
         logger.info(f'Calling list workflows with {filters or "no"} filters')
         response = self.post(
             path=self.LIST_ENDPOINT,
-            json={
-                'Filters': filters or {},  # filter cannot be None
-                'NextToken': next_token,
-                'MaxPageSize': max_page_size
-            }
+            json=self._list_workflows_body(filters, next_token, max_page_size)
         )
-        return Workflows.from_json(response.json())
+        return Workflows.from_json(response.json(), self.trusted_decode)
+
+    @staticmethod
+    def _start_workflow_body(manifest_json: dict, resource_type_id: str) -> dict:
+        return {
+            'Manifest': manifest_json,
+            'ResourceTypeID': resource_type_id
+        }
+
+    @staticmethod
+    def _describe_workflow_body(workflow_id: str) -> dict:
+        return {
+            'WorkflowJobID': workflow_id
+        }
+
+    @staticmethod
+    def _list_workflows_body(filters: Optional[dict], next_token: Optional[str], max_page_size: Optional[int]) -> dict:
+        return {
+            'Filters': filters or {},  # filter cannot be None
+            'NextToken': next_token,
+            'MaxPageSize': max_page_size
+        }
@@ -11,7 +11,7 @@ class S3ParseURLError(Exception):
     pass
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class S3Location:
     bucket: str = attr.ib(validator=instance_of(str))
     key: str = attr.ib(validator=instance_of(str))
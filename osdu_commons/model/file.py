@@ -4,10 +4,13 @@ import attr
 from attr.validators import optional, instance_of
 
 from osdu_commons.utils import convert
+from osdu_commons.utils.camel_codec import camel_codec, encode_camel
 from osdu_commons.utils.srn import SRN
 
 
-@attr.s()
+@camel_codec(key_order=['description', 'schema', 'require_key', 'original_file_path', 'staging_file_path',
+                        'temp_workflow_location', 'file_source', 'file_size', 'checksum'], omit_none=True)
+@attr.s(slots=True)
 class FileGroupTypeProperties:
     original_file_path: Optional[str] = attr.ib(validator=optional(instance_of(str)), default=None)
     staging_file_path: Optional[str] = attr.ib(validator=optional(instance_of(str)), default=None)
@@ -20,39 +23,25 @@ class FileGroupTypeProperties:
     checksum: Optional[str] = attr.ib(validator=optional(instance_of(str)), default=None)
 
     def asdict(self):
-        result = {
-            'Description': self.description,
-            'Schema': self.schema,
-            'RequireKey': self.require_key,
-            'OriginalFilePath': self.original_file_path,
-            'StagingFilePath': self.staging_file_path,
-            'TempWorkflowLocation': self.temp_workflow_location,
-            'FileSource': self.file_source,
-            'FileSize': self.file_size,
-            'Checksum': self.checksum
-        }
-        result_without_nones = {k: v for k, v in result.items() if v is not None}
-        return result_without_nones
+        return encode_camel(self)
 
 
-@attr.s(frozen=True)
+@camel_codec()
+@attr.s(frozen=True, slots=True)
 class FileData:
     group_type_properties: FileGroupTypeProperties = attr.ib(
         validator=instance_of(FileGroupTypeProperties),
         converter=convert.class_from_camel_dict(FileGroupTypeProperties)
     )
-    individual_type_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.copy)
-    extension_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.copy)
+    individual_type_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.freeze)
+    extension_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.freeze)
 
     def asdict(self):
-        return {
-            'GroupTypeProperties': self.group_type_properties.asdict(),
-            'IndividualTypeProperties': self.individual_type_properties,
-            'ExtensionProperties': self.extension_properties,
-        }
+        return encode_camel(self)
 
 
-@attr.s(frozen=True)
+@camel_codec()
+@attr.s(frozen=True, slots=True)
 class ManifestFile:
     associative_id: str = attr.ib(validator=instance_of(str))
     resource_type_id: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
@@ -64,9 +53,4 @@ class ManifestFile:
                                                     converter=convert.resource_security_classification)
 
     def asdict(self):
-        return {
-            'AssociativeID': self.associative_id,
-            'ResourceTypeID': str(self.resource_type_id),
-            'Data': self.data.asdict(),
-            'ResourceSecurityClassification': str(self.resource_security_classification),
-        }
+        return encode_camel(self)
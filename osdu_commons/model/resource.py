@@ -1,5 +1,6 @@
 import json
-from typing import Optional, List, TypeVar, Type
+import re
+from typing import Optional, List, TypeVar, Type, Union
 
 import arrow as arrow
 import attr
@@ -10,19 +11,51 @@ from osdu_commons.model.aws import S3Location
 from osdu_commons.model.enums import ResourceLifecycleStatus, ResourceCurationStatus
 from osdu_commons.utils import convert
 from osdu_commons.utils.srn import SRN
+from osdu_commons.utils.timestamps import parse_timestamp
 from osdu_commons.utils.validators import list_of
 
 T = TypeVar('T', bound='Resource')
 
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
 
-@attr.s(frozen=True)
+
+def decode_group_type_properties(raw_data: Union[str, bytes]) -> dict:
+    """ Decodes GroupTypeProperties of raw JSON Data without decoding the top-level values which follow it. """
+    if isinstance(raw_data, bytes):
+        if b'"GroupTypeProperties"' not in raw_data:
+            return {}
+        raw_data = raw_data.decode('utf-8')
+    elif '"GroupTypeProperties"' not in raw_data:
+        return {}
+
+    skip_whitespace = _JSON_WHITESPACE.match
+    index = skip_whitespace(raw_data).end()
+    if raw_data[index:index + 1] != '{':
+        raise ValueError(f'Expected JSON object at {index}')
+    index = skip_whitespace(raw_data, index + 1).end()
+    while raw_data[index:index + 1] == '"':
+        key, index = _JSON_DECODER.raw_decode(raw_data, index)
+        index = skip_whitespace(raw_data, index).end()
+        if raw_data[index:index + 1] != ':':
+            raise ValueError(f'Expected : at {index}')
+        value, index = _JSON_DECODER.raw_decode(raw_data, skip_whitespace(raw_data, index + 1).end())
+        if key == 'GroupTypeProperties':
+            return value
+        index = skip_whitespace(raw_data, index).end()
+        if raw_data[index:index + 1] == ',':
+            index = skip_whitespace(raw_data, index + 1).end()
+    return {}
+
+
+@attr.s(frozen=True, slots=True)
 class Resource:
     id: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
     type_id: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
     home_region_id: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
     hosting_region_ids: List[SRN] = attr.ib(validator=list_of(instance_of(SRN)), converter=convert.list_(convert.srn))
-    object_creation_date_time: arrow.Arrow = attr.ib(validator=instance_of(arrow.Arrow), converter=arrow.get)
-    version_creation_date_time: arrow.Arrow = attr.ib(validator=instance_of(arrow.Arrow), converter=arrow.get)
+    object_creation_date_time: arrow.Arrow = attr.ib(validator=instance_of(arrow.Arrow), converter=parse_timestamp)
+    version_creation_date_time: arrow.Arrow = attr.ib(validator=instance_of(arrow.Arrow), converter=parse_timestamp)
     curation_status: ResourceCurationStatus = attr.ib(
         validator=instance_of(ResourceCurationStatus),
         converter=convert.resource_curation_status,
@@ -50,8 +83,8 @@ class Resource:
             type_id=SRN.from_string(dict_['ResourceTypeID']),
             home_region_id=SRN.from_string(dict_['ResourceHomeRegionID']),
             hosting_region_ids=[SRN.from_string(region) for region in dict_['ResourceHostingRegionIDs']],
-            object_creation_date_time=arrow.get(dict_['ResourceObjectCreationDateTime']),
-            version_creation_date_time=arrow.get(dict_['ResourceVersionCreationDateTime']),
+            object_creation_date_time=parse_timestamp(dict_['ResourceObjectCreationDateTime']),
+            version_creation_date_time=parse_timestamp(dict_['ResourceVersionCreationDateTime']),
             curation_status=SRN.from_string(dict_['ResourceCurationStatus']),
             lifecycle_status=SRN.from_string(dict_['ResourceLifecycleStatus']),
             security_classification=SRN.from_string(dict_['ResourceSecurityClassification']),
@@ -69,14 +102,108 @@ class Resource:
             'ResourceCurationStatus': str(self.curation_status.value),
             'ResourceLifecycleStatus': str(self.lifecycle_status.value),
             'ResourceSecurityClassification': str(self.security_classification),
-            'Data': self.data,
+            'Data': self._encoded_data() if data_to_string else self.data,
         }
-        if data_to_string:
-            result['Data'] = json.dumps(result['Data'])
         return result
 
+    @property
+    def group_type_properties(self) -> dict:
+        return self.data.get('GroupTypeProperties', {})
+
+    def _encoded_data(self) -> str:
+        return json.dumps(self.data)
+
+
+# Slot of Resource.data, LazyResource shadows it with a property decoding raw Data on first access
+_DATA_SLOT = Resource.__dict__['data']
+_RESOURCE_FIELDS = attr.fields(Resource)
+
+
+class LazyResource(Resource):
+    """ Resource keeping Data as raw JSON, decoded on first access of data.
+
+    Decoded Data is kept in the data slot of Resource and validated like in Resource. group_type_properties decodes
+    only its part of the raw JSON (see decode_group_type_properties), and asdict(data_to_string=True) returns the raw
+    JSON as long as data was not accessed. LazyResources compare equal to Resources with the same content.
+    """
+
+    __slots__ = ('_raw_data', '_group_type_properties')
+
+    def __init__(self, raw_data: Union[str, bytes] = None, **kwargs):
+        data = kwargs.pop('data', None)
+        # Validators of Resource read data, an empty dict satisfies them until raw data is set
+        object.__setattr__(self, '_raw_data', None)
+        super().__init__(data={}, **kwargs)
+        _DATA_SLOT.__set__(self, data)
+        object.__setattr__(self, '_raw_data', raw_data if data is None else None)
+        object.__setattr__(self, '_group_type_properties', None)
+
+    @property
+    def data(self) -> dict:
+        data = _DATA_SLOT.__get__(self)
+        if data is None:
+            data = json.loads(self._raw_data)
+            _RESOURCE_FIELDS.data.validator(self, _RESOURCE_FIELDS.data, data)
+            _DATA_SLOT.__set__(self, data)
+            object.__setattr__(self, '_raw_data', None)
+        return data
+
+    @data.setter
+    def data(self, value: dict):
+        _DATA_SLOT.__set__(self, value)
+
+    def __setstate__(self, state):
+        object.__setattr__(self, '_raw_data', None)
+        object.__setattr__(self, '_group_type_properties', None)
+        super().__setstate__(state)
+
+    def __eq__(self, other):
+        if not isinstance(other, Resource):
+            return NotImplemented
+        return all(getattr(self, field.name) == getattr(other, field.name) for field in _RESOURCE_FIELDS)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = Resource.__hash__
+
+    @property
+    def group_type_properties(self) -> dict:
+        data = _DATA_SLOT.__get__(self)
+        if data is not None:
+            return data.get('GroupTypeProperties', {})
+        if self._group_type_properties is None:
+            object.__setattr__(self, '_group_type_properties', decode_group_type_properties(self._raw_data))
+        return self._group_type_properties
+
+    @classmethod
+    def from_dict(cls, dict_: dict) -> 'LazyResource':
+        data = dict_['Data']
+        if not isinstance(data, (str, bytes)):
+            return Resource.from_dict(dict_)
+
+        return cls(
+            id=SRN.from_string(dict_['ResourceID']),
+            type_id=SRN.from_string(dict_['ResourceTypeID']),
+            home_region_id=SRN.from_string(dict_['ResourceHomeRegionID']),
+            hosting_region_ids=[SRN.from_string(region) for region in dict_['ResourceHostingRegionIDs']],
+            object_creation_date_time=parse_timestamp(dict_['ResourceObjectCreationDateTime']),
+            version_creation_date_time=parse_timestamp(dict_['ResourceVersionCreationDateTime']),
+            curation_status=SRN.from_string(dict_['ResourceCurationStatus']),
+            lifecycle_status=SRN.from_string(dict_['ResourceLifecycleStatus']),
+            security_classification=SRN.from_string(dict_['ResourceSecurityClassification']),
+            raw_data=data
+        )
+
+    def _encoded_data(self) -> str:
+        raw_data = self._raw_data
+        if raw_data is None:
+            return json.dumps(_DATA_SLOT.__get__(self))
+        return raw_data.decode('utf-8') if isinstance(raw_data, bytes) else raw_data
+
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class ResourceInit:
     type: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
     new_version: bool = attr.ib(validator=instance_of(bool))
@@ -84,7 +211,7 @@ class ResourceInit:
     key: Optional[str] = attr.ib(validator=optional(instance_of(str)), default=None)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class ResourceUpdate:
     id: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
     data: Optional[dict] = attr.ib(validator=optional(instance_of(dict)), default=None)
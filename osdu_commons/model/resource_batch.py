@@ -0,0 +1,399 @@
+import json
+from array import array
+from typing import Callable, Hashable, Iterable, Iterator, List, Optional, Sequence, Union
+
+import arrow
+
+from osdu_commons.model.aws import S3Location
+from osdu_commons.model.enums import ResourceCurationStatus, ResourceLifecycleStatus
+from osdu_commons.model.resource import LazyResource, Resource, decode_group_type_properties
+from osdu_commons.utils import convert
+from osdu_commons.utils.srn import SRN
+from osdu_commons.utils.timestamps import epoch_microseconds, from_epoch_microseconds
+
+__all__ = [
+    'ResourceBatch',
+    'ResourceRow',
+]
+
+
+class _DictionaryColumn:
+    """ Column of repeating values stored as codes into a list of distinct values, None is stored as -1. """
+    __slots__ = ('values', 'codes')
+
+    def __init__(self, values: list, codes: array):
+        self.values = values
+        self.codes = codes
+
+    @classmethod
+    def encode(cls, items: Iterable[Hashable], converter: Callable = convert.identity) -> '_DictionaryColumn':
+        code_by_item, values, codes = {}, [], array('i')
+        for item in items:
+            if item is None:
+                codes.append(-1)
+                continue
+            code = code_by_item.get(item)
+            if code is None:
+                code = code_by_item[item] = len(values)
+                values.append(converter(item))
+            codes.append(code)
+        return cls(values, codes)
+
+    def __getitem__(self, index: int):
+        code = self.codes[index]
+        return self.values[code] if code >= 0 else None
+
+    def take(self, indices: Sequence[int]) -> '_DictionaryColumn':
+        codes = self.codes
+        return _DictionaryColumn(self.values, array('i', [codes[i] for i in indices]))
+
+    def indices_where(self, predicate: Callable[[object], bool]) -> List[int]:
+        matching_codes = {code for code, value in enumerate(self.values) if predicate(value)}
+        return [i for i, code in enumerate(self.codes) if code in matching_codes]
+
+
+class ResourceBatch:
+    """ Columnar collection of resources.
+
+    Repeating columns (types, regions, statuses, security classifications) are dictionary encoded and
+    converted once per distinct value. Timestamps are stored as epoch microseconds and converted to Arrow when a row's
+    timestamp is read. Data of each row is kept as received - raw JSON or a dict - and decoded when a row's data is
+    read. Columns which the source does not provide (e.g. statuses for Delivery API results) are None.
+    """
+
+    def __init__(self, ids: List[SRN], data: list, s3_locations: list, type_ids: _DictionaryColumn,
+                 home_region_ids: Optional[_DictionaryColumn] = None,
+                 hosting_region_ids: Optional[_DictionaryColumn] = None,
+                 object_creation_timestamps: Optional[array] = None,
+                 version_creation_timestamps: Optional[array] = None,
+                 curation_statuses: Optional[_DictionaryColumn] = None,
+                 lifecycle_statuses: Optional[_DictionaryColumn] = None,
+                 security_classifications: Optional[_DictionaryColumn] = None,
+                 exists: Optional[array] = None,
+                 temporary_credentials: Optional[_DictionaryColumn] = None):
+        self.ids = ids
+        self._data = data
+        self._s3_locations = s3_locations
+        self._type_ids = type_ids
+        self._home_region_ids = home_region_ids
+        self._hosting_region_ids = hosting_region_ids
+        self._object_creation_timestamps = object_creation_timestamps
+        self._version_creation_timestamps = version_creation_timestamps
+        self._curation_statuses = curation_statuses
+        self._lifecycle_statuses = lifecycle_statuses
+        self._security_classifications = security_classifications
+        self._exists = exists if exists is not None else array('b', [1]) * len(ids)
+        self._temporary_credentials = temporary_credentials
+
+    @classmethod
+    def from_data_api_response(cls, response_json: dict) -> 'ResourceBatch':
+        resource_ids = response_json['ResourceIDs']
+        resource_bodies = response_json['ResourceData']
+        s3_locations = response_json.get('S3Location') or [None] * len(resource_ids)
+        if not len(resource_ids) == len(resource_bodies) == len(s3_locations):
+            raise ValueError(
+                f'Data API response has {len(resource_ids)} ResourceIDs, {len(resource_bodies)} ResourceData and '
+                f'{len(s3_locations)} S3Location items'
+            )
+
+        return cls(
+            ids=[SRN.from_string(resource_id) for resource_id in resource_ids],
+            data=[body['Data'] for body in resource_bodies],
+            s3_locations=list(s3_locations),
+            type_ids=_DictionaryColumn.encode((body['ResourceTypeID'] for body in resource_bodies), convert.srn),
+            home_region_ids=_DictionaryColumn.encode(
+                (body['ResourceHomeRegionID'] for body in resource_bodies), convert.srn
+            ),
+            hosting_region_ids=_DictionaryColumn.encode(
+                (tuple(body['ResourceHostRegionIDs']) for body in resource_bodies),
+                lambda regions: tuple(convert.srn(region) for region in regions)
+            ),
+            object_creation_timestamps=array('q', [
+                epoch_microseconds(body['ResourceObjectCreationDatetime']) for body in resource_bodies
+            ]),
+            version_creation_timestamps=array('q', [
+                epoch_microseconds(body['ResourceVersionCreationDatetime']) for body in resource_bodies
+            ]),
+            curation_statuses=_DictionaryColumn.encode(
+                (body['ResourceCurationStatus'] for body in resource_bodies), convert.resource_curation_status
+            ),
+            lifecycle_statuses=_DictionaryColumn.encode(
+                (body['ResourceLifecycleStatus'] for body in resource_bodies), convert.resource_lifecycle_status
+            ),
+        )
+
+    @classmethod
+    def from_delivery_items(cls, items: Iterable, temporary_credentials: Optional[dict] = None,
+                            exists: bool = True) -> 'ResourceBatch':
+        """ Builds batch from Delivery API items - objects with srn, data and s3_location. """
+        items = list(items)
+        ids = [item.srn for item in items]
+        return cls(
+            ids=ids,
+            data=[item.data for item in items],
+            s3_locations=[item.s3_location for item in items],
+            type_ids=cls._type_ids_from_ids(ids),
+            exists=array('b', [exists]) * len(items),
+            temporary_credentials=cls._encode_credentials([temporary_credentials] * len(items)),
+        )
+
+    @classmethod
+    def from_resources(cls, resources: Iterable[Resource]) -> 'ResourceBatch':
+        resources = list(resources)
+        return cls(
+            ids=[r.id for r in resources],
+            data=[r.data for r in resources],
+            s3_locations=[r.s3_location for r in resources],
+            type_ids=_DictionaryColumn.encode(r.type_id for r in resources),
+            home_region_ids=_DictionaryColumn.encode(r.home_region_id for r in resources),
+            hosting_region_ids=_DictionaryColumn.encode(tuple(r.hosting_region_ids) for r in resources),
+            object_creation_timestamps=array('q', [epoch_microseconds(r.object_creation_date_time) for r in resources]),
+            version_creation_timestamps=array('q', [epoch_microseconds(r.version_creation_date_time) for r in resources]),
+            curation_statuses=_DictionaryColumn.encode(r.curation_status for r in resources),
+            lifecycle_statuses=_DictionaryColumn.encode(r.lifecycle_status for r in resources),
+            security_classifications=_DictionaryColumn.encode(r.security_classification for r in resources),
+        )
+
+    @classmethod
+    def concat(cls, batches: Iterable['ResourceBatch']) -> 'ResourceBatch':
+        batches = list(batches)
+        if len(batches) == 1:
+            return batches[0]
+        return cls.from_rows(row for batch in batches for row in batch)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable['ResourceRow']) -> 'ResourceBatch':
+        rows = list(rows)
+        has_metadata = all(row.has_metadata for row in rows)
+
+        def column(name):
+            return _DictionaryColumn.encode(getattr(row, name) for row in rows) if has_metadata else None
+
+        def timestamps(name):
+            return array('q', [getattr(row, name) for row in rows]) if has_metadata else None
+
+        return cls(
+            ids=[row.id for row in rows],
+            data=[row.raw_data for row in rows],
+            s3_locations=[row.raw_s3_location for row in rows],
+            type_ids=_DictionaryColumn.encode(row.type_id for row in rows),
+            home_region_ids=column('home_region_id'),
+            hosting_region_ids=_DictionaryColumn.encode(
+                tuple(row.hosting_region_ids) for row in rows
+            ) if has_metadata else None,
+            object_creation_timestamps=timestamps('object_creation_epoch_microseconds'),
+            version_creation_timestamps=timestamps('version_creation_epoch_microseconds'),
+            curation_statuses=column('curation_status'),
+            lifecycle_statuses=column('lifecycle_status'),
+            security_classifications=column('security_classification'),
+            exists=array('b', [row.exists for row in rows]),
+            temporary_credentials=cls._encode_credentials(row.temporary_credentials for row in rows),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> 'ResourceRow':
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('ResourceBatch index out of range')
+        return ResourceRow(self, index)
+
+    def __iter__(self) -> Iterator['ResourceRow']:
+        return (ResourceRow(self, i) for i in range(len(self)))
+
+    def take(self, indices: Sequence[int]) -> 'ResourceBatch':
+        def take_column(column):
+            return column.take(indices) if column is not None else None
+
+        def take_array(values):
+            return array(values.typecode, [values[i] for i in indices]) if values is not None else None
+
+        return ResourceBatch(
+            ids=[self.ids[i] for i in indices],
+            data=[self._data[i] for i in indices],
+            s3_locations=[self._s3_locations[i] for i in indices],
+            type_ids=take_column(self._type_ids),
+            home_region_ids=take_column(self._home_region_ids),
+            hosting_region_ids=take_column(self._hosting_region_ids),
+            object_creation_timestamps=take_array(self._object_creation_timestamps),
+            version_creation_timestamps=take_array(self._version_creation_timestamps),
+            curation_statuses=take_column(self._curation_statuses),
+            lifecycle_statuses=take_column(self._lifecycle_statuses),
+            security_classifications=take_column(self._security_classifications),
+            exists=take_array(self._exists),
+            temporary_credentials=take_column(self._temporary_credentials),
+        )
+
+    def filter_by_type(self, *type_ids: Union[SRN, str]) -> 'ResourceBatch':
+        """ Keeps rows of given type SRNs; strings match as prefixes of type detail, e.g. 'work-product-component/'. """
+        def matches(type_id: SRN) -> bool:
+            return any(
+                type_id == expected if isinstance(expected, SRN) else type_id.detail.startswith(expected)
+                for expected in type_ids
+            )
+
+        return self.take(self._type_ids.indices_where(matches))
+
+    def filter_by_lifecycle_status(self, *statuses: ResourceLifecycleStatus) -> 'ResourceBatch':
+        if self._lifecycle_statuses is None:
+            raise ValueError('ResourceBatch has no lifecycle statuses')
+        return self.take(self._lifecycle_statuses.indices_where(lambda status: status in statuses))
+
+    def filter_existing(self) -> 'ResourceBatch':
+        return self.take([i for i, exists in enumerate(self._exists) if exists])
+
+    def to_resources(self) -> List[Resource]:
+        return [row.to_resource() for row in self]
+
+    @staticmethod
+    def _encode_credentials(credentials: Iterable[Optional[dict]]) -> _DictionaryColumn:
+        # Credentials are unhashable dicts shared by all rows of a response, so they are encoded by identity
+        code_by_id, values, codes = {}, [], array('i')
+        for item in credentials:
+            if item is None:
+                codes.append(-1)
+                continue
+            code = code_by_id.get(id(item))
+            if code is None:
+                code = code_by_id[id(item)] = len(values)
+                values.append(item)
+            codes.append(code)
+        return _DictionaryColumn(values, codes)
+
+    @staticmethod
+    def _type_ids_from_ids(ids: List[SRN]) -> _DictionaryColumn:
+        return _DictionaryColumn.encode((id_.type for id_ in ids), lambda type_: SRN('type', type_))
+
+
+class ResourceRow:
+    """ View of a single row of ResourceBatch with the attributes of Resource and DeliveredResource. """
+    __slots__ = ('_batch', '_index')
+
+    def __init__(self, batch: ResourceBatch, index: int):
+        self._batch = batch
+        self._index = index
+
+    @property
+    def id(self) -> SRN:
+        return self._batch.ids[self._index]
+
+    srn = id
+
+    @property
+    def type_id(self) -> SRN:
+        return self._batch._type_ids[self._index]
+
+    @property
+    def has_metadata(self) -> bool:
+        return self._batch._lifecycle_statuses is not None
+
+    @property
+    def home_region_id(self) -> Optional[SRN]:
+        return self._metadata('_home_region_ids')
+
+    @property
+    def hosting_region_ids(self) -> Optional[List[SRN]]:
+        hosting_region_ids = self._metadata('_hosting_region_ids')
+        return list(hosting_region_ids) if hosting_region_ids is not None else None
+
+    @property
+    def object_creation_date_time(self) -> Optional[arrow.Arrow]:
+        return self._timestamp('_object_creation_timestamps')
+
+    @property
+    def version_creation_date_time(self) -> Optional[arrow.Arrow]:
+        return self._timestamp('_version_creation_timestamps')
+
+    @property
+    def object_creation_epoch_microseconds(self) -> Optional[int]:
+        return self._metadata('_object_creation_timestamps')
+
+    @property
+    def version_creation_epoch_microseconds(self) -> Optional[int]:
+        return self._metadata('_version_creation_timestamps')
+
+    @property
+    def curation_status(self) -> Optional[ResourceCurationStatus]:
+        return self._metadata('_curation_statuses')
+
+    @property
+    def lifecycle_status(self) -> Optional[ResourceLifecycleStatus]:
+        return self._metadata('_lifecycle_statuses')
+
+    @property
+    def security_classification(self) -> Optional[SRN]:
+        return self._metadata('_security_classifications')
+
+    @property
+    def raw_data(self):
+        return self._batch._data[self._index]
+
+    @property
+    def data(self) -> Optional[dict]:
+        data = self.raw_data
+        return json.loads(data) if isinstance(data, (str, bytes)) else data
+
+    @property
+    def group_type_properties(self) -> dict:
+        data = self.raw_data
+        if isinstance(data, (str, bytes)):
+            return decode_group_type_properties(data)
+        return data.get('GroupTypeProperties', {}) if data is not None else {}
+
+    @property
+    def raw_s3_location(self):
+        return self._batch._s3_locations[self._index]
+
+    @property
+    def s3_location(self) -> Optional[S3Location]:
+        s3_location = self.raw_s3_location
+        return S3Location.from_url(s3_location) if isinstance(s3_location, str) else s3_location
+
+    @property
+    def exists(self) -> bool:
+        return bool(self._batch._exists[self._index])
+
+    @property
+    def temporary_credentials(self) -> Optional[dict]:
+        return self._metadata('_temporary_credentials')
+
+    def to_resource(self) -> Resource:
+        if not self.has_metadata:
+            raise ValueError(f'Row {self.id} has no resource metadata')
+        fields = dict(
+            id=self.id,
+            type_id=self.type_id,
+            home_region_id=self.home_region_id,
+            hosting_region_ids=self.hosting_region_ids,
+            object_creation_date_time=self.object_creation_date_time,
+            version_creation_date_time=self.version_creation_date_time,
+            curation_status=self.curation_status,
+            lifecycle_status=self.lifecycle_status,
+            s3_location=self.s3_location,
+            security_classification=self.security_classification,
+        )
+        raw_data = self.raw_data
+        if isinstance(raw_data, (str, bytes)):
+            return LazyResource(raw_data=raw_data, **fields)
+        return Resource(data=raw_data, **fields)
+
+    def _metadata(self, column_name: str):
+        column = getattr(self._batch, column_name)
+        return column[self._index] if column is not None else None
+
+    def _timestamp(self, column_name: str) -> Optional[arrow.Arrow]:
+        microseconds = self._metadata(column_name)
+        return from_epoch_microseconds(microseconds) if microseconds is not None else None
+
+    def __eq__(self, other):
+        if not isinstance(other, ResourceRow):
+            return NotImplemented
+        return self._batch is other._batch and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._batch), self._index))
+
+    def __repr__(self):
+        return f'ResourceRow(id={self.id!r}, type_id={self.type_id!r})'
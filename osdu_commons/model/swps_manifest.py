@@ -7,10 +7,12 @@ from osdu_commons.model.file import ManifestFile
 from osdu_commons.model.work_product import WorkProductManifest
 from osdu_commons.model.work_product_component import WorkProductComponentManifest
 from osdu_commons.utils import convert
+from osdu_commons.utils.camel_codec import camel_codec, decode_camel, encode_camel
 from osdu_commons.utils.validators import list_of
 
 
-@attr.s(frozen=True)
+@camel_codec()
+@attr.s(frozen=True, slots=True)
 class SWPSManifest:
     work_product: WorkProductManifest = attr.ib(
         converter=convert.class_from_camel_dict(WorkProductManifest))
@@ -22,12 +24,8 @@ class SWPSManifest:
         converter=convert.list_(convert.class_from_camel_dict(ManifestFile)))
 
     def asdict(self):
-        return {
-            'WorkProduct': self.work_product.asdict(),
-            'WorkProductComponents': [wpc.asdict() for wpc in self.work_product_components],
-            'Files': [f.asdict() for f in self.files],
-        }
+        return encode_camel(self)
 
 
 def manifest_from_camel_dict(camel_dict: dict) -> SWPSManifest:
-    return convert.class_from_camel_dict(SWPSManifest)(camel_dict)
+    return decode_camel(SWPSManifest, camel_dict)
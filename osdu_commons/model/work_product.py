@@ -4,11 +4,13 @@ import attr
 from attr.validators import instance_of, optional
 
 from osdu_commons.utils import convert
+from osdu_commons.utils.camel_codec import camel_codec, encode_camel
 from osdu_commons.utils.srn import SRN
 from osdu_commons.utils.validators import list_of
 
 
-@attr.s(frozen=True)
+@camel_codec()
+@attr.s(frozen=True, slots=True)
 class WorkProductGroupTypeProperties:
     description: Optional[str] = attr.ib(default=None, validator=optional(instance_of(str)))
     schema: Optional[str] = attr.ib(default=None, validator=optional(instance_of(str)))
@@ -17,33 +19,24 @@ class WorkProductGroupTypeProperties:
                                               converter=attr.converters.optional(convert.list_(convert.srn)))
 
     def asdict(self):
-        return {
-            'Description': self.description,
-            'Schema': self.schema,
-            'RequireKey': self.require_key,
-            'Components': [
-                str(srn) for srn in self.components
-            ]
-        }
+        return encode_camel(self)
 
 
-@attr.s(frozen=True)
+@camel_codec()
+@attr.s(frozen=True, slots=True)
 class WorkProductData:
     group_type_properties: WorkProductGroupTypeProperties = attr.ib(
         validator=instance_of(WorkProductGroupTypeProperties),
         converter=convert.class_from_camel_dict(WorkProductGroupTypeProperties))
-    individual_type_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.copy)
-    extension_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.copy)
+    individual_type_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.freeze)
+    extension_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.freeze)
 
     def asdict(self):
-        return {
-            'GroupTypeProperties': self.group_type_properties.asdict(),
-            'IndividualTypeProperties': self.individual_type_properties,
-            'ExtensionProperties': self.extension_properties,
-        }
+        return encode_camel(self)
 
 
-@attr.s(frozen=True)
+@camel_codec()
+@attr.s(frozen=True, slots=True)
 class WorkProductManifest:
     resource_type_id: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
     resource_security_classification: SRN = attr.ib(validator=instance_of(SRN),
@@ -54,9 +47,4 @@ class WorkProductManifest:
     components_associative_ids: List[str] = attr.ib(validator=list_of(instance_of(str)), converter=convert.list_())
 
     def asdict(self):
-        return {
-            'ResourceTypeID': str(self.resource_type_id),
-            'ResourceSecurityClassification': str(self.resource_security_classification),
-            'Data': self.data.asdict(),
-            'ComponentsAssociativeIDs': self.components_associative_ids,
-        }
+        return encode_camel(self)
@@ -4,11 +4,13 @@ import attr
 from attr.validators import instance_of, optional
 
 from osdu_commons.utils import convert
+from osdu_commons.utils.camel_codec import camel_codec, encode_camel
 from osdu_commons.utils.srn import SRN
 from osdu_commons.utils.validators import list_of
 
 
-@attr.s(frozen=True)
+@camel_codec(key_order=['role_id', 'resource_type_id', 'resource_id'])
+@attr.s(frozen=True, slots=True)
 class WorkProductComponentArtefactProperties:
     role_id: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
     resource_id: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
@@ -16,14 +18,11 @@ class WorkProductComponentArtefactProperties:
                                     default='srn:type:artefact/Unknown:')
 
     def asdict(self):
-        return {
-            'RoleID': str(self.role_id),
-            'ResourceTypeID': str(self.resource_type_id),
-            'ResourceID': str(self.resource_id),
-        }
+        return encode_camel(self)
 
 
-@attr.s(frozen=True)
+@camel_codec(key_order=['role_id', 'resource_type_id', 'resource_id'])
+@attr.s(frozen=True, slots=True)
 class WorkProductComponentArtefact:
     role_id: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
     resource_id: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
@@ -31,14 +30,11 @@ class WorkProductComponentArtefact:
                                     default='srn:type:artefact/Unknown:')
 
     def asdict(self):
-        return {
-            'RoleID': str(self.role_id),
-            'ResourceTypeID': str(self.resource_type_id),
-            'ResourceID': str(self.resource_id),
-        }
+        return encode_camel(self)
 
 
-@attr.s(frozen=True)
+@camel_codec(key_order=['description', 'schema', 'require_key', 'files', 'artefacts'])
+@attr.s(frozen=True, slots=True)
 class WorkProductComponentGroupTypeProperties:
     files: Optional[List[SRN]] = attr.ib(
         default=attr.Factory(list),
@@ -55,36 +51,24 @@ class WorkProductComponentGroupTypeProperties:
     require_key: Optional[bool] = attr.ib(default=None, validator=optional(instance_of(bool)))
 
     def asdict(self):
-        return {
-            'Description': self.description,
-            'Schema': self.schema,
-            'RequireKey': self.require_key,
-            'Files': [
-                str(file_) for file_ in self.files
-            ],
-            'Artefacts': [
-                artefact.asdict() for artefact in self.artefacts
-            ]
-        }
-
-
-@attr.s(frozen=True)
+        return encode_camel(self)
+
+
+@camel_codec()
+@attr.s(frozen=True, slots=True)
 class WorkProductComponentData:
     group_type_properties: WorkProductComponentGroupTypeProperties = attr.ib(
         validator=instance_of(WorkProductComponentGroupTypeProperties),
         converter=convert.class_from_camel_dict(WorkProductComponentGroupTypeProperties))
-    individual_type_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.copy)
-    extension_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.copy)
+    individual_type_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.freeze)
+    extension_properties: dict = attr.ib(validator=instance_of(dict), converter=convert.freeze)
 
     def asdict(self):
-        return {
-            'GroupTypeProperties': self.group_type_properties.asdict(),
-            'IndividualTypeProperties': self.individual_type_properties,
-            'ExtensionProperties': self.extension_properties,
-        }
+        return encode_camel(self)
 
 
-@attr.s(frozen=True)
+@camel_codec()
+@attr.s(frozen=True, slots=True)
 class WorkProductComponentManifest:
     resource_type_id: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
     resource_security_classification: SRN = attr.ib(validator=instance_of(SRN),
@@ -96,10 +80,4 @@ class WorkProductComponentManifest:
     file_associative_ids: List[str] = attr.ib(validator=list_of(instance_of(str)), converter=convert.list_())
 
     def asdict(self):
-        return {
-            'ResourceTypeID': str(self.resource_type_id),
-            'ResourceSecurityClassification': str(self.resource_security_classification),
-            'Data': self.data.asdict(),
-            'AssociativeID': self.associative_id,
-            'FileAssociativeIDs': self.file_associative_ids,
-        }
+        return encode_camel(self)
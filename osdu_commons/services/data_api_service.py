@@ -1,9 +1,16 @@
+import hashlib
+import json
 import logging
 import os
-from typing import List, Dict, Iterable
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Iterable, Optional, Union
 
 import attr
-from osdu_commons.clients.data_api_client import DataAPIClient, ResourceExists
+from attr.validators import instance_of
+from osdu_commons.clients.data_api_client import BatchWriteError, DataAPIClient, ResourceExists
 from osdu_commons.model.aws import S3Location
 from osdu_commons.model.enums import ResourceLifecycleStatus
 from osdu_commons.model.file import ManifestFile
@@ -12,21 +19,85 @@ from osdu_commons.model.smds_manifest import SMDSManifest
 from osdu_commons.model.swps_manifest import SWPSManifest
 from osdu_commons.model.work_product import WorkProductManifest
 from osdu_commons.model.work_product_component import WorkProductComponentManifest
+from osdu_commons.utils.batching import BatchingConfig, MicroBatcher
+from osdu_commons.utils.dag import DagStep, StepTiming, run_dag
+from osdu_commons.utils.disk_resource_cache import DiskResourceCache
+from osdu_commons.utils.resource_cache import ResourceCache, ResourceCacheStats
 from osdu_commons.utils.srn import SRN
 
 logger = logging.getLogger(__name__)
 
+TREE_BATCH_SIZE = 100
+TREE_MAX_CONCURRENCY = 4
+CREATE_WORK_PRODUCT_CONCURRENCY = 3
+BULK_BATCH_SIZE = 100
 
-@attr.s(frozen=True, auto_attribs=True)
+
+@attr.s(frozen=True, slots=True)
+class GetResourcesConfig:
+    batch_size: int = attr.ib(validator=instance_of(int), default=100)
+    max_concurrent_requests: int = attr.ib(validator=instance_of(int), default=4)
+    max_attempts: int = attr.ib(validator=instance_of(int), default=10)
+    time_budget_seconds: float = attr.ib(validator=instance_of((int, float)), default=30)
+    base_delay_ms: int = attr.ib(validator=instance_of(int), default=50)
+    max_delay_ms: int = attr.ib(validator=instance_of(int), default=2000)
+
+
+class UnprocessedResourcesException(RuntimeError):
+    def __init__(self, resources: List[Resource], unprocessed_srns: List[SRN]):
+        self.resources = resources
+        self.unprocessed_srns = unprocessed_srns
+        super().__init__(f'Could not get {len(unprocessed_srns)} resources: {unprocessed_srns}')
+
+
+@attr.s(frozen=True, slots=True)
+class WriteStats:
+    written: int = attr.ib(validator=instance_of(int))
+    skipped: int = attr.ib(validator=instance_of(int))
+
+
+@attr.s(frozen=True, slots=True, auto_attribs=True)
 class CreateWorkProductResult:
     work_product: Resource
     file_associative_id_to_file_location_map: Dict[str, S3Location]
+    step_timings: Dict[str, StepTiming] = attr.ib(default=attr.Factory(dict), cmp=False)
+
+
+@attr.s(frozen=True, slots=True, auto_attribs=True)
+class CreateWorkProductOutcome:
+    result: Optional[CreateWorkProductResult] = None
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@attr.s(frozen=True, slots=True, auto_attribs=True)
+class UpsertSMDSOutcome:
+    resource_id: Optional[SRN] = None
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
 
 
 class DataAPIService:
-    def __init__(self, data_api_client: DataAPIClient, region_id: SRN):
+    def __init__(self, data_api_client: DataAPIClient, region_id: SRN, batching: BatchingConfig = None,
+                 resource_cache: Union[ResourceCache, DiskResourceCache] = None, get_resources_config: GetResourcesConfig = None,
+                 create_work_product_concurrency: int = CREATE_WORK_PRODUCT_CONCURRENCY,
+                 skip_unchanged_writes: bool = False):
         self._data_api_client = data_api_client
         self._region_id = region_id
+        self._resources_batcher = MicroBatcher(self._get_resources_batch, batching) if batching is not None else None
+        self._resource_cache = resource_cache
+        self._get_resources_config = get_resources_config if get_resources_config is not None else GetResourcesConfig()
+        self._create_work_product_concurrency = create_work_product_concurrency
+        self._skip_unchanged_writes = skip_unchanged_writes
+        self._write_stats_lock = threading.Lock()
+        self._written_count = 0
+        self._skipped_count = 0
 
     @classmethod
     def from_environ(cls) -> 'DataAPIService':
@@ -38,160 +109,665 @@ class DataAPIService:
     def create_smds_from_manifest(self, smds_manifest: SMDSManifest) -> SRN:
 
         try:
-            resources = self._data_api_client.create_resources(
-                resource_inits=[
-                    ResourceInit(
-                        type=smds_manifest.resource_type_id,
-                        new_version=False,
-                        key=smds_manifest.resource_id.detail
-                    )
-                ],
+            resources = self._create_resources(
+                resource_inits=[self._smds_resource_init(smds_manifest, new_version=False)],
                 region_id=self._region_id
             )
             resource_id = resources[0].id
         except ResourceExists:
-            resources = self._data_api_client.create_resources(
-                resource_inits=[
-                    ResourceInit(
-                        type=smds_manifest.resource_type_id,
-                        new_version=True,
-                        key=smds_manifest.resource_id.detail,
-                        id=SRN(smds_manifest.resource_type_id.detail, smds_manifest.resource_id.detail),
-                    )
-                ],
+            resources = self._create_resources(
+                resource_inits=[self._smds_resource_init(smds_manifest, new_version=True)],
                 region_id=self._region_id
             )
             resource_id = resources[0].id
 
-        self._data_api_client.update_resources(
-            resource_updates=[
-                ResourceUpdate(
-                    id=resource_id,
-                    data=smds_manifest.data,
-                    lifecycle_status=ResourceLifecycleStatus.RECEIVED
-                )
-            ],
+        self._update_resources(
+            resource_updates=[self._smds_resource_update(smds_manifest, resource_id)],
             region_id=self._region_id
         )
 
         return resource_id
 
-    def create_work_product_from_manifest(self, manifest: SWPSManifest) -> CreateWorkProductResult:
-        file_associative_id_to_resource_map = self._create_file_resources(
-            file_definitions=manifest.files
+    def upsert_smds_manifests(self, smds_manifests: List[SMDSManifest],
+                              batch_size: int = BULK_BATCH_SIZE) -> List[UpsertSMDSOutcome]:
+        """ Bulk version of create_smds_from_manifest.
+
+        Resources are created in batches; a batch failing with ResourceExists is bisected to find the existing keys,
+        which then get new versions in batches too. Other errors fail all manifests of the batch. Data updates are merged the same way as in
+        create_work_products_from_manifests. Outcomes are returned in order of manifests.
+        """
+        errors, resource_ids, existing = {}, {}, []
+        indices = list(range(len(smds_manifests)))
+        for i in range(0, len(indices), batch_size):
+            self._create_smds_resources(
+                smds_manifests, indices[i:i + batch_size], False, resource_ids, existing, errors
+            )
+        logger.info(f'{len(existing)} of {len(smds_manifests)} SMDS resources already exist, creating new versions')
+        for i in range(0, len(existing), batch_size):
+            self._create_smds_resources(
+                smds_manifests, existing[i:i + batch_size], True, resource_ids, existing, errors
+            )
+
+        updated = self._call_in_merged_batches(
+            {i: [self._smds_resource_update(smds_manifests[i], resource_ids[i])] for i in sorted(resource_ids)},
+            lambda resource_updates: self._update_resources(resource_updates, region_id=self._region_id),
+            batch_size,
+            errors
         )
-        work_product_component_resource_ids = self._create_work_product_component_resources(
-            work_product_component_descriptions=manifest.work_product_components,
-            associative_id_to_file_resource_id_map={k: v.id for k, v in file_associative_id_to_resource_map.items()}
+
+        return [
+            UpsertSMDSOutcome(resource_id=resource_ids[i]) if i in updated else UpsertSMDSOutcome(error=errors[i])
+            for i in indices
+        ]
+
+    def _create_smds_resources(self, smds_manifests: List[SMDSManifest], indices: List[int], new_version: bool,
+                               resource_ids: Dict[int, SRN], existing: List[int], errors: Dict[int, Exception]):
+        try:
+            resources = self._create_resources(
+                resource_inits=[self._smds_resource_init(smds_manifests[i], new_version) for i in indices],
+                region_id=self._region_id
+            )
+        except ResourceExists as e:
+            if isinstance(e, BatchWriteError):
+                resource_ids.update((indices[i], resource.id) for i, resource in e.resources.items())
+                indices = [indices[i] for i in e.failed_indices]
+            if len(indices) > 1:
+                middle = len(indices) // 2
+                self._create_smds_resources(
+                    smds_manifests, indices[:middle], new_version, resource_ids, existing, errors
+                )
+                self._create_smds_resources(
+                    smds_manifests, indices[middle:], new_version, resource_ids, existing, errors
+                )
+            elif not new_version:
+                existing.append(indices[0])
+            else:
+                logger.warning(f'Creating SMDS resource {smds_manifests[indices[0]].resource_id} failed: {e}')
+                errors[indices[0]] = e
+            return
+        except Exception as e:
+            # Only conflicts are worth bisecting, other errors (already retried) fail the whole batch
+            logger.warning(f'Creating {len(indices)} SMDS resources failed: {e}')
+            errors.update((i, e) for i in indices)
+            return
+
+        resource_ids.update(zip(indices, [r.id for r in resources]))
+
+    @staticmethod
+    def _smds_resource_init(smds_manifest: SMDSManifest, new_version: bool) -> ResourceInit:
+        if not new_version:
+            return ResourceInit(
+                type=smds_manifest.resource_type_id,
+                new_version=False,
+                key=smds_manifest.resource_id.detail
+            )
+        return ResourceInit(
+            type=smds_manifest.resource_type_id,
+            new_version=True,
+            key=smds_manifest.resource_id.detail,
+            id=SRN(smds_manifest.resource_type_id.detail, smds_manifest.resource_id.detail),
         )
-        work_product_resource = self._create_work_product(
-            work_product_description=manifest.work_product,
-            work_product_component_ids=work_product_component_resource_ids
+
+    @staticmethod
+    def _smds_resource_update(smds_manifest: SMDSManifest, resource_id: SRN) -> ResourceUpdate:
+        return ResourceUpdate(
+            id=resource_id,
+            data=smds_manifest.data,
+            lifecycle_status=ResourceLifecycleStatus.RECEIVED
         )
 
+    def create_work_product_from_manifest(self, manifest: SWPSManifest) -> CreateWorkProductResult:
+        # Resources are created independently, updates wait only for the IDs they reference
+        dag_result = run_dag([
+            DagStep('create_files', lambda: self._create_file_resources(manifest.files)),
+            DagStep('create_wpcs', lambda: self._create_work_product_component_resources(
+                manifest.work_product_components
+            )),
+            DagStep('create_wp', lambda: self._create_work_product(manifest.work_product)),
+            DagStep(
+                'update_files',
+                lambda create_files: self._update_file_resources(manifest.files, create_files),
+                ['create_files']
+            ),
+            DagStep(
+                'get_files',
+                lambda create_files, update_files: self._get_file_resources(manifest.files, create_files),
+                ['create_files', 'update_files']
+            ),
+            DagStep(
+                'update_wpcs',
+                lambda create_files, create_wpcs: self._update_work_product_component_resources(
+                    manifest.work_product_components,
+                    create_wpcs,
+                    {file_def.associative_id: r.id for file_def, r in zip(manifest.files, create_files)}
+                ),
+                ['create_files', 'create_wpcs']
+            ),
+            DagStep(
+                'update_wp',
+                lambda create_wp, update_wpcs: self._update_work_product(manifest.work_product, create_wp, update_wpcs),
+                ['create_wp', 'update_wpcs']
+            ),
+            DagStep(
+                'get_wp',
+                lambda create_wp, update_wp: self.get_all_resources(resource_ids=[create_wp.id])[0],
+                ['create_wp', 'update_wp']
+            ),
+        ], max_workers=self._create_work_product_concurrency)
+        logger.debug(f'Work product created, critical path: {dag_result.critical_path()}')
+
         return CreateWorkProductResult(
-            work_product=work_product_resource,
+            work_product=dag_result.results['get_wp'],
             file_associative_id_to_file_location_map={
-                k: v.s3_location for k, v in file_associative_id_to_resource_map.items()
-            }
+                k: v.s3_location for k, v in dag_result.results['get_files'].items()
+            },
+            step_timings=dag_result.timings
+        )
+
+    def create_work_products_from_manifests(self, manifests: List[SWPSManifest],
+                                            batch_size: int = BULK_BATCH_SIZE) -> List[CreateWorkProductOutcome]:
+        """ Creates work products of many manifests with merged Data API calls of up to batch_size resources.
+
+        Outcomes are returned in order of manifests. A failed merged call is repeated separately for every manifest
+        it contained, so an error fails only the manifests which caused it. Resources of chunks which were written
+        before a chunked write failed (see BatchWriteError) are kept and only the failed ones are repeated.
+        """
+        errors = {}
+        created = self._call_in_merged_batches(
+            {
+                i: self._file_resource_inits(manifest.files) +
+                self._work_product_component_resource_inits(manifest.work_product_components) +
+                [self._work_product_resource_init(manifest.work_product)]
+                for i, manifest in enumerate(manifests)
+            },
+            lambda resource_inits: self._create_resources(resource_inits, region_id=self._region_id),
+            batch_size,
+            errors
+        )
+
+        manifest_resources = {}
+        for i, resources in created.items():
+            files_count, wpcs_count = len(manifests[i].files), len(manifests[i].work_product_components)
+            manifest_resources[i] = (
+                resources[:files_count], resources[files_count:files_count + wpcs_count], resources[-1]
+            )
+
+        updated = self._call_in_merged_batches(
+            {i: self._manifest_resource_updates(manifests[i], *manifest_resources[i]) for i in manifest_resources},
+            lambda resource_updates: self._update_resources(resource_updates, region_id=self._region_id),
+            batch_size,
+            errors
+        )
+
+        fetched = self._call_in_merged_batches(
+            {i: [manifest_resources[i][2].id] + [r.id for r in manifest_resources[i][0]] for i in updated},
+            self.get_all_resources,
+            batch_size,
+            errors
+        )
+
+        outcomes = []
+        for i, manifest in enumerate(manifests):
+            if i in errors:
+                outcomes.append(CreateWorkProductOutcome(error=errors[i]))
+                continue
+            work_product, *file_resources = fetched[i]
+            outcomes.append(CreateWorkProductOutcome(result=CreateWorkProductResult(
+                work_product=work_product,
+                file_associative_id_to_file_location_map={
+                    file_def.associative_id: resource.s3_location
+                    for file_def, resource in zip(manifest.files, file_resources)
+                }
+            )))
+
+        logger.info(f'Created {len(manifests) - len(errors)} of {len(manifests)} work products')
+        return outcomes
+
+    def _manifest_resource_updates(self, manifest: SWPSManifest, file_resources: List[Resource],
+                                   wpc_resources: List[Resource], wp_resource: Resource) -> List[ResourceUpdate]:
+        associative_id_to_file_resource_id_map = {
+            file_def.associative_id: resource.id for file_def, resource in zip(manifest.files, file_resources)
+        }
+        return (
+            self._file_resource_updates(manifest.files, file_resources) +
+            self._work_product_component_resource_updates(
+                manifest.work_product_components, wpc_resources, associative_id_to_file_resource_id_map
+            ) +
+            [self._work_product_resource_update(manifest.work_product, wp_resource, [r.id for r in wpc_resources])]
         )
 
-    def iter_resources_tree(self, root_resource_id: SRN, with_artefacts: bool = False) -> Iterable[Resource]:
+    @staticmethod
+    def _call_in_merged_batches(items_by_key: Dict[int, list], call: Callable[[list], list], batch_size: int,
+                                errors: Dict[int, Exception]) -> Dict[int, list]:
+        batches, batch, batch_length = [], [], 0
+        for key, items in items_by_key.items():
+            if batch and batch_length + len(items) > batch_size:
+                batches.append(batch)
+                batch, batch_length = [], 0
+            batch.append(key)
+            batch_length += len(items)
+        if batch:
+            batches.append(batch)
+
+        results = {}
+        for keys in batches:
+            try:
+                batch_results = call([item for key in keys for item in items_by_key[key]])
+            except Exception as e:
+                # Chunked writes keep results of successful chunks, only the failed items are repeated
+                written = e.resources if isinstance(e, BatchWriteError) else {}
+                if len(keys) == 1 and not written:
+                    logger.warning(f'Call for manifest {keys[0]} failed: {e}')
+                    errors[keys[0]] = e
+                    continue
+                logger.warning(f'Merged call for {len(keys)} manifests failed, repeating failed items per manifest: {e}')
+                DataAPIService._repeat_failed_items(keys, items_by_key, written, call, results, errors)
+                continue
+
+            offset = 0
+            for key in keys:
+                results[key] = batch_results[offset:offset + len(items_by_key[key])]
+                offset += len(items_by_key[key])
+
+        return results
+
+    @staticmethod
+    def _repeat_failed_items(keys: List[int], items_by_key: Dict[int, list], written: Dict[int, object],
+                             call: Callable[[list], list], results: Dict[int, list], errors: Dict[int, Exception]):
+        """ Completes results of keys of a failed merged call, written are its results by index of merged items. """
+        offset = 0
+        for key in keys:
+            items = items_by_key[key]
+            key_results = {i: written[offset + i] for i in range(len(items)) if offset + i in written}
+            offset += len(items)
+            failed = [i for i in range(len(items)) if i not in key_results]
+            if failed:
+                try:
+                    repeated = call([items[i] for i in failed])
+                    if len(repeated) != len(failed):
+                        raise ValueError(f'Got {len(repeated)} results of {len(failed)} repeated items')
+                    key_results.update(zip(failed, repeated))
+                except Exception as manifest_error:
+                    logger.warning(f'Call for manifest {key} failed: {manifest_error}')
+                    errors[key] = manifest_error
+                    continue
+            results[key] = [key_results[i] for i in range(len(items))]
+
+    def iter_resources_tree(self, root_resource_id: SRN, with_artefacts: bool = False, breadth_first: bool = False,
+                            max_depth: Optional[int] = None, type_filter: Callable[[str], bool] = None,
+                            max_concurrency: int = TREE_MAX_CONCURRENCY) -> Iterable[Resource]:
+        """ Yields the root resource and its descendants.
+
+        Children at depth greater than max_depth (the root has depth 0) and children whose SRN type is rejected by
+        type_filter are neither fetched nor descended into. In breadth_first mode whole levels are fetched at once in
+        batches of TREE_BATCH_SIZE, max_concurrency batches at a time, and every resource is yielded only once.
+        """
         root_resource = self.get_all_resources([root_resource_id])[0]
         yield root_resource
-        yield from self._iter_resource_children(root_resource, with_artefacts)
+        if breadth_first:
+            yield from self._iter_resource_levels(root_resource, with_artefacts, max_depth, type_filter, max_concurrency)
+        else:
+            yield from self._iter_resource_children(root_resource, with_artefacts, 1, max_depth, type_filter)
+
+    def _iter_resource_children(self, resource: Resource, with_artefacts: bool, depth: int = 1,
+                                max_depth: Optional[int] = None,
+                                type_filter: Callable[[str], bool] = None) -> Iterable[Resource]:
+        if max_depth is not None and depth > max_depth:
+            return
 
-    def _iter_resource_children(self, resource: Resource, with_artefacts: bool) -> Iterable[Resource]:
         is_work_product = resource.type_id.detail.startswith('work-product/')
         is_work_product_component = resource.type_id.detail.startswith('work-product-component/')
         has_children = is_work_product or is_work_product_component
 
         if has_children:
-            group_type_properties = resource.data.get('GroupTypeProperties', {})
+            group_type_properties = resource.group_type_properties
             if is_work_product:
-                components_ids = [SRN.from_string(wpc) for wpc in group_type_properties.get('Components', [])]
+                components_ids = self._filter_ids(group_type_properties.get('Components', []), type_filter)
                 resources = self.get_all_resources(components_ids)
                 yield from resources
                 for r in resources:
-                    yield from self._iter_resource_children(r, with_artefacts)
+                    yield from self._iter_resource_children(r, with_artefacts, depth + 1, max_depth, type_filter)
 
             elif is_work_product_component:
-                files_ids = [SRN.from_string(f) for f in group_type_properties.get('Files', [])]
+                files_ids = self._filter_ids(group_type_properties.get('Files', []), type_filter)
                 yield from self.get_all_resources(files_ids)
 
             if with_artefacts:
-                artefacts_ids = [SRN.from_string(f['ResourceID']) for f in group_type_properties.get('Artefacts', [])]
+                artefacts_ids = self._filter_ids(
+                    [f['ResourceID'] for f in group_type_properties.get('Artefacts', [])], type_filter
+                )
                 yield from self.get_all_resources(artefacts_ids)
 
-    def get_all_resources(self, resource_ids: List[SRN]) -> List[Resource]:
-        def _recursive_get(ids, n=100):
-            if n < 0:
-                raise RuntimeError('Recursion limit exceeded when getting resources')
+    def _iter_resource_levels(self, root_resource: Resource, with_artefacts: bool, max_depth: Optional[int],
+                              type_filter: Callable[[str], bool], max_concurrency: int) -> Iterable[Resource]:
+        seen_ids = {root_resource.id.without_version}
+        level = [root_resource]
+        depth = 1
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            while level and (max_depth is None or depth <= max_depth):
+                children_ids = []
+                for resource in level:
+                    for id_ in self._get_children_ids(resource, with_artefacts, type_filter):
+                        if id_.without_version not in seen_ids:
+                            seen_ids.add(id_.without_version)
+                            children_ids.append(id_)
+
+                batches = [children_ids[i:i + TREE_BATCH_SIZE] for i in range(0, len(children_ids), TREE_BATCH_SIZE)]
+                level = [resource for batch in executor.map(self.get_all_resources, batches) for resource in batch]
+                yield from level
+                depth += 1
 
-            all_resources = []
-            get_resources_result = self._data_api_client.get_resources(resource_ids=ids)
-            all_resources.extend(get_resources_result.resources)
+    @classmethod
+    def _get_children_ids(cls, resource: Resource, with_artefacts: bool,
+                          type_filter: Callable[[str], bool]) -> List[SRN]:
+        group_type_properties = resource.group_type_properties
+        children_ids = []
+        if resource.type_id.detail.startswith('work-product/'):
+            children_ids.extend(group_type_properties.get('Components', []))
+        elif resource.type_id.detail.startswith('work-product-component/'):
+            children_ids.extend(group_type_properties.get('Files', []))
+        else:
+            return []
 
-            if len(get_resources_result.unprocessed_srns) > 0:
-                all_resources.extend(
-                    _recursive_get(get_resources_result.unprocessed_srns, n - 1)
-                )
+        if with_artefacts:
+            children_ids.extend(f['ResourceID'] for f in group_type_properties.get('Artefacts', []))
+        return cls._filter_ids(children_ids, type_filter)
 
-            return all_resources
+    @staticmethod
+    def _filter_ids(srns: List[str], type_filter: Callable[[str], bool]) -> List[SRN]:
+        ids = [SRN.from_string(srn) for srn in srns]
+        if type_filter is None:
+            return ids
+        return [id_ for id_ in ids if type_filter(id_.type)]
 
+    def get_all_resources(self, resource_ids: List[SRN]) -> List[Resource]:
         if not resource_ids:
             return []
 
-        shuffled_resources = _recursive_get(resource_ids)
+        if self._resource_cache is None:
+            return self._get_all_resources(resource_ids)
+
+        id_to_resource_map = {id_: self._resource_cache.get(id_) for id_ in resource_ids}
+        missing_ids = [id_ for id_, resource in id_to_resource_map.items() if resource is None]
+        if missing_ids:
+            fetched_resources = list(zip(missing_ids, self._get_all_resources(missing_ids)))
+            self._resource_cache.put_many(fetched_resources)
+            id_to_resource_map.update(fetched_resources)
+
+        return [id_to_resource_map[id_] for id_ in resource_ids]
+
+    @property
+    def resource_cache_stats(self) -> Optional[ResourceCacheStats]:
+        return self._resource_cache.stats if self._resource_cache is not None else None
+
+    def _get_all_resources(self, resource_ids: List[SRN]) -> List[Resource]:
+        if self._resources_batcher is not None:
+            return self._resources_batcher.get_many(resource_ids)
+
+        shuffled_resources = self._fetch_resources(resource_ids)
         id_to_resource_map = {resource.id.without_version: resource for resource in shuffled_resources}
         assert len(id_to_resource_map) == len(resource_ids), "IDs duplicated - two same SRNs with different versions?"
         resources_in_proper_order = [id_to_resource_map[id_.without_version] for id_ in resource_ids]
 
         return resources_in_proper_order
 
-    def _create_file_resources(self, file_definitions: List[ManifestFile]) -> Dict[str, Resource]:
-        file_resources = self._data_api_client.create_resources(
-            resource_inits=[
-                ResourceInit(
-                    type=file_def.resource_type_id,
-                    new_version=False,
-                ) for file_def in file_definitions
-            ],
+    def close(self):
+        if self._resources_batcher is not None:
+            self._resources_batcher.close()
+
+    def _create_resources(self, resource_inits: List[ResourceInit], region_id: SRN) -> List[Resource]:
+        resources = self._data_api_client.create_resources(resource_inits=resource_inits, region_id=region_id)
+        self._invalidate_cache([r.id for r in resource_inits if r.id is not None] + [r.id for r in resources])
+        return resources
+
+    @property
+    def write_stats(self) -> WriteStats:
+        with self._write_stats_lock:
+            return WriteStats(written=self._written_count, skipped=self._skipped_count)
+
+    def _update_resources(self, resource_updates: List[ResourceUpdate], region_id: SRN) -> List[Resource]:
+        """ Returns resources in order of updates, the current resources for updates skipped as unchanged. """
+        unchanged_resources = self._unchanged_resources(resource_updates) if self._skip_unchanged_writes else {}
+        changed_updates = [update for i, update in enumerate(resource_updates) if i not in unchanged_resources]
+        if not changed_updates:
+            return [unchanged_resources[i] for i in range(len(resource_updates))]
+
+        try:
+            written_resources = self._data_api_client.update_resources(
+                resource_updates=changed_updates, region_id=region_id
+            )
+        finally:
+            self._invalidate_cache([r.id for r in changed_updates])
+        with self._write_stats_lock:
+            self._written_count += len(changed_updates)
+
+        if not unchanged_resources:
+            return written_resources
+        if len(written_resources) != len(changed_updates):
+            logger.warning(f'Got {len(written_resources)} resources for {len(changed_updates)} updates')
+            return written_resources + list(unchanged_resources.values())
+        written_resources = iter(written_resources)
+        return [
+            unchanged_resources[i] if i in unchanged_resources else next(written_resources)
+            for i in range(len(resource_updates))
+        ]
+
+    def _unchanged_resources(self, resource_updates: List[ResourceUpdate]) -> Dict[int, Resource]:
+        try:
+            current_resources = self.get_all_resources([r.id for r in resource_updates])
+        except Exception as e:
+            logger.warning(f'Could not get current resources, writing all updates: {e}')
+            return {}
+
+        unchanged_resources = {
+            i: resource for i, (update, resource) in enumerate(zip(resource_updates, current_resources))
+            if self._update_hash(update) == self._resource_hash(resource, update)
+        }
+        if unchanged_resources:
+            logger.info(f'Skipping {len(unchanged_resources)} updates which would not change resources')
+        with self._write_stats_lock:
+            self._skipped_count += len(unchanged_resources)
+        return unchanged_resources
+
+    @classmethod
+    def _update_hash(cls, update: ResourceUpdate) -> str:
+        return cls._canonical_hash({
+            'Data': update.data,
+            'ResourceCurationStatus': str(update.curation_status.value) if update.curation_status is not None else None,
+            'ResourceLifecycleStatus': str(update.lifecycle_status.value) if update.lifecycle_status is not None else None,
+        })
+
+    @classmethod
+    def _resource_hash(cls, resource: Resource, update: ResourceUpdate) -> str:
+        # Only the fields set in the update are compared
+        return cls._canonical_hash({
+            'Data': resource.data if update.data is not None else None,
+            'ResourceCurationStatus': str(resource.curation_status.value) if update.curation_status is not None else None,
+            'ResourceLifecycleStatus': str(resource.lifecycle_status.value) if update.lifecycle_status is not None else None,
+        })
+
+    @staticmethod
+    def _canonical_hash(value) -> str:
+        canonical_json = json.dumps(value, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical_json.encode('utf-8')).hexdigest()
+
+    def _invalidate_cache(self, resource_ids: List[SRN]):
+        if self._resource_cache is not None:
+            self._resource_cache.invalidate(resource_ids)
+
+    def _fetch_resources(self, ids: List[SRN]) -> List[Resource]:
+        batch_size = self._get_resources_config.batch_size
+        batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+        if len(batches) <= 1:
+            return self._fetch_resources_batch(ids)
+
+        max_workers = min(len(batches), self._get_resources_config.max_concurrent_requests)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._fetch_resources_batch, batch) for batch in batches]
+
+        all_resources, unprocessed_srns = [], []
+        for future in futures:
+            try:
+                all_resources.extend(future.result())
+            except UnprocessedResourcesException as e:
+                all_resources.extend(e.resources)
+                unprocessed_srns.extend(e.unprocessed_srns)
+
+        if unprocessed_srns:
+            raise UnprocessedResourcesException(all_resources, unprocessed_srns)
+        return all_resources
+
+    def _fetch_resources_batch(self, ids: List[SRN]) -> List[Resource]:
+        config = self._get_resources_config
+        deadline = time.monotonic() + config.time_budget_seconds
+        all_resources = []
+        ids_to_fetch = ids
+        attempt = 0
+        while True:
+            get_resources_result = self._data_api_client.get_resources(resource_ids=ids_to_fetch)
+            all_resources.extend(get_resources_result.resources)
+            ids_to_fetch = get_resources_result.unprocessed_srns
+            if not ids_to_fetch:
+                return all_resources
+
+            attempt += 1
+            delay = random.uniform(0, min(config.max_delay_ms, config.base_delay_ms * 2 ** attempt)) / 1000
+            if attempt >= config.max_attempts or time.monotonic() + delay > deadline:
+                raise UnprocessedResourcesException(all_resources, ids_to_fetch)
+
+            logger.info(f'{len(ids_to_fetch)} resources unprocessed, retrying in {delay:.3f}s')
+            time.sleep(delay)
+
+    def _get_resources_batch(self, resource_ids: List[SRN]) -> Dict[SRN, Resource]:
+        # Different callers can ask for different versions of the same resource. Responses are matched
+        # by SRN without version, so such SRNs are fetched in separate requests.
+        id_to_resource_map = {}
+        ids_to_fetch = resource_ids
+        while ids_to_fetch:
+            ids_in_request, postponed_ids, ids_without_version = [], [], set()
+            for id_ in ids_to_fetch:
+                if id_.without_version in ids_without_version:
+                    postponed_ids.append(id_)
+                else:
+                    ids_without_version.add(id_.without_version)
+                    ids_in_request.append(id_)
+
+            try:
+                fetched_resources = self._fetch_resources(ids_in_request)
+            except UnprocessedResourcesException as e:
+                # Callers of resources fetched before the budget ran out still get them
+                fetched_resources = e.resources
+            fetched = {resource.id.without_version: resource for resource in fetched_resources}
+            for id_ in ids_in_request:
+                if id_.without_version in fetched:
+                    id_to_resource_map[id_] = fetched[id_.without_version]
+            ids_to_fetch = postponed_ids
+
+        return id_to_resource_map
+
+    def _create_file_resources(self, file_definitions: List[ManifestFile]) -> List[Resource]:
+        return self._create_resources(
+            resource_inits=self._file_resource_inits(file_definitions),
             region_id=self._region_id
         )
-        self._data_api_client.update_resources(
-            resource_updates=[
-                ResourceUpdate(
-                    id=resource.id,
-                    data=file_def.data.asdict(),
-                    lifecycle_status=ResourceLifecycleStatus.LOADING
-                ) for resource, file_def in zip(file_resources, file_definitions)
-            ],
+
+    def _update_file_resources(self, file_definitions: List[ManifestFile], file_resources: List[Resource]):
+        self._update_resources(
+            resource_updates=self._file_resource_updates(file_definitions, file_resources),
             region_id=self._region_id
         )
-        file_resource_ids = [r.id for r in file_resources]
-        logger.info(f'Created file resources: {file_resource_ids}')
+        logger.info(f'Created file resources: {[r.id for r in file_resources]}')
 
-        complete_resources = self.get_all_resources(resource_ids=file_resource_ids)
+    def _get_file_resources(self, file_definitions: List[ManifestFile],
+                            file_resources: List[Resource]) -> Dict[str, Resource]:
+        complete_resources = self.get_all_resources(resource_ids=[r.id for r in file_resources])
         return {
             file_def.associative_id: resource for file_def, resource in zip(file_definitions, complete_resources)
         }
 
     def _create_work_product_component_resources(
+            self,
+            work_product_component_descriptions: List[WorkProductComponentManifest]
+    ) -> List[Resource]:
+        return self._create_resources(
+            resource_inits=self._work_product_component_resource_inits(work_product_component_descriptions),
+            region_id=self._region_id
+        )
+
+    def _update_work_product_component_resources(
             self,
             work_product_component_descriptions: List[WorkProductComponentManifest],
+            wpc_resources: List[Resource],
             associative_id_to_file_resource_id_map: Dict[str, SRN]
     ) -> List[SRN]:
-        wpc_resources = self._data_api_client.create_resources(
-            resource_inits=[
-                ResourceInit(
-                    type=wpc_description.resource_type_id,
-                    new_version=False,
-                ) for wpc_description in work_product_component_descriptions
-            ],
+        self._update_resources(
+            self._work_product_component_resource_updates(
+                work_product_component_descriptions, wpc_resources, associative_id_to_file_resource_id_map
+            ),
+            region_id=self._region_id
+        )
+
+        wpc_resource_ids = [r.id for r in wpc_resources]
+        logger.info(f'Created WorkProductComponent resources: {wpc_resource_ids}')
+
+        return wpc_resource_ids
+
+    def _create_work_product(self, work_product_description: WorkProductManifest) -> Resource:
+        return self._create_resources(
+            resource_inits=[self._work_product_resource_init(work_product_description)],
+            region_id=self._region_id
+        )[0]
+
+    def _update_work_product(
+            self,
+            work_product_description: WorkProductManifest,
+            wp_resource: Resource,
+            work_product_component_ids: List[SRN]
+    ):
+        self._update_resources(
+            [self._work_product_resource_update(work_product_description, wp_resource, work_product_component_ids)],
             region_id=self._region_id
         )
 
+        logger.info(f'Created WorkProduct resource: {wp_resource.id}')
+
+    @staticmethod
+    def _file_resource_inits(file_definitions: List[ManifestFile]) -> List[ResourceInit]:
+        return [
+            ResourceInit(
+                type=file_def.resource_type_id,
+                new_version=False,
+            ) for file_def in file_definitions
+        ]
+
+    @staticmethod
+    def _file_resource_updates(file_definitions: List[ManifestFile],
+                               file_resources: List[Resource]) -> List[ResourceUpdate]:
+        return [
+            ResourceUpdate(
+                id=resource.id,
+                data=file_def.data.asdict(),
+                lifecycle_status=ResourceLifecycleStatus.LOADING
+            ) for resource, file_def in zip(file_resources, file_definitions)
+        ]
+
+    @staticmethod
+    def _work_product_component_resource_inits(
+            work_product_component_descriptions: List[WorkProductComponentManifest]
+    ) -> List[ResourceInit]:
+        return [
+            ResourceInit(
+                type=wpc_description.resource_type_id,
+                new_version=False,
+            ) for wpc_description in work_product_component_descriptions
+        ]
+
+    @staticmethod
+    def _work_product_component_resource_updates(
+            work_product_component_descriptions: List[WorkProductComponentManifest],
+            wpc_resources: List[Resource],
+            associative_id_to_file_resource_id_map: Dict[str, SRN]
+    ) -> List[ResourceUpdate]:
         wpc_id_to_new_data_map = {}
         for wpc_description, wpc_resource in zip(work_product_component_descriptions, wpc_resources):
             all_files = wpc_description.data.group_type_properties.files + [
@@ -206,36 +782,27 @@ class DataAPIService:
             )
             wpc_id_to_new_data_map[wpc_resource.id] = new_data
 
-        self._data_api_client.update_resources(
-            [
-                ResourceUpdate(
-                    id=id_,
-                    data=data.asdict(),
-                    lifecycle_status=ResourceLifecycleStatus.LOADING
-                ) for id_, data in wpc_id_to_new_data_map.items()
-            ], region_id=self._region_id
+        return [
+            ResourceUpdate(
+                id=id_,
+                data=data.asdict(),
+                lifecycle_status=ResourceLifecycleStatus.LOADING
+            ) for id_, data in wpc_id_to_new_data_map.items()
+        ]
+
+    @staticmethod
+    def _work_product_resource_init(work_product_description: WorkProductManifest) -> ResourceInit:
+        return ResourceInit(
+            type=work_product_description.resource_type_id,
+            new_version=False,
         )
 
-        wpc_resource_ids = [r.id for r in wpc_resources]
-        logger.info(f'Created WorkProductComponent resources: {wpc_resource_ids}')
-
-        return wpc_resource_ids
-
-    def _create_work_product(
-            self,
+    @staticmethod
+    def _work_product_resource_update(
             work_product_description: WorkProductManifest,
+            wp_resource: Resource,
             work_product_component_ids: List[SRN]
-    ) -> Resource:
-        wp_resource = self._data_api_client.create_resources(
-            resource_inits=[
-                ResourceInit(
-                    type=work_product_description.resource_type_id,
-                    new_version=False,
-                )
-            ],
-            region_id=self._region_id
-        )[0]
-
+    ) -> ResourceUpdate:
         all_components = work_product_description.data.group_type_properties.components + work_product_component_ids
         new_data = attr.evolve(
             work_product_description.data,
@@ -245,18 +812,8 @@ class DataAPIService:
             )
         )
 
-        self._data_api_client.update_resources(
-            [
-                ResourceUpdate(
-                    id=wp_resource.id,
-                    data=new_data.asdict(),
-                    lifecycle_status=ResourceLifecycleStatus.LOADING
-                )
-            ],
-            region_id=self._region_id
+        return ResourceUpdate(
+            id=wp_resource.id,
+            data=new_data.asdict(),
+            lifecycle_status=ResourceLifecycleStatus.LOADING
         )
-
-        logger.info(f'Created WorkProduct resource: {wp_resource.id}')
-
-        complete_resource = self.get_all_resources(resource_ids=[wp_resource.id])[0]
-        return complete_resource
@@ -2,7 +2,7 @@ import logging
 import time
 from functools import partial
 from itertools import islice
-from typing import List, Optional, Iterable
+from typing import Callable, Dict, List, Optional, Iterable, Tuple, Union
 
 import attr
 from attr.validators import instance_of, optional
@@ -11,16 +11,22 @@ from pampy import match
 from osdu_commons.clients.delivery_client import DeliveryClient, GetResourcesResponseSuccess, \
     GetResourcesResponseNotFound, GetResourcesResultItem
 from osdu_commons.model.aws import S3Location
+from osdu_commons.model.resource_batch import ResourceBatch
 from osdu_commons.utils import convert
+from osdu_commons.utils.batching import BatchingConfig, MicroBatcher
+from osdu_commons.utils.disk_resource_cache import DiskResourceCache
+from osdu_commons.utils.resource_cache import ResourceCache
 from osdu_commons.utils.srn import SRN
 from osdu_commons.utils.validators import list_of
 
 logger = logging.getLogger(__name__)
 
 MAX_RESOURCES_FETCHING_ATTEMPTS = 5
+# DeliveredResources are cached apart from the Resources of DataAPIService, so that both can share a cache
+DELIVERED_RESOURCE_CACHE_KIND = 'delivered_resource'
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class DeliveredResource:
     srn: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
     exists: bool = attr.ib(validator=instance_of(bool))
@@ -28,6 +34,10 @@ class DeliveredResource:
     s3_location: Optional[S3Location] = attr.ib(validator=optional(instance_of(S3Location)), default=None)
     temporary_credentials: Optional[dict] = attr.ib(validator=optional(instance_of(dict)), default=None)
 
+    @property
+    def group_type_properties(self) -> dict:
+        return self.data.get('GroupTypeProperties', {}) if self.data is not None else {}
+
     @classmethod
     def from_json(cls, json_object, credentials, exists=True):
         return cls(
@@ -49,7 +59,7 @@ class DeliveredResource:
         )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class DeliveredResponse:
     delivery_resources: List[DeliveredResource] = attr.ib(validator=list_of(instance_of(DeliveredResource)))
     not_found_resources: List[DeliveredResource] = attr.ib(validator=list_of(instance_of(DeliveredResource)))
@@ -63,27 +73,93 @@ class DeliveryServiceException(object):
 class DeliveryService:
     MAX_GET_RESOURCES_BATCH_SIZE = 100
 
-    def __init__(self, delivery_client: DeliveryClient):
+    def __init__(self, delivery_client: DeliveryClient, batching: BatchingConfig = None,
+                 resource_cache: Union[ResourceCache, DiskResourceCache] = None):
         self._delivery_client = delivery_client
+        self._resources_batcher = MicroBatcher(self._get_resources_batch, batching) if batching is not None else None
+        self._resource_cache = resource_cache
 
     def get_resources(self, resource_ids: Iterable[SRN]) -> Iterable[DeliveredResource]:
         resource_ids = iter(resource_ids)
         srns_to_fetch = list(islice(resource_ids, self.MAX_GET_RESOURCES_BATCH_SIZE))
         while len(srns_to_fetch) > 0:
-            yield from self.get_resources_batch_unordered(srns_to_fetch)
+            yield from self._get_resources_batch_unordered_cached(srns_to_fetch)
             srns_to_fetch = list(islice(resource_ids, self.MAX_GET_RESOURCES_BATCH_SIZE))
 
+    def _get_resources_batch_unordered_cached(self, resource_ids: List[SRN]) -> Iterable[DeliveredResource]:
+        cached_resources, srns_to_fetch = self._get_cached_resources(resource_ids)
+        yield from cached_resources
+        if not srns_to_fetch:
+            return
+
+        yield from self._fetch_with_retries(srns_to_fetch, self._fetch_and_cache_delivered_resources)
+
+    def get_resources_as_batch(self, resource_ids: Iterable[SRN]) -> ResourceBatch:
+        """ Columnar version of get_resources, rows are unordered and include not found resources. """
+        batches = []
+        resource_ids = iter(resource_ids)
+        srns_to_fetch = list(islice(resource_ids, self.MAX_GET_RESOURCES_BATCH_SIZE))
+        while len(srns_to_fetch) > 0:
+            batches.extend(self._get_resource_batches_unordered(srns_to_fetch))
+            srns_to_fetch = list(islice(resource_ids, self.MAX_GET_RESOURCES_BATCH_SIZE))
+        return ResourceBatch.concat(batches) if batches else ResourceBatch.from_delivery_items([])
+
+    def _get_resource_batches_unordered(self, resource_ids: List[SRN]) -> Iterable[ResourceBatch]:
+        cached_resources, srns_to_fetch = self._get_cached_resources(resource_ids)
+        if cached_resources:
+            yield ResourceBatch.from_delivery_items(cached_resources)
+        if not srns_to_fetch:
+            return
+
+        for batch in self._fetch_with_retries(srns_to_fetch, self._fetch_resource_batch):
+            if self._resource_cache is not None:
+                self._cache_resources([
+                    DeliveredResource(srn=row.srn, exists=row.exists, data=row.data, s3_location=row.s3_location)
+                    for row in batch
+                ])
+            yield batch
+
+    def _fetch_resource_batch(self, resource_ids: List[SRN]) -> Tuple[List[ResourceBatch], List[SRN]]:
+        get_resources_response = self._delivery_client.get_resources(resource_ids)
+        if isinstance(get_resources_response, GetResourcesResponseNotFound):
+            not_found_srns = get_resources_response.not_found_resource_ids
+            not_found_batch = ResourceBatch.from_delivery_items(
+                [GetResourcesResultItem(srn=srn) for srn in not_found_srns], exists=False
+            )
+            return [not_found_batch], list(set(resource_ids) - set(not_found_srns))
+
+        batch = ResourceBatch.from_delivery_items(
+            get_resources_response.result, get_resources_response.temporary_credentials
+        )
+        return [batch], get_resources_response.unprocessed_srn
+
     def get_resources_batch_unordered(self, resource_ids: List[SRN]) -> Iterable[DeliveredResource]:
-        srns_to_fetch = set(resource_ids)
+        return self._fetch_with_retries(resource_ids, self._fetch_delivered_resources)
+
+    def _fetch_delivered_resources(self, resource_ids: List[SRN]) -> Tuple[List[DeliveredResource], List[SRN]]:
+        delivered_response = self.get_resources_batch_unordered_response(resource_ids)
+        return (
+            delivered_response.delivery_resources + delivered_response.not_found_resources,
+            delivered_response.unprocessed_srn
+        )
+
+    def _fetch_and_cache_delivered_resources(self, resource_ids: List[SRN]) \
+            -> Tuple[List[DeliveredResource], List[SRN]]:
+        delivered_resources, unprocessed_srns = self._fetch_delivered_resources(resource_ids)
+        self._cache_resources(delivered_resources)
+        return delivered_resources, unprocessed_srns
+
+    @staticmethod
+    def _fetch_with_retries(resource_ids: List[SRN], fetch: Callable[[List[SRN]], Tuple[list, List[SRN]]]) -> Iterable:
+        """ Yields results of fetch, fetching unprocessed SRNs again with exponential backoff. """
+        srns_to_fetch = list(set(resource_ids))
         for i in range(MAX_RESOURCES_FETCHING_ATTEMPTS):
-            delivered_response = self.get_resources_batch_unordered_response(srns_to_fetch)
-            yield from delivered_response.delivery_resources
-            yield from delivered_response.not_found_resources
+            results, srns_to_fetch = fetch(srns_to_fetch)
+            yield from results
 
-            srns_to_fetch = delivered_response.unprocessed_srn
             if len(srns_to_fetch) == 0:
                 break
-            logger.debug(f'Unprocessed srns: {delivered_response.unprocessed_srn} after {i} attempt')
+            logger.debug(f'Unprocessed srns: {srns_to_fetch} after {i} attempt')
 
             if i < MAX_RESOURCES_FETCHING_ATTEMPTS - 1:
                 time.sleep(2 ** i)
@@ -91,6 +167,30 @@ class DeliveryService:
         if len(srns_to_fetch) > 0:
             raise Exception(f'Cannot fetch srns: {srns_to_fetch}')
 
+    def _get_cached_resources(self, resource_ids: List[SRN]) -> Tuple[List[DeliveredResource], List[SRN]]:
+        if self._resource_cache is None:
+            return [], resource_ids
+
+        cached_resources, srns_to_fetch = [], []
+        for resource_id in resource_ids:
+            delivered_resource = self._resource_cache.get(resource_id, DELIVERED_RESOURCE_CACHE_KIND)
+            if delivered_resource is None:
+                srns_to_fetch.append(resource_id)
+            else:
+                cached_resources.append(delivered_resource)
+        return cached_resources, srns_to_fetch
+
+    def _cache_resources(self, delivered_resources: List[DeliveredResource]):
+        """ Caches resources of one fetch in one put_many. """
+        if self._resource_cache is None:
+            return
+        # Resources in S3 need fresh temporary credentials, credentials are never cached
+        self._resource_cache.put_many([
+            (delivered_resource.srn, attr.evolve(delivered_resource, temporary_credentials=None))
+            for delivered_resource in delivered_resources
+            if delivered_resource.exists and delivered_resource.s3_location is None
+        ], DELIVERED_RESOURCE_CACHE_KIND)
+
     def get_resources_batch_unordered_response(self, resource_ids: Iterable[SRN]) -> DeliveredResponse:
         srns_to_fetch = list(resource_ids)
         get_resources_response = self._delivery_client.get_resources(srns_to_fetch)
@@ -127,17 +227,37 @@ class DeliveryService:
         )
 
     def get_resource(self, resource_id: SRN) -> DeliveredResource:
+        if self._resources_batcher is not None:
+            return self._resources_batcher.get(resource_id)
+
         get_resources_result = list(self.get_resources([resource_id]))
         assert len(get_resources_result) == 1
         return get_resources_result[0]
 
+    def close(self):
+        if self._resources_batcher is not None:
+            self._resources_batcher.close()
+
+    def _get_resources_batch(self, resource_ids: List[SRN]) -> Dict[SRN, DeliveredResource]:
+        delivered_resources = {}
+        try:
+            for delivered_resource in self._get_resources_batch_unordered_cached(resource_ids):
+                delivered_resources[delivered_resource.srn] = delivered_resource
+        except Exception:
+            if not delivered_resources:
+                raise
+            # SRNs still unprocessed after all attempts fail only for their callers
+            logger.exception(f'Cannot fetch all of {resource_ids}')
+
+        return {srn: delivered_resources[srn] for srn in resource_ids if srn in delivered_resources}
+
     def check_if_resources_exist(self, resource_ids: Iterable[SRN]) -> bool:
         resources = self.get_resources(resource_ids)
         return all(resource.exists for resource in resources)
 
     def get_components_of_type(self, resource_id: SRN, component_type: str) -> Iterable[DeliveredResource]:
         resource = self.get_resource(resource_id)
-        components_ids = [SRN.from_string(item) for item in resource.data['GroupTypeProperties']['Components']]
+        components_ids = [SRN.from_string(item) for item in resource.group_type_properties['Components']]
         components_ids_with_requested_type = [
             component_id for component_id in components_ids if component_id.type == component_type
         ]
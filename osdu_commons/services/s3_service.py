@@ -16,13 +16,13 @@ COPYING_MAX_CONCURRENCY = 50
 THREE_DAYS_IN_SECONDS = 3 * 24 * 60 * 60
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class CopySpecification:
     source: S3Location = attr.ib(validator=instance_of(S3Location))
     target: S3Location = attr.ib(validator=instance_of(S3Location))
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class PresignedURLPostFields:
     key: str = attr.ib(validator=instance_of(str))
     aws_access_key_id: str = attr.ib(validator=instance_of(str))
@@ -52,7 +52,7 @@ class PresignedURLPostFields:
         return result
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class PresignedURLPost:
     url: str = attr.ib(validator=instance_of(str))
     fields: PresignedURLPostFields = attr.ib(validator=instance_of(PresignedURLPostFields))
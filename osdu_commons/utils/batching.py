@@ -0,0 +1,125 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Iterable, List, Tuple
+
+import attr
+from attr.validators import instance_of
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'BatchingConfig',
+    'MicroBatcher',
+    'MissingBatchResult',
+]
+
+
+class MissingBatchResult(LookupError):
+    pass
+
+
+@attr.s(frozen=True, slots=True)
+class BatchingConfig:
+    max_batch_size: int = attr.ib(validator=instance_of(int), default=100)
+    max_wait_ms: int = attr.ib(validator=instance_of(int), default=5)
+    max_concurrent_batches: int = attr.ib(validator=instance_of(int), default=4)
+
+
+class MicroBatcher:
+    """ Collects single-key lookups from many threads and resolves them with one batch_function call per batch.
+
+    A batch is sent when it reaches max_batch_size or when its oldest key waited max_wait_ms. batch_function gets
+    unique keys and returns a dict from key to result; keys missing from that dict fail with MissingBatchResult and an
+    exception raised by batch_function fails every caller of the batch.
+    """
+
+    def __init__(self, batch_function: Callable[[List[Hashable]], Dict[Hashable, object]],
+                 config: BatchingConfig = None):
+        self._batch_function = batch_function
+        self._config = config if config is not None else BatchingConfig()
+
+        self._condition = threading.Condition()
+        self._pending: List[Tuple[Hashable, Future]] = []
+        self._pending_since = None
+        self._closed = False
+        self._worker = None
+        self._executor = None
+
+    def submit(self, key: Hashable) -> Future:
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('Cannot submit to closed MicroBatcher')
+            self._ensure_worker_started()
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending.append((key, future))
+            self._condition.notify()
+        return future
+
+    def get(self, key: Hashable):
+        return self.submit(key).result()
+
+    def get_many(self, keys: Iterable[Hashable]) -> list:
+        futures = [self.submit(key) for key in keys]
+        return [future.result() for future in futures]
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            worker = self._worker
+        if worker is not None:
+            worker.join()
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _ensure_worker_started(self):
+        if self._worker is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._config.max_concurrent_batches)
+            self._worker = threading.Thread(target=self._run, daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+
+                deadline = self._pending_since + self._config.max_wait_ms / 1000
+                while len(self._pending) < self._config.max_batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch = self._pending[:self._config.max_batch_size]
+                self._pending = self._pending[self._config.max_batch_size:]
+                self._pending_since = time.monotonic()
+
+            self._executor.submit(self._flush, batch)
+
+    def _flush(self, batch: List[Tuple[Hashable, Future]]):
+        keys = list(dict.fromkeys(key for key, _ in batch))
+        logger.debug(f'Flushing batch of {len(keys)} keys for {len(batch)} callers')
+        try:
+            results = self._batch_function(keys)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for key, future in batch:
+            if key in results:
+                future.set_result(results[key])
+            else:
+                future.set_exception(MissingBatchResult(f'No result for {key}'))
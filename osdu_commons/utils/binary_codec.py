@@ -0,0 +1,380 @@
+import importlib
+import io
+import pickle
+from array import array
+from datetime import datetime, timedelta
+from enum import Enum
+from functools import lru_cache
+from types import ModuleType
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import arrow
+import attr
+from dateutil import tz
+
+from osdu_commons.model.resource_batch import ResourceBatch, ResourceRow, _DictionaryColumn
+from osdu_commons.utils.frozen import FrozenDict, FrozenList
+from osdu_commons.utils.srn import SRN
+from osdu_commons.utils.trusted import resolve_trusted_decode
+
+__all__ = [
+    'BinaryFormatError',
+    'OUT_OF_BAND_THRESHOLD',
+    'dumps',
+    'loads',
+]
+
+MAGIC = b'OSDB'
+FORMAT_VERSION = 2
+# Bytes-like values and arrays of at least this many bytes go to buffer_callback when one is given
+OUT_OF_BAND_THRESHOLD = 4096
+
+# Highest protocol of Python 3.6, out-of-band buffers are passed through persistent ids instead of protocol 5
+_PICKLE_PROTOCOL = 4
+_PACKAGE = 'osdu_commons'
+_HEADER = MAGIC + bytes([FORMAT_VERSION])
+_UTC = tz.tzutc()
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_SECOND = timedelta(seconds=1)
+_ARRAY_RECONSTRUCTOR = array('b').__reduce_ex__(_PICKLE_PROTOCOL)[0]
+# Model classes encoded by their state besides attrs classes and enums
+_COLUMNAR_CLASSES = frozenset([ResourceBatch, ResourceRow, _DictionaryColumn])
+
+
+class BinaryFormatError(ValueError):
+    pass
+
+
+class _Unset:
+    """ Encoded value of a slot which is not set. """
+
+
+def dumps(obj, buffer_callback: Callable[[memoryview], None] = None) -> bytes:
+    """ Serializes models of osdu_commons, their values and JSON-like data to bytes.
+
+    The payload is pickle with a restricted set of types. Objects are stored as their attribute state together with
+    a schema - the class and its attribute names - so data written by an older version of a class can be read as long
+    as removed attributes are not present and added ones have defaults. When buffer_callback is given, large
+    bytes-like values and arrays, like raw Data of LazyResource or columns of ResourceBatch, are passed to it in order
+    of appearance instead of being copied into the result, as in pickle protocol 5.
+    """
+    buffer = io.BytesIO()
+    buffer.write(_HEADER)
+    pickler = _Pickler(buffer, _PICKLE_PROTOCOL)
+    if buffer_callback is not None:
+        pickler.persistent_id = _OutOfBandBuffers(buffer_callback)
+    try:
+        pickler.dump(obj)
+    except pickle.PicklingError as e:
+        raise BinaryFormatError(f'Cannot encode {obj!r:.100}: {e}') from e
+    return buffer.getvalue()
+
+
+def loads(data, buffers: Iterable = None, trusted: Optional[bool] = None):
+    """ Deserializes result of dumps. buffers are the out-of-band buffers passed to buffer_callback of dumps.
+
+    Trusted decode restores objects without calling validators, converters or __init__, so it is meant for data
+    written by dumps of our own processes and caches only. Otherwise attrs validators run on restored attributes.
+    Only classes defined in modules of the osdu_commons package are resolved and they are never called, so payloads
+    cannot run code.
+    """
+    view = memoryview(data)
+    if bytes(view[:len(MAGIC)]) != MAGIC:
+        raise BinaryFormatError('Not an osdu_commons binary payload')
+    if len(view) <= len(_HEADER) or view[len(MAGIC)] != FORMAT_VERSION:
+        raise BinaryFormatError(f'Unsupported format version, expected {FORMAT_VERSION}')
+
+    unpickler = _Unpickler(
+        io.BytesIO(view[len(_HEADER):]), list(buffers) if buffers is not None else [], resolve_trusted_decode(trusted)
+    )
+    try:
+        return unpickler.load()
+    except (pickle.UnpicklingError, EOFError, IndexError) as e:
+        raise BinaryFormatError(f'Corrupted binary payload: {e}') from e
+
+
+class _Reducers(dict):
+    """ dispatch_table of _Pickler, reducers of classes of osdu_commons are created on first use. """
+
+    def __missing__(self, cls: type) -> Callable:
+        if issubclass(cls, type):
+            # Classes with a metaclass, like enums of schemas, are stored by reference
+            raise KeyError(cls)
+        reducer = self[cls] = _make_reducer(cls)
+        return reducer
+
+
+class _Pickler(pickle.Pickler):
+    dispatch_table = _Reducers({
+        SRN: lambda value: (SRN.from_string, (str(value),)),
+        arrow.Arrow: lambda value: _reduce_arrow(value),
+        FrozenDict: FrozenDict.__reduce__,
+        FrozenList: FrozenList.__reduce__,
+        bytearray: lambda value: value.__reduce_ex__(_PICKLE_PROTOCOL),
+        memoryview: lambda value: (memoryview, (value.tobytes(),)),
+        array: lambda value: value.__reduce_ex__(_PICKLE_PROTOCOL),
+        type(_ARRAY_RECONSTRUCTOR): lambda value: _reduce_builtin_function(value),
+    })
+
+
+class _OutOfBandBuffers:
+    """ persistent_id of _Pickler passing large bytes to buffer_callback, they are referenced by their position. """
+
+    def __init__(self, buffer_callback: Callable[[memoryview], None]):
+        self._buffer_callback = buffer_callback
+        self._buffers = 0
+
+    def __call__(self, value) -> Optional[int]:
+        if value.__class__ is not bytes or len(value) < OUT_OF_BAND_THRESHOLD:
+            return None
+        self._buffer_callback(memoryview(value))
+        self._buffers += 1
+        return self._buffers - 1
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file, buffers: list, trusted: bool):
+        super().__init__(file)
+        self._buffers = buffers
+        self._validate = not trusted and attr.get_run_validators()
+        self._restorers: Dict[type, Callable] = {}
+
+    def find_class(self, module: str, name: str):
+        value = _GLOBALS.get((module, name))
+        if value is not None:
+            return value
+        cls = _resolve_class(module, name)
+        restorer = self._restorers.get(cls)
+        if restorer is None:
+            restorer = self._restorers[cls] = \
+                _enum_restorer(cls) if issubclass(cls, Enum) else _object_restorer(cls, self._validate)
+        return restorer
+
+    def persistent_load(self, pid):
+        try:
+            buffer = self._buffers[pid]
+        except (IndexError, TypeError):
+            raise BinaryFormatError(f'Missing out-of-band buffer {pid}') from None
+        return buffer if type(buffer) is bytes else bytes(buffer)
+
+
+def _reduce_builtin_function(value) -> str:
+    """ Reduces the builtin functions which pickle uses to restore values, like arrays, to their names. """
+    if value is not _ARRAY_RECONSTRUCTOR:
+        raise BinaryFormatError(f'Cannot encode {value!r}')
+    return value.__name__
+
+
+def _reduce_arrow(value: arrow.Arrow) -> tuple:
+    timestamp = value.datetime
+    return _restore_arrow, ((timestamp - _EPOCH) // _MICROSECOND, timestamp.utcoffset() // _SECOND)
+
+
+def _restore_arrow(microseconds: int, offset_seconds: int) -> arrow.Arrow:
+    timestamp = _EPOCH + timedelta(microseconds=microseconds)
+    if offset_seconds:
+        timestamp = timestamp.astimezone(tz.tzoffset(None, offset_seconds))
+    # Sets the instance state directly like pickle does, Arrow.__init__ would rebuild the datetime from its fields
+    result = object.__new__(arrow.Arrow)
+    result.__dict__['_datetime'] = timestamp
+    return result
+
+
+# Globals which payloads may reference besides classes of osdu_commons, by module and name
+_GLOBALS = {
+    ('osdu_commons.utils.srn', 'SRN.from_string'): SRN.from_string,
+    ('osdu_commons.utils.frozen', 'FrozenDict'): FrozenDict,
+    ('osdu_commons.utils.frozen', 'FrozenList'): FrozenList,
+    (__name__, '_restore_arrow'): _restore_arrow,
+    (__name__, '_Unset'): _Unset,
+    ('builtins', 'bytearray'): bytearray,
+    ('builtins', 'memoryview'): memoryview,
+    ('array', 'array'): array,
+    ('array', '_array_reconstructor'): _ARRAY_RECONSTRUCTOR,
+}
+
+
+def _make_reducer(cls: type) -> Callable:
+    """ Creates the reducer of enums and objects of cls, which is pickled as (cls, (names, *values)). """
+    if not _is_model_class(cls):
+        raise BinaryFormatError(f'Cannot encode {cls.__module__}.{cls.__qualname__}')
+    if issubclass(cls, Enum):
+        return lambda value: (cls, (value.name,))
+    if _has_instance_dict(cls):
+        return _reduce_dynamic
+
+    globs, items = {'_cls': cls, '_names': _state_names(cls), '_reduce_dynamic': _reduce_dynamic}, []
+    for name, descriptor in _state_descriptors(cls):
+        if getattr(cls, name, None) is descriptor:
+            items.append(f'o.{name}')
+        else:
+            globs[f'_get_{name}'] = descriptor.__get__
+            items.append(f'_get_{name}(o)')
+    return _compile('reduce', 'o', [
+        'try:',
+        f'    return _cls, (_names, {"".join(f"{item}, " for item in items)})',
+        'except AttributeError:',
+        '    return _reduce_dynamic(o)',
+    ], globs, cls)
+
+
+# Attribute names of objects with a __dict__ are shared, so that pickle stores them once per payload
+_dynamic_names: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _reduce_dynamic(value) -> tuple:
+    """ Reduces value which has a __dict__ or unset slots, reading it attribute by attribute. """
+    names, values = list(_state_names(type(value))), []
+    for name, descriptor in _state_descriptors(type(value)):
+        try:
+            values.append(descriptor.__get__(value))
+        except AttributeError:
+            values.append(_Unset)
+    instance_dict = getattr(value, '__dict__', None)
+    if instance_dict:
+        names.extend(instance_dict)
+        values.extend(instance_dict.values())
+    names = _dynamic_names.setdefault(tuple(names), tuple(names))
+    return type(value), (names, *values)
+
+
+def _has_instance_dict(cls: type) -> bool:
+    return any('__dict__' in klass.__dict__ for klass in cls.__mro__ if klass is not object)
+
+
+@lru_cache(maxsize=None)
+def _state_descriptors(cls: type) -> Tuple[Tuple[str, object], ...]:
+    """ Slot descriptors of cls and its bases, taken from the defining class as subclasses may shadow them. """
+    descriptors = {}
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if not name.startswith('__'):
+                descriptors[name] = klass.__dict__[name]
+    return tuple(descriptors.items())
+
+
+@lru_cache(maxsize=None)
+def _state_names(cls: type) -> Tuple[str, ...]:
+    return tuple(name for name, _ in _state_descriptors(cls))
+
+
+@lru_cache(maxsize=None)
+def _resolve_class(module: str, qualname: str) -> type:
+    """ Resolves a model class defined in module of osdu_commons under qualname, never names imported there. """
+    if module.split('.')[0] != _PACKAGE:
+        raise BinaryFormatError(f'{module}.{qualname} is outside of {_PACKAGE}')
+    try:
+        cls = importlib.import_module(module)
+        for part in qualname.split('.'):
+            cls = getattr(cls, part)
+            if isinstance(cls, ModuleType):
+                raise BinaryFormatError(f'{module}.{qualname} goes through module {cls.__name__}')
+    except (ImportError, AttributeError) as e:
+        raise BinaryFormatError(f'Cannot resolve class {module}.{qualname}') from e
+    if not isinstance(cls, type) or cls.__module__ != module or cls.__qualname__ != qualname:
+        raise BinaryFormatError(f'{module}.{qualname} is not a class defined in {module}')
+    if not _is_model_class(cls):
+        raise BinaryFormatError(f'{module}.{qualname} is not a model class')
+    return cls
+
+
+def _is_model_class(cls: type) -> bool:
+    """ Whether instances of cls are encoded by their state: attrs classes and enums of osdu_commons, and the columns
+    of ResourceBatch.
+    """
+    return cls.__module__.split('.')[0] == _PACKAGE and '<locals>' not in cls.__qualname__ and \
+        (attr.has(cls) or issubclass(cls, Enum) or cls in _COLUMNAR_CLASSES)
+
+
+def _enum_restorer(cls: type) -> Callable[[str], Enum]:
+    members = cls.__members__
+
+    def restore(name: str) -> Enum:
+        try:
+            return members[name]
+        except (KeyError, TypeError):
+            raise BinaryFormatError(f'{cls.__qualname__} has no member {name!r}') from None
+
+    return restore
+
+
+def _object_restorer(cls: type, validate: bool) -> Callable:
+    """ Returns the function which the unpickler calls instead of cls with (names, *values) of an encoded object. """
+    restores_by_names_id = {}
+
+    def restore(names: Tuple[str, ...], *values):
+        # names are one object per class in a payload, its id avoids hashing them for every object
+        entry = restores_by_names_id.get(id(names))
+        if entry is None or entry[0] is not names:
+            if type(names) is not tuple or not all(type(name) is str for name in names):
+                raise BinaryFormatError(f'Corrupted schema of {cls.__qualname__}')
+            entry = restores_by_names_id[id(names)] = names, _make_restore(cls, names)
+        if len(values) != len(names):
+            raise BinaryFormatError(f'Wrong number of attributes of {cls.__qualname__}')
+        return entry[1](values, validate)
+
+    return restore
+
+
+@lru_cache(maxsize=None)
+def _make_restore(cls: type, names: Tuple[str, ...]) -> Callable:
+    """ Generates a function creating an instance of cls with attributes names set to values, without __init__.
+
+    attrs fields of cls missing in names get their defaults, validators run only when validate is true.
+    """
+    descriptors = dict(_state_descriptors(cls))
+    has_dict = _has_instance_dict(cls)
+    fields = {field.name: field for field in attr.fields(cls)} if attr.has(cls) else {}
+    globs = {'_cls': cls, '_new': object.__new__, '_Unset': _Unset}
+
+    def set_line(name: str, value: str) -> str:
+        if name in descriptors:
+            globs[f'_set_{name}'] = descriptors[name].__set__
+            return f'_set_{name}(o, {value})'
+        if has_dict:
+            return f'o.__dict__[{name!r}] = {value}'
+        raise BinaryFormatError(f'{cls.__qualname__} has no attribute {name}, schema changed')
+
+    values = [f'x_{position}' for position in range(len(names))]
+    lines, validation_lines = ['o = _new(_cls)'], []
+    if names:
+        lines.append(f'{"".join(f"{value}, " for value in values)}= v')
+    for name, value in zip(names, values):
+        lines.extend([
+            f'if {value} is not _Unset:',
+            f'    {set_line(name, value)}',
+        ])
+        field = fields.get(name)
+        # Fields shadowed by a property of cls, like LazyResource.data, are validated by cls on access
+        if field is not None and field.validator is not None and getattr(cls, name, None) is descriptors.get(name):
+            globs[f'_field_{name}'], globs[f'_validator_{name}'] = field, field.validator
+            validation_lines.extend([
+                f'if {value} is not _Unset:',
+                f'    _validator_{name}(o, _field_{name}, {value})',
+            ])
+
+    for name, field in fields.items():
+        if name in names:
+            continue
+        if isinstance(field.default, attr.Factory):
+            globs[f'_factory_{name}'] = field.default.factory
+            lines.append(set_line(name, f'_factory_{name}(o)' if field.default.takes_self else f'_factory_{name}()'))
+        elif field.default is not attr.NOTHING:
+            globs[f'_default_{name}'] = field.default
+            lines.append(set_line(name, f'_default_{name}'))
+        else:
+            raise BinaryFormatError(f'{cls.__qualname__}.{name} is missing and has no default, schema changed')
+
+    if validation_lines:
+        lines.append('if validate:')
+        lines.extend(f'    {line}' for line in validation_lines)
+    lines.append('return o')
+    return _compile('restore', 'v, validate', lines, globs, cls)
+
+
+def _compile(name: str, arguments: str, lines: List[str], globs: dict, cls: type) -> Callable:
+    source = f'def {name}({arguments}):\n' + ''.join(f'    {line}\n' for line in lines)
+    exec(compile(source, f'<generated {name} of {cls.__module__}.{cls.__qualname__}>', 'exec'), globs)
+    return globs[name]
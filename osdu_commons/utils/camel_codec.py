@@ -0,0 +1,222 @@
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import attr
+
+from osdu_commons.utils import convert
+from osdu_commons.utils.srn import SRN
+
+__all__ = [
+    'camel_codec',
+    'decode_camel',
+    'encode_camel',
+]
+
+_CAMEL_CASE_WORDS = {'id': 'ID', 'ids': 'IDs'}
+_SRN_CONVERTERS = (convert.srn, convert.resource_security_classification)
+_INSTANCE_OF_VALIDATOR = type(attr.validators.instance_of(object))
+_OPTIONAL_VALIDATOR = type(attr.validators.optional(attr.validators.instance_of(object)))
+
+
+@attr.s(frozen=True, slots=True)
+class _CodecOptions:
+    key_order: Optional[Sequence[str]] = attr.ib(default=None)
+    omit_none: bool = attr.ib(default=False)
+
+
+_options: Dict[type, _CodecOptions] = {}
+_decoders: Dict[type, Callable] = {}
+_encoders: Dict[type, Callable] = {}
+_lock = threading.RLock()
+
+
+def camel_codec(key_order: Sequence[str] = None, omit_none: bool = False):
+    """ Class decorator registering an attrs class for generated CamelCase decoding and encoding.
+
+    Has to be applied on top of attr.s. key_order lists field names in the order of encoded keys, by default the order
+    of fields. omit_none drops keys with None values from encoded dicts.
+    """
+
+    def register(cls):
+        _options[cls] = _CodecOptions(key_order=key_order, omit_none=omit_none)
+        return cls
+
+    return register
+
+
+def decode_camel(cls, camel_dict):
+    """ Same as convert.class_from_camel_dict(cls)(camel_dict), using the decoder generated for cls. """
+    return _get(_decoders, cls, _make_decoder)(camel_dict)
+
+
+def encode_camel(obj) -> dict:
+    return _get(_encoders, obj.__class__, _make_encoder)(obj)
+
+
+def _get(functions: Dict[type, Callable], cls: type, make: Callable[[type], Callable]) -> Callable:
+    function = functions.get(cls)
+    if function is None:
+        with _lock:
+            function = functions.get(cls)
+            if function is None:
+                function = functions[cls] = make(cls)
+    return function
+
+
+def _make_decoder(cls: type) -> Callable:
+    """ Generates a decoder of CamelCase dicts which have no other keys than the fields of cls.
+
+    The decoder does the work of the attrs generated __init__ straight-line: nested registered classes are decoded by
+    their own generated decoders, converters and validators are called directly and instance_of checks are inlined.
+    Input it does not handle, like unknown or missing keys, goes to the generic class_from_camel_dict converter.
+    """
+    globs = {
+        '_cls': cls, '_fallback': convert.class_from_camel_dict(cls), '_decode_list': _decode_list,
+        '_new': object.__new__, '_setattr': object.__setattr__, '_run_validators': attr.get_run_validators,
+    }
+    fields = [field for field in attr.fields(cls) if field.init]
+    keys = {field.name: _camel_key(field.name) for field in fields}
+    globs['_keys'] = frozenset(keys.values())
+    globs['_required_keys'] = frozenset(keys[field.name] for field in fields if field.default is attr.NOTHING)
+
+    lines = [
+        'if d.__class__ is not dict or not _keys.issuperset(d) or not _required_keys.issubset(d):',
+        '    return _fallback(d)',
+        'self = _new(_cls)',
+    ]
+    validation_lines = []
+    for field in fields:
+        name, key = field.name, keys[field.name]
+        globs[f'_field_{name}'] = field
+        value = f'd[{key!r}]'
+        if isinstance(field.default, attr.Factory):
+            globs[f'_factory_{name}'] = field.default.factory
+            factory_call = f'_factory_{name}(self)' if field.default.takes_self else f'_factory_{name}()'
+            value = f'({value} if {key!r} in d else {factory_call})'
+        elif field.default is not attr.NOTHING:
+            globs[f'_default_{name}'] = field.default
+            value = f'd.get({key!r}, _default_{name})'
+
+        nested_class, is_list = _nested_class(field)
+        if nested_class is not None:
+            globs[f'_decode_{name}'] = _get(_decoders, nested_class, _make_decoder)
+            value = f'_decode_list(_decode_{name}, {value})' if is_list else f'_decode_{name}({value})'
+        if field.converter is not None:
+            globs[f'_converter_{name}'] = field.converter
+            value = f'_converter_{name}({value})'
+        lines.append(f'_value_{name} = {value}')
+        lines.append(f'_setattr(self, {name!r}, _value_{name})')
+
+        if field.validator is not None:
+            globs[f'_validator_{name}'] = field.validator
+            validation_lines.extend(_validation_lines(field, globs))
+
+    if validation_lines:
+        lines.append('if _run_validators():')
+        lines.extend(f'    {line}' for line in validation_lines)
+    if getattr(cls, '__attrs_post_init__', None) is not None:
+        lines.append('self.__attrs_post_init__()')
+    lines.append('return self')
+
+    return _compile(f'decode_{cls.__name__}', 'd', lines, globs, cls)
+
+
+def _validation_lines(field: attr.Attribute, globs: dict) -> List[str]:
+    """ Inlines instance_of and optional(instance_of) checks, the validator itself runs only to raise its error. """
+    name = field.name
+    call = f'_validator_{name}(self, _field_{name}, _value_{name})'
+    validator, optional = field.validator, False
+    if isinstance(validator, _OPTIONAL_VALIDATOR):
+        validator, optional = validator.validator, True
+    if not isinstance(validator, _INSTANCE_OF_VALIDATOR):
+        return [call]
+
+    globs[f'_type_{name}'] = validator.type
+    condition = f'not isinstance(_value_{name}, _type_{name})'
+    if optional:
+        condition = f'_value_{name} is not None and {condition}'
+    return [f'if {condition}:', f'    {call}']
+
+
+def _make_encoder(cls: type) -> Callable:
+    options = _options.get(cls)
+    if options is None:
+        raise TypeError(f'{cls.__qualname__} is not registered with camel_codec')
+
+    globs = {}
+    fields_by_name = {field.name: field for field in attr.fields(cls)}
+    names = options.key_order if options.key_order is not None else list(fields_by_name)
+
+    items = []
+    for name in names:
+        field = fields_by_name[name]
+        source = f'o.{name}'
+        nested_class, is_list = _nested_class(field)
+        if nested_class is not None:
+            globs[f'_encode_{name}'] = _get(_encoders, nested_class, _make_encoder)
+            source = f'[_encode_{name}(item) for item in {source}]' if is_list else f'_encode_{name}({source})'
+        elif _is_srn(field):
+            source = f'str({source})'
+        elif _is_srn_list(field):
+            source = f'[str(item) for item in {source}]'
+        items.append(f'{_camel_key(name)!r}: {source}')
+
+    result = '{' + ', '.join(items) + '}'
+    if options.omit_none:
+        lines = [f'result = {result}', 'return {key: value for key, value in result.items() if value is not None}']
+    else:
+        lines = [f'return {result}']
+    return _compile(f'encode_{cls.__name__}', 'o', lines, globs, cls)
+
+
+def _compile(name: str, argument: str, lines: List[str], globs: dict, cls: type) -> Callable:
+    source = f'def {name}({argument}):\n' + ''.join(f'    {line}\n' for line in lines)
+    exec(compile(source, f'<generated {name} of {cls.__module__}.{cls.__qualname__}>', 'exec'), globs)
+    return globs[name]
+
+
+def _decode_list(decode: Callable, value):
+    if value.__class__ is not list:
+        return value
+    return [decode(item) for item in value]
+
+
+def _camel_key(name: str) -> str:
+    key = ''.join(_CAMEL_CASE_WORDS.get(word, word.capitalize()) for word in name.split('_'))
+    if convert.to_snake_case(key) != name:
+        raise ValueError(f'Cannot derive CamelCase key of field {name}')
+    return key
+
+
+def _nested_class(field: attr.Attribute):
+    """ Returns the registered class of a field annotated with it, List of it or Optional of these, and whether the
+    field is a list. """
+    field_type = _without_optional(field.type)
+    if field_type in _options:
+        return field_type, False
+    item_type = _list_item_type(field_type)
+    if item_type in _options:
+        return item_type, True
+    return None, False
+
+
+def _is_srn(field: attr.Attribute) -> bool:
+    return field.type is SRN or field.converter in _SRN_CONVERTERS
+
+
+def _is_srn_list(field: attr.Attribute) -> bool:
+    return _list_item_type(_without_optional(field.type)) is SRN
+
+
+def _without_optional(field_type):
+    if getattr(field_type, '__origin__', None) is Union:
+        arguments = [argument for argument in field_type.__args__ if argument is not type(None)]
+        if len(arguments) == 1:
+            return arguments[0]
+    return field_type
+
+
+def _list_item_type(field_type):
+    if getattr(field_type, '__origin__', None) in (list, List) and field_type.__args__:
+        return field_type.__args__[0]
+    return None
@@ -1,11 +1,38 @@
 from copy import deepcopy
+from functools import lru_cache
 from typing import Union
 import re
 
+import attr
+
 from osdu_commons.model.enums import SECURITY_CLASSIFICATION_TO_SRN, ResourceSecurityClassification, \
     ResourceCurationStatus, ResourceLifecycleStatus
+from osdu_commons.utils import frozen
 from osdu_commons.utils.srn import SRN, SRNFormatException
 
+SNAKE_CASE_CACHE_SIZE = 4096
+
+_FIRST_CAPITALIZED_WORD = re.compile('([a-z0-9])([A-Z][a-z]+)')
+_CAPITAL_LETTER = re.compile('([a-z0-9])([A-Z])')
+
+
+def _enum_by_srn(enum_type) -> dict:
+    table = {}
+    for member in enum_type:
+        table[member.value] = table[str(member.value)] = member
+    return table
+
+
+# Lookup tables keyed by SRNs and SRN strings. Misses go through the parsing converters below.
+_CURATION_STATUS_BY_SRN = _enum_by_srn(ResourceCurationStatus)
+_LIFECYCLE_STATUS_BY_SRN = _enum_by_srn(ResourceLifecycleStatus)
+_SECURITY_CLASSIFICATION_SRNS = frozenset(SECURITY_CLASSIFICATION_TO_SRN.values())
+_SECURITY_CLASSIFICATION_SRN_BY_KEY = {
+    key: classification_srn
+    for classification, classification_srn in SECURITY_CLASSIFICATION_TO_SRN.items()
+    for key in (classification.value, classification_srn, str(classification_srn))
+}
+
 
 def identity(item):
     return item
@@ -22,6 +49,11 @@ def srn(srn_or_type: Union[SRN, str]) -> SRN:
 
 
 def resource_security_classification(srn_or_str: Union[SRN, str]) -> SRN:
+    try:
+        return _SECURITY_CLASSIFICATION_SRN_BY_KEY[srn_or_str]
+    except (KeyError, TypeError):
+        pass
+
     security_classification_srn = None
 
     if isinstance(srn_or_str, SRN):
@@ -54,7 +86,7 @@ def _convert_security_classification_from_srn_str_or_none(input_str):
 
 
 def _validate_security_classification_srn(srn_):
-    if srn_ not in SECURITY_CLASSIFICATION_TO_SRN.values():
+    if srn_ not in _SECURITY_CLASSIFICATION_SRNS:
         raise TypeError(f'Wrong ResourceSecurityClassification type {srn_}')
 
 
@@ -69,6 +101,10 @@ def copy(item):
     return deepcopy(item)
 
 
+def freeze(item):
+    return frozen.freeze(item)
+
+
 def class_from_dict(class_type):
     def converter(input_dict):
         if isinstance(input_dict, class_type):
@@ -79,38 +115,69 @@ def class_from_dict(class_type):
     return converter
 
 
-def dict_to_snake_case(dict_converter):
-    def to_snake_case(name):
-        s1 = re.sub('([a-z0-9])([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+@lru_cache(maxsize=SNAKE_CASE_CACHE_SIZE)
+def to_snake_case(name: str) -> str:
+    s1 = _FIRST_CAPITALIZED_WORD.sub(r'\1_\2', name)
+    return _CAPITAL_LETTER.sub(r'\1_\2', s1).lower()
+
 
+def dict_to_snake_case(dict_converter):
     def converter(input_dict):
         if isinstance(input_dict, dict):
-            dict_with_snake_case = {}
-            for key, value in input_dict.items():
-                dict_with_snake_case[to_snake_case(key)] = value
-            return dict_converter(dict_with_snake_case)
+            return dict_converter({to_snake_case(key): value for key, value in input_dict.items()})
         else:
             return dict_converter(input_dict)
 
     return converter
 
 
+@lru_cache(maxsize=None)
 def class_from_camel_dict(class_type):
-    return dict_to_snake_case(class_from_dict(class_type))
+    """ Converter building class_type from a dict with CamelCase keys.
+
+    Converters are cached per class, each remembers the snake_case field name of every CamelCase key it has seen.
+    """
+    field_names = {field.name for field in attr.fields(class_type)}
+    field_name_by_key = {}
+
+    def converter(input_dict):
+        if isinstance(input_dict, class_type):
+            return input_dict
+        if not isinstance(input_dict, dict):
+            return class_type(**input_dict)
+
+        kwargs = {}
+        for key, value in input_dict.items():
+            name = field_name_by_key.get(key)
+            if name is None:
+                name = to_snake_case(key)
+                if name in field_names:
+                    field_name_by_key[key] = name
+            kwargs[name] = value
+        return class_type(**kwargs)
+
+    return converter
 
 
 def resource_curation_status(curation_status_or_str: Union[ResourceCurationStatus, str, SRN]) -> ResourceCurationStatus:
-    if isinstance(curation_status_or_str, ResourceCurationStatus):
+    if curation_status_or_str.__class__ is ResourceCurationStatus:
         return curation_status_or_str
+    try:
+        return _CURATION_STATUS_BY_SRN[curation_status_or_str]
+    except (KeyError, TypeError):
+        pass
     if isinstance(curation_status_or_str, (str, SRN)):
         return ResourceCurationStatus(srn(curation_status_or_str))
     raise TypeError(f'Cannot convert {curation_status_or_str}')
 
 
 def resource_lifecycle_status(lifecycle_status_or_str: Union[ResourceLifecycleStatus, str, SRN]) -> ResourceLifecycleStatus:
-    if isinstance(lifecycle_status_or_str, ResourceLifecycleStatus):
+    if lifecycle_status_or_str.__class__ is ResourceLifecycleStatus:
         return lifecycle_status_or_str
+    try:
+        return _LIFECYCLE_STATUS_BY_SRN[lifecycle_status_or_str]
+    except (KeyError, TypeError):
+        pass
     if isinstance(lifecycle_status_or_str, (str, SRN)):
         return ResourceLifecycleStatus(srn(lifecycle_status_or_str))
     raise TypeError(f'Cannot convert {lifecycle_status_or_str}')
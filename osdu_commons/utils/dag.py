@@ -0,0 +1,114 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List
+
+import attr
+from attr.validators import instance_of
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'DagResult',
+    'DagStep',
+    'StepTiming',
+    'run_dag',
+]
+
+
+@attr.s(frozen=True, slots=True)
+class DagStep:
+    """ Named step of a DAG. function is called with results of dependencies passed as keyword arguments. """
+    name: str = attr.ib(validator=instance_of(str))
+    function: Callable = attr.ib()
+    dependencies: List[str] = attr.ib(default=attr.Factory(list))
+
+
+@attr.s(frozen=True, slots=True)
+class StepTiming:
+    """ Start and end of a step in seconds since the start of the DAG run. """
+    start: float = attr.ib(validator=instance_of(float))
+    end: float = attr.ib(validator=instance_of(float))
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@attr.s(frozen=True, slots=True)
+class DagResult:
+    results: Dict[str, object] = attr.ib()
+    timings: Dict[str, StepTiming] = attr.ib()
+    dependencies: Dict[str, List[str]] = attr.ib()
+
+    def critical_path(self) -> List[str]:
+        """ Chain of steps ending with the last finished step, each preceded by its last finished dependency. """
+        if not self.timings:
+            return []
+        path = [max(self.timings, key=lambda name: self.timings[name].end)]
+        while self.dependencies[path[-1]]:
+            path.append(max(self.dependencies[path[-1]], key=lambda name: self.timings[name].end))
+        return list(reversed(path))
+
+
+def run_dag(steps: List[DagStep], max_workers: int = 4) -> DagResult:
+    """ Runs steps as soon as all their dependencies finished, at most max_workers at a time.
+
+    The first exception raised by a step is re-raised after running steps finish; steps which did not start yet are
+    not run.
+    """
+    steps_by_name = {step.name: step for step in steps}
+    _validate(steps_by_name)
+
+    results, timings = {}, {}
+    run_start = time.monotonic()
+
+    def run_step(step: DagStep):
+        start = time.monotonic() - run_start
+        result = step.function(**{dependency: results[dependency] for dependency in step.dependencies})
+        return result, StepTiming(start=start, end=time.monotonic() - run_start)
+
+    waiting = dict(steps_by_name)
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while waiting or running:
+            for name, step in list(waiting.items()):
+                if all(dependency in results for dependency in step.dependencies):
+                    running[executor.submit(run_step, step)] = name
+                    del waiting[name]
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name], timings[name] = future.result()
+                except Exception:
+                    logger.exception(f'Step {name} failed')
+                    wait(running)
+                    raise
+
+    return DagResult(
+        results=results,
+        timings=timings,
+        dependencies={step.name: list(step.dependencies) for step in steps}
+    )
+
+
+def _validate(steps_by_name: Dict[str, DagStep]):
+    visited, in_progress = set(), set()
+
+    def visit(name: str):
+        if name in in_progress:
+            raise ValueError(f'Cycle in DAG involving step {name}')
+        if name in visited:
+            return
+        in_progress.add(name)
+        for dependency in steps_by_name[name].dependencies:
+            if dependency not in steps_by_name:
+                raise ValueError(f'Step {name} depends on unknown step {dependency}')
+            visit(dependency)
+        in_progress.remove(name)
+        visited.add(name)
+
+    for step_name in steps_by_name:
+        visit(step_name)
@@ -0,0 +1,272 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Tuple
+
+from osdu_commons.utils import binary_codec
+from osdu_commons.utils.resource_cache import DEFAULT_KIND, ResourceCacheStats
+from osdu_commons.utils.srn import SRN
+
+__all__ = [
+    'DiskResourceCache',
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE_BYTES = 512 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 60 * 60
+DEFAULT_TIMEOUT_SECONDS = 30
+# Eviction frees space down to this fraction of max_size_bytes, so that it does not run on every put
+EVICTION_TARGET_RATIO = 0.9
+
+# Stays below SQLITE_MAX_VARIABLE_NUMBER of older SQLite versions
+_MAX_QUERY_PARAMETERS = 500
+# Permissions of a new database, readable and writable by its owner only
+_FILE_MODE = 0o600
+
+# Databases of other schema versions are recreated, entries are only a cache
+_SCHEMA_VERSION = 3
+_SCHEMA = [
+    'DROP TABLE IF EXISTS resources',
+    'DROP TABLE IF EXISTS total_size',
+    '''CREATE TABLE resources (
+        namespace TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        key TEXT NOT NULL,
+        resource_id TEXT NOT NULL,
+        payload BLOB,
+        target TEXT,
+        size INTEGER NOT NULL,
+        stored_at REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        PRIMARY KEY (namespace, kind, key)
+    )''',
+    'CREATE INDEX resources_by_resource_id ON resources (resource_id)',
+    'CREATE INDEX resources_by_stored_at ON resources (stored_at)',
+    'CREATE TABLE total_size (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)',
+    'INSERT INTO total_size VALUES (0, 0)',
+    f'PRAGMA user_version = {_SCHEMA_VERSION}',
+]
+
+
+class DiskResourceCache:
+    """ Resource cache persisted in a SQLite database, shared by the threads and processes of one host.
+
+    Keys follow ResourceCache: SRNs without version mean the latest known version, SRNs with version are pinned.
+    Payloads of resources with a versioned id are stored once under that id, the key without version only points at
+    it.
+    The database runs in WAL mode so readers never block each other nor the writer, writers serialize on the
+    database lock. Entries expire after the TTL of the longest matching prefix of their resource type in
+    ttl_seconds_by_type_prefix (e.g. {'reference-data/': 24 * 60 * 60}) or ttl_seconds. When payloads take more than
+    max_size_bytes expired and then the oldest entries are evicted. Caches with different namespaces share the file
+    and its size limit but not entries. Like in ResourceCache entries are keyed by kind too, invalidation removes
+    entries of all namespaces and kinds.
+
+    Resources are stored with binary_codec, stats report size and max_size in bytes of payloads. put_many stores all
+    resources of one fetch in one transaction. The database is created readable and writable by its owner only and
+    should be shared only with processes of the same user. Other writers cannot be ruled out for an existing file,
+    so payloads are decoded with validators and invalid ones are misses.
+    """
+
+    def __init__(self, path: str, namespace: str = 'resources', max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS, ttl_seconds_by_type_prefix: Dict[str, float] = None,
+                 timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS):
+        self._path = path
+        self._namespace = namespace
+        self._max_size_bytes = max_size_bytes
+        self._ttl_seconds = ttl_seconds
+        self._ttl_seconds_by_type_prefix = sorted(
+            (ttl_seconds_by_type_prefix or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self._timeout_seconds = timeout_seconds
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+        # SQLite creates the WAL and shared memory files with the permissions of the database
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, _FILE_MODE))
+        with self._transaction() as connection:
+            if connection.execute('PRAGMA user_version').fetchone()[0] != _SCHEMA_VERSION:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+
+    def get(self, resource_id: SRN, kind: str = DEFAULT_KIND):
+        now = time.time()
+        row = self._connection().execute(
+            '''SELECT COALESCE(entry.payload, target.payload) FROM resources AS entry
+            LEFT JOIN resources AS target ON entry.target IS NOT NULL AND target.namespace = entry.namespace
+                AND target.kind = entry.kind AND target.key = entry.target AND target.expires_at > ?
+            WHERE entry.namespace = ? AND entry.kind = ? AND entry.key = ? AND entry.expires_at > ?''',
+            (now, self._namespace, kind, str(self._key(resource_id)), now)
+        ).fetchone()
+
+        resource = None
+        # Entries pointing at an evicted or expired versioned entry are misses
+        if row is not None and row[0] is not None:
+            try:
+                resource = binary_codec.loads(row[0], trusted=False)
+            except (binary_codec.BinaryFormatError, TypeError, ValueError):
+                logger.warning(f'Cannot decode cached {resource_id}, fetching it again', exc_info=True)
+
+        with self._lock:
+            if resource is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return resource
+
+    def put(self, resource_id: SRN, resource, kind: str = DEFAULT_KIND):
+        self.put_many([(resource_id, resource)], kind)
+
+    def put_many(self, items: Iterable[Tuple[SRN, object]], kind: str = DEFAULT_KIND):
+        stored_at = time.time()
+        rows = {}
+        for resource_id, resource in items:
+            key = self._key(resource_id)
+            expires_at = stored_at + self._ttl(resource_id)
+            payload = binary_codec.dumps(resource)
+            versioned_id = getattr(resource, 'id', None)
+            if key.version is None and isinstance(versioned_id, SRN) and versioned_id.version is not None:
+                rows[str(key)] = (self._namespace, kind, str(key), str(key), None, str(versioned_id), 0, stored_at,
+                                  expires_at)
+                key = versioned_id
+            rows[str(key)] = (self._namespace, kind, str(key), str(key.without_version), payload, None, len(payload),
+                              stored_at, expires_at)
+        if not rows:
+            return
+
+        with self._transaction() as connection:
+            added_size = sum(row[6] for row in rows.values()) - self._entries_size(connection, kind, list(rows))
+            connection.executemany('INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows.values())
+            total_size = self._add_to_total_size(connection, added_size)
+            if total_size > self._max_size_bytes:
+                self._evict(connection, total_size)
+
+    def invalidate(self, resource_ids: Iterable[SRN]):
+        ids_without_version = list({str(resource_id.without_version) for resource_id in resource_ids})
+        if not ids_without_version:
+            return
+
+        removed = 0
+        with self._transaction() as connection:
+            for i in range(0, len(ids_without_version), _MAX_QUERY_PARAMETERS):
+                chunk = ids_without_version[i:i + _MAX_QUERY_PARAMETERS]
+                placeholders = ', '.join('?' * len(chunk))
+                count, size = connection.execute(
+                    f'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM resources WHERE resource_id IN ({placeholders})',
+                    chunk
+                ).fetchone()
+                connection.execute(f'DELETE FROM resources WHERE resource_id IN ({placeholders})', chunk)
+                self._add_to_total_size(connection, -size)
+                removed += count
+
+        with self._lock:
+            self._invalidations += removed
+
+    def clear(self):
+        with self._transaction() as connection:
+            size, = connection.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM resources WHERE namespace = ?', (self._namespace,)
+            ).fetchone()
+            connection.execute('DELETE FROM resources WHERE namespace = ?', (self._namespace,))
+            self._add_to_total_size(connection, -size)
+
+    @property
+    def stats(self) -> ResourceCacheStats:
+        size, = self._connection().execute('SELECT size FROM total_size').fetchone()
+        with self._lock:
+            return ResourceCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                size=size,
+                max_size=self._max_size_bytes,
+            )
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def _ttl(self, resource_id: SRN) -> float:
+        for prefix, ttl_seconds in self._ttl_seconds_by_type_prefix:
+            if resource_id.type.startswith(prefix):
+                return ttl_seconds
+        return self._ttl_seconds
+
+    def _evict(self, connection: sqlite3.Connection, total_size: int):
+        now = time.time()
+        expired_size, = connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM resources WHERE expires_at <= ?', (now,)
+        ).fetchone()
+        connection.execute('DELETE FROM resources WHERE expires_at <= ?', (now,))
+        total_size -= expired_size
+
+        target_size = int(self._max_size_bytes * EVICTION_TARGET_RATIO)
+        evicted_keys = []
+        evicted_size = 0
+        oldest_first = connection.execute('SELECT namespace, kind, key, size FROM resources ORDER BY stored_at, rowid')
+        for namespace, kind, key, size in oldest_first:
+            if total_size - evicted_size <= target_size:
+                break
+            evicted_keys.append((namespace, kind, key))
+            evicted_size += size
+        connection.executemany('DELETE FROM resources WHERE namespace = ? AND kind = ? AND key = ?', evicted_keys)
+
+        self._add_to_total_size(connection, -(expired_size + evicted_size))
+        logger.debug(f'Evicted {len(evicted_keys)} entries and {expired_size} bytes of expired entries from {self._path}')
+
+    def _entries_size(self, connection: sqlite3.Connection, kind: str, keys: List[str]) -> int:
+        size = 0
+        for i in range(0, len(keys), _MAX_QUERY_PARAMETERS):
+            chunk = keys[i:i + _MAX_QUERY_PARAMETERS]
+            size += connection.execute(
+                f'''SELECT COALESCE(SUM(size), 0) FROM resources
+                WHERE namespace = ? AND kind = ? AND key IN ({', '.join('?' * len(chunk))})''',
+                [self._namespace, kind] + chunk
+            ).fetchone()[0]
+        return size
+
+    @staticmethod
+    def _add_to_total_size(connection: sqlite3.Connection, size: int) -> int:
+        connection.execute('UPDATE total_size SET size = size + ?', (size,))
+        return connection.execute('SELECT size FROM total_size').fetchone()[0]
+
+    @contextmanager
+    def _transaction(self):
+        connection = self._connection()
+        # IMMEDIATE takes the write lock upfront, so that concurrent writers wait for busy timeout instead of failing
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield connection
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections are per thread and must not be inherited by forked processes
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                self._path, timeout=self._timeout_seconds, isolation_level=None, check_same_thread=False
+            )
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = NORMAL')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    @staticmethod
+    def _key(resource_id: SRN) -> SRN:
+        return resource_id if resource_id.version is not None else resource_id.without_version
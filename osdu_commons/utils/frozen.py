@@ -0,0 +1,79 @@
+from copy import deepcopy
+
+__all__ = [
+    'FrozenDict',
+    'FrozenList',
+    'freeze',
+    'thaw',
+]
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f'{self.__class__.__name__} is immutable, use thaw() to get a mutable copy')
+
+
+class FrozenDict(dict):
+    """ Read-only dict. Subclasses dict, so instance_of(dict) validators and json.dumps keep working.
+
+    copy() returns a shallow, mutable plain dict.
+    """
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class FrozenList(list):
+    """ Read-only list, see FrozenDict. """
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+_IMMUTABLE_TYPES = frozenset([FrozenDict, FrozenList, str, int, float, bool, type(None)])
+
+
+def freeze(value):
+    """ Returns value with dicts and lists replaced by FrozenDict and FrozenList.
+
+    Already frozen containers and immutable scalars are shared rather than copied. Other objects are deep copied.
+    """
+    if type(value) in _IMMUTABLE_TYPES:
+        return value
+    if isinstance(value, dict):
+        return FrozenDict([(key, freeze(item)) for key, item in value.items()])
+    if isinstance(value, list):
+        return FrozenList([freeze(item) for item in value])
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    return deepcopy(value)
+
+
+def thaw(value):
+    """ Returns a mutable copy of a frozen value, with plain dicts and lists. """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(thaw(item) for item in value)
+    return value
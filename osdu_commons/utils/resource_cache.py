@@ -0,0 +1,115 @@
+import threading
+from typing import Iterable, Optional, Tuple
+
+import attr
+from attr.validators import instance_of
+from cachetools import TTLCache
+
+from osdu_commons.model.resource import Resource
+from osdu_commons.utils.srn import SRN
+
+__all__ = [
+    'ResourceCache',
+    'ResourceCacheStats',
+]
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL_SECONDS = 5 * 60
+# Kind of entries which are models.resource.Resource, other kinds (e.g. delivered resources) are cached separately
+DEFAULT_KIND = 'resource'
+# Index of cached keys is rebuilt from the cache when it has this many times more SRNs than the cache has entries
+INDEX_REBUILD_RATIO = 2
+
+
+@attr.s(frozen=True, slots=True)
+class ResourceCacheStats:
+    hits: int = attr.ib(validator=instance_of(int))
+    misses: int = attr.ib(validator=instance_of(int))
+    invalidations: int = attr.ib(validator=instance_of(int))
+    size: int = attr.ib(validator=instance_of(int))
+    max_size: int = attr.ib(validator=instance_of(int))
+
+
+class ResourceCache:
+    """ Thread-safe LRU cache of resources with TTL.
+
+    SRNs without version are cached under SRN.without_version and mean the latest known version, SRNs with version
+    (see SRN.with_version) are pinned to exactly that version. Entries are also keyed by kind, so that services caching
+    different models of a resource can share the cache, invalidation removes entries of all kinds. Cached keys are
+    indexed by SRN.without_version, so that invalidation does not scan the cache. Keys evicted by the cache stay in
+    the index until it is rebuilt.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._cache = TTLCache(maxsize=max_size, ttl=ttl_seconds)
+        self._keys_by_id = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, resource_id: SRN, kind: str = DEFAULT_KIND) -> Optional[Resource]:
+        with self._lock:
+            resource = self._cache.get(self._key(resource_id, kind))
+            if resource is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return resource
+
+    def put(self, resource_id: SRN, resource: Resource, kind: str = DEFAULT_KIND):
+        self.put_many([(resource_id, resource)], kind)
+
+    def put_many(self, items: Iterable[Tuple[SRN, Resource]], kind: str = DEFAULT_KIND):
+        with self._lock:
+            for resource_id, resource in items:
+                key = self._key(resource_id, kind)
+                self._cache[key] = resource
+                self._index(key)
+                versioned_id = getattr(resource, 'id', None)
+                if versioned_id is not None and versioned_id.version is not None:
+                    versioned_key = self._key(versioned_id, kind)
+                    self._cache[versioned_key] = resource
+                    self._index(versioned_key)
+
+    def invalidate(self, resource_ids: Iterable[SRN]):
+        ids_without_version = {resource_id.without_version for resource_id in resource_ids}
+        with self._lock:
+            for id_without_version in ids_without_version:
+                for key in self._keys_by_id.pop(id_without_version, ()):
+                    if self._cache.pop(key, None) is not None:
+                        self._invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._keys_by_id.clear()
+
+    @property
+    def stats(self) -> ResourceCacheStats:
+        with self._lock:
+            return ResourceCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                size=len(self._cache),
+                max_size=int(self._cache.maxsize),
+            )
+
+    def _index(self, key: Tuple[str, SRN]):
+        id_without_version = key[1].without_version
+        keys = self._keys_by_id.get(id_without_version)
+        if keys is None:
+            if len(self._keys_by_id) >= INDEX_REBUILD_RATIO * self._cache.maxsize:
+                self._rebuild_index()
+            keys = self._keys_by_id.setdefault(id_without_version, set())
+        keys.add(key)
+
+    def _rebuild_index(self):
+        self._keys_by_id = {}
+        for key in self._cache.keys():
+            self._keys_by_id.setdefault(key[1].without_version, set()).add(key)
+
+    @staticmethod
+    def _key(resource_id: SRN, kind: str) -> Tuple[str, SRN]:
+        return kind, resource_id if resource_id.version is not None else resource_id.without_version
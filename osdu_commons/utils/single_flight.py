@@ -0,0 +1,77 @@
+import threading
+from concurrent.futures import Future
+from functools import wraps
+from typing import Callable, Dict, Hashable
+
+import attr
+from attr.validators import instance_of
+
+__all__ = [
+    'SingleFlight',
+    'SingleFlightStats',
+    'single_flight',
+]
+
+
+@attr.s(frozen=True, slots=True)
+class SingleFlightStats:
+    hits: int = attr.ib(validator=instance_of(int))
+    misses: int = attr.ib(validator=instance_of(int))
+
+
+class SingleFlight:
+    """ Makes concurrent calls with the same key share one execution and its result or exception """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def do(self, key: Hashable, function: Callable):
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(hits=self._hits, misses=self._misses)
+
+
+def single_flight(key_function: Callable[..., Hashable]):
+    """ Coalesces identical in-flight calls of a client method when the client has single-flight enabled """
+
+    def decorator(f):
+        @wraps(f)
+        def wrapper(self, *args, **kwargs):
+            group = self._single_flight
+            if group is None:
+                return f(self, *args, **kwargs)
+            key = (f.__name__, key_function(*args, **kwargs))
+            return group.do(key, lambda: f(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
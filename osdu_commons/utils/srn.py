@@ -1,43 +1,90 @@
-import re
+from functools import lru_cache, total_ordering
+from operator import attrgetter
 from typing import Optional
 
-import attr
-from attr.validators import instance_of, optional
-
 SRN_SECTION = '([^:]+)'
 SRN_PATTERN = f'srn:{SRN_SECTION}:{SRN_SECTION}:(\d*)'
+SRN_INTERN_TABLE_SIZE = 64 * 1024
 
 
-@attr.s(frozen=True)
+@total_ordering
 class SRN:
-    type: str = attr.ib(validator=instance_of(str))
-    detail: str = attr.ib(validator=instance_of(str))
-    version: Optional[int] = attr.ib(validator=optional(instance_of(int)), default=None)
+    """ Immutable SRN. Instances parsed by from_string are interned in a bounded table. """
+    __slots__ = ('_type', '_detail', '_version', '_hash', '_str', '_without_version')
+
+    type = property(attrgetter('_type'))
+    detail = property(attrgetter('_detail'))
+    version = property(attrgetter('_version'))
+
+    def __init__(self, type: str, detail: str, version: Optional[int] = None):
+        if not isinstance(type, str):
+            raise TypeError(f"'type' must be {str} (got {type!r} that is a {type.__class__}).")
+        if not isinstance(detail, str):
+            raise TypeError(f"'detail' must be {str} (got {detail!r} that is a {detail.__class__}).")
+        if version is not None and not isinstance(version, int):
+            raise TypeError(f"'version' must be {int} (got {version!r} that is a {version.__class__}).")
+
+        self._type = type
+        self._detail = detail
+        self._version = version
+        self._hash = None
+        self._str = None
+        self._without_version = self if version is None else None
 
     @property
     def without_version(self) -> 'SRN':
-        return SRN(self.type, self.detail)
+        if self._without_version is None:
+            self._without_version = SRN(self._type, self._detail)
+        return self._without_version
 
     def with_version(self, version: int) -> 'SRN':
-        return SRN(self.type, self.detail, version)
+        return SRN(self._type, self._detail, version)
 
     @staticmethod
     def from_string(srn):
-        matched = re.fullmatch(SRN_PATTERN, srn)
-        if matched is None:
-            raise SRNFormatException(f'Incorrect format of srn: {srn} of type {type(srn)}')
-
-        type_, detail, version = matched.groups()
-        version = int(version) if version is not '' else None
-
-        return SRN(type_, detail, version)
+        if not isinstance(srn, str):
+            raise TypeError(f'expected string, got {srn.__class__}')
+        return _parse(srn)
 
     def __str__(self):
-        return f'srn:{self.type}:{self.detail}:{self.version or ""}'
+        if self._str is None:
+            self._str = f'srn:{self._type}:{self._detail}:{self._version or ""}'
+        return self._str
 
     def __repr__(self):
         return str(self)
 
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((self._type, self._detail, self._version))
+        return self._hash
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self is other or (
+            self._type == other._type and self._detail == other._detail and self._version == other._version
+        )
+
+    def __lt__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self._type, self._detail, self._version) < (other._type, other._detail, other._version)
+
+    def __reduce__(self):
+        return SRN, (self._type, self._detail, self._version)
+
+
+@lru_cache(maxsize=SRN_INTERN_TABLE_SIZE)
+def _parse(srn: str) -> SRN:
+    sections = srn.split(':')
+    if len(sections) != 4 or sections[0] != 'srn' or not sections[1] or not sections[2] or \
+            not (sections[3] == '' or sections[3].isdecimal()):
+        raise SRNFormatException(f'Incorrect format of srn: {srn} of type {type(srn)}')
+
+    _, type_, detail, version = sections
+    return SRN(type_, detail, int(version) if version else None)
+
 
 class SRNFormatException(ValueError):
     pass
@@ -0,0 +1,82 @@
+import calendar
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Union
+
+import arrow
+from dateutil import tz
+
+__all__ = [
+    'epoch_microseconds',
+    'from_epoch_microseconds',
+    'parse_timestamp',
+]
+
+TIMESTAMP_CACHE_SIZE = 4096
+
+# Formats emitted by the Data API: '2018-11-29 10:57:45' and ISO-8601 UTC timestamps like '2018-11-29T10:57:45.123Z'
+_FAST_TIMESTAMP = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(?:Z|[+-]00:?00)?'
+)
+_EPOCH = datetime(1970, 1, 1)
+_UTC = tz.tzutc()
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def parse_timestamp(value: Union[arrow.Arrow, str, object]) -> arrow.Arrow:
+    """ Drop-in replacement of arrow.get for single values, with a fast path for UTC timestamps in Data API formats.
+
+    Other strings and types fall back to arrow.get.
+    """
+    if isinstance(value, arrow.Arrow):
+        return value
+    if isinstance(value, str):
+        return _parse_timestamp_str(value)
+    return arrow.get(value)
+
+
+def epoch_microseconds(value: Union[arrow.Arrow, str, object]) -> int:
+    """ Microseconds since the Unix epoch, computed without building an Arrow for Data API formats. """
+    if isinstance(value, str):
+        fields = _fast_fields(value)
+        if fields is not None:
+            year, month, day, hour, minute, second, microsecond = fields
+            try:
+                days = date(year, month, day).toordinal() - _EPOCH_ORDINAL
+            except ValueError:
+                pass
+            else:
+                if hour < 24 and minute < 60 and second < 60:
+                    return ((days * 86400 + hour * 3600 + minute * 60 + second) * 1000000) + microsecond
+
+    timestamp = parse_timestamp(value)
+    return calendar.timegm(timestamp.utctimetuple()) * 1000000 + timestamp.microsecond
+
+
+def from_epoch_microseconds(microseconds: int) -> arrow.Arrow:
+    timestamp = _EPOCH + timedelta(microseconds=microseconds)
+    return arrow.Arrow(timestamp.year, timestamp.month, timestamp.day, timestamp.hour, timestamp.minute,
+                       timestamp.second, timestamp.microsecond, _UTC)
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_timestamp_str(value: str) -> arrow.Arrow:
+    fields = _fast_fields(value)
+    if fields is not None:
+        try:
+            return arrow.Arrow(*fields)
+        except ValueError:
+            pass
+    return arrow.get(value)
+
+
+def _fast_fields(value: str):
+    match = _FAST_TIMESTAMP.fullmatch(value)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction = match.groups()
+    return (
+        int(year), int(month), int(day), int(hour), int(minute), int(second),
+        int(fraction.ljust(6, '0')) if fraction else 0
+    )
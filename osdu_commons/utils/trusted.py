@@ -0,0 +1,95 @@
+import threading
+from typing import Callable, Dict, Optional, Type, TypeVar
+
+import attr
+
+__all__ = [
+    'constructor',
+    'is_trusted_decode',
+    'resolve_trusted_decode',
+    'set_trusted_decode',
+]
+
+T = TypeVar('T')
+
+_trusted_decode = False
+_constructors: Dict[type, Callable] = {}
+_constructors_lock = threading.Lock()
+
+
+def set_trusted_decode(enabled: bool):
+    """ Sets whether clients without explicit trusted_decode skip validators when decoding service responses. """
+    global _trusted_decode
+    _trusted_decode = enabled
+
+
+def is_trusted_decode() -> bool:
+    return _trusted_decode
+
+
+def resolve_trusted_decode(trusted_decode: Optional[bool]) -> bool:
+    return _trusted_decode if trusted_decode is None else trusted_decode
+
+
+def constructor(cls: Type[T], trusted: bool) -> Callable[..., T]:
+    """ Returns cls or, when trusted, a keyword-only constructor of attrs class cls which skips validators.
+
+    Converters, defaults and __attrs_post_init__ still run, so the built object equals the validated one for valid
+    input. Meant for decoding responses of our own services only.
+    """
+    if not trusted:
+        return cls
+    return _trusted_constructor(cls)
+
+
+def _trusted_constructor(cls: type) -> Callable:
+    constructor = _constructors.get(cls)
+    if constructor is None:
+        with _constructors_lock:
+            constructor = _constructors.get(cls)
+            if constructor is None:
+                constructor = _constructors[cls] = _make_trusted_constructor(cls)
+    return constructor
+
+
+def _make_trusted_constructor(cls: type) -> Callable:
+    """ Generates a function equivalent to attrs generated __init__ without validators, creating the instance. """
+    globs = {'_cls': cls, '_new': object.__new__, '_setattr': object.__setattr__, '_NOTHING': attr.NOTHING}
+    arguments, lines = [], ['self = _new(_cls)']
+
+    for field in attr.fields(cls):
+        name = field.name
+        argument = name.lstrip('_')
+        value = argument
+        if isinstance(field.default, attr.Factory):
+            globs[f'_factory_{name}'] = field.default.factory
+            factory_call = f'_factory_{name}(self)' if field.default.takes_self else f'_factory_{name}()'
+            if field.init:
+                arguments.append(f'{argument}=_NOTHING')
+                value = f'({factory_call} if {argument} is _NOTHING else {argument})'
+            else:
+                value = factory_call
+        elif field.default is not attr.NOTHING:
+            globs[f'_default_{name}'] = field.default
+            if field.init:
+                arguments.append(f'{argument}=_default_{name}')
+            else:
+                value = f'_default_{name}'
+        elif field.init:
+            arguments.append(argument)
+        else:
+            continue
+
+        if field.converter is not None:
+            globs[f'_converter_{name}'] = field.converter
+            value = f'_converter_{name}({value})'
+        lines.append(f'_setattr(self, {name!r}, {value})')
+
+    if getattr(cls, '__attrs_post_init__', None) is not None:
+        lines.append('self.__attrs_post_init__()')
+    lines.append('return self')
+
+    signature = f'*, {", ".join(arguments)}' if arguments else ''
+    source = f'def trusted_init({signature}):\n' + ''.join(f'    {line}\n' for line in lines)
+    exec(compile(source, f'<trusted init of {cls.__qualname__}>', 'exec'), globs)
+    return globs['trusted_init']
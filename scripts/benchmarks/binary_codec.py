@@ -0,0 +1,96 @@
+"""Benchmark of model encoding and decoding through asdict and JSON, pickle and osdu_commons.utils.binary_codec.
+
+Run with `PYTHONPATH=. python scripts/benchmarks/binary_codec.py` from the repository root.
+"""
+import json
+import pickle
+import timeit
+
+import arrow
+
+from osdu_commons.clients.workflow_client import Workflows
+from osdu_commons.model.resource import Resource
+from osdu_commons.model.swps_manifest import manifest_from_camel_dict
+from osdu_commons.utils import binary_codec
+
+RESOURCES = 10000
+MANIFEST_PATH = 'tests/resources/manifests/manifest_1.json'
+REPEAT = 10
+
+
+def make_resources(count: int):
+    start = arrow.get('2018-11-29T10:57:45+00:00')
+    return [
+        Resource(
+            id=f'srn:master-data/Well:{i}:',
+            type_id='srn:type:master-data/Well:',
+            home_region_id='srn:reference-data/OSDURegion:us-east-1:',
+            hosting_region_ids=['srn:reference-data/OSDURegion:us-east-1:'],
+            object_creation_date_time=start.shift(seconds=i),
+            version_creation_date_time=start.shift(seconds=i + 1),
+            curation_status='srn:reference-data/ResourceCurationStatus:CREATED:',
+            lifecycle_status='srn:reference-data/ResourceLifecycleStatus:LOADING:',
+            security_classification='srn:reference-data/ResourceSecurityClassification:RESTRICTED:',
+            data={'IndividualTypeProperties': {'Name': f'Well {i}', 'Depth': i * 1.5, 'Tags': ['a', 'b']}},
+        ) for i in range(count)
+    ]
+
+
+def best_of(function) -> float:
+    return min(timeit.repeat(function, number=1, repeat=REPEAT))
+
+
+def compare(name: str, value, to_json, from_json):
+    json_payload = json.dumps(to_json(value))
+    pickle_payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    binary_payload = binary_codec.dumps(value)
+
+    results = [
+        ('asdict and JSON', len(json_payload), best_of(lambda: json.dumps(to_json(value))),
+         best_of(lambda: from_json(json.loads(json_payload)))),
+        ('pickle', len(pickle_payload), best_of(lambda: pickle.dumps(value, pickle.HIGHEST_PROTOCOL)),
+         best_of(lambda: pickle.loads(pickle_payload))),
+        ('binary_codec', len(binary_payload), best_of(lambda: binary_codec.dumps(value)),
+         best_of(lambda: binary_codec.loads(binary_payload, trusted=False))),
+        ('binary_codec trusted', len(binary_payload), None,
+         best_of(lambda: binary_codec.loads(binary_payload, trusted=True))),
+    ]
+
+    print(name)
+    print(f'{"method":>24} {"size [kB]":>10} {"encode [ms]":>12} {"decode [ms]":>12}')
+    for method, size, encode_seconds, decode_seconds in results:
+        encode_ms = f'{encode_seconds * 1000:.1f}' if encode_seconds is not None else '-'
+        print(f'{method:>24} {size / 1000:>10.1f} {encode_ms:>12} {decode_seconds * 1000:>12.1f}')
+
+
+def main():
+    compare(
+        f'{RESOURCES} resources', make_resources(RESOURCES),
+        lambda resources: [resource.asdict() for resource in resources],
+        lambda dicts: [Resource.from_dict(item) for item in dicts],
+    )
+
+    with open(MANIFEST_PATH) as fp:
+        manifest = manifest_from_camel_dict(json.load(fp))
+    compare('manifest', manifest, lambda value: value.asdict(), manifest_from_camel_dict)
+
+    workflows = Workflows.from_json({
+        'Batch': [
+            {'WorkflowJobID': f'job-{i}', 'State': 'SUCCEEDED', 'WorkProductID': f'srn:work-product/WellLog:{i}:1'}
+            for i in range(RESOURCES)
+        ],
+        'NextToken': None
+    })
+    compare(
+        f'{RESOURCES} workflow jobs', workflows,
+        lambda value: {
+            'Batch': [{'WorkflowJobID': job.workflow_job_id, 'State': job.state.value,
+                       'WorkProductID': str(job.work_product_id)} for job in value.batch],
+            'NextToken': value.next_token
+        },
+        Workflows.from_json,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Micro-benchmark of DataAPIClient response decoding.
+
+Run with `PYTHONPATH=. python scripts/benchmarks/decode_resources.py` from the repository root.
+Time per resource should stay flat as the batch grows.
+"""
+import json
+import timeit
+
+import requests
+
+from osdu_commons.clients.data_api_client import DataAPIClient
+
+BATCH_SIZES = [1, 10, 100, 1000]
+REPEAT = 5
+
+
+def make_response(batch_size: int) -> requests.Response:
+    resource_ids = [f'srn:master-data/Well:{i}:' for i in range(batch_size)]
+    body = {
+        'ResourceIDs': resource_ids,
+        'ResourceData': [
+            {
+                'ResourceID': resource_id,
+                'ResourceTypeID': 'srn:type:master-data/Well:',
+                'ResourceHomeRegionID': 'srn:reference-data/OSDURegion:us-east-1:',
+                'ResourceHostRegionIDs': ['srn:reference-data/OSDURegion:us-east-1:'],
+                'ResourceObjectCreationDatetime': '2018-11-29 10:57:45',
+                'ResourceVersionCreationDatetime': '2018-11-29 10:57:46',
+                'ResourceCurationStatus': 'srn:reference-data/ResourceCurationStatus:CREATED:',
+                'ResourceLifecycleStatus': 'srn:reference-data/ResourceLifecycleStatus:LOADING:',
+                'Data': {'IndividualTypeProperties': {'Name': f'Well {resource_id}'}}
+            } for resource_id in resource_ids
+        ],
+        'S3Location': [f's3://bucket/key/{i}' for i in range(batch_size)],
+        'UnprocessedSRNs': []
+    }
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode('utf-8')
+    return response
+
+
+def main():
+    print(f'{"batch size":>10} {"total [ms]":>12} {"per resource [us]":>18}')
+    for batch_size in BATCH_SIZES:
+        response = make_response(batch_size)
+        number = max(1, 1000 // batch_size)
+        best = min(timeit.repeat(lambda: DataAPIClient._get_resources_result(response), number=number, repeat=REPEAT))
+        per_call = best / number
+        print(f'{batch_size:>10} {per_call * 1000:>12.3f} {per_call / batch_size * 10 ** 6:>18.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark of osdu_commons.utils.disk_resource_cache puts, batched puts and gets, from one and from several processes.
+
+Run with `PYTHONPATH=. python scripts/benchmarks/disk_resource_cache.py` from the repository root.
+"""
+import os
+import tempfile
+import time
+from multiprocessing import Pool
+
+import arrow
+
+from osdu_commons.model.resource import Resource
+from osdu_commons.utils.disk_resource_cache import DiskResourceCache
+from osdu_commons.utils.srn import SRN
+
+RESOURCES = 2000
+PROCESSES = 4
+
+
+def make_resources(count: int):
+    start = arrow.get('2018-11-29T10:57:45+00:00')
+    return [
+        Resource(
+            id=f'srn:master-data/Well:{i}:1',
+            type_id='srn:type:master-data/Well:',
+            home_region_id='srn:reference-data/OSDURegion:us-east-1:',
+            hosting_region_ids=['srn:reference-data/OSDURegion:us-east-1:'],
+            object_creation_date_time=start.shift(seconds=i),
+            version_creation_date_time=start.shift(seconds=i + 1),
+            curation_status='srn:reference-data/ResourceCurationStatus:CREATED:',
+            lifecycle_status='srn:reference-data/ResourceLifecycleStatus:LOADING:',
+            security_classification='srn:reference-data/ResourceSecurityClassification:RESTRICTED:',
+            data={'IndividualTypeProperties': {'Name': f'Well {i}', 'Depth': i * 1.5, 'Tags': ['a', 'b']}},
+        ) for i in range(count)
+    ]
+
+
+def resource_ids(count: int):
+    return [SRN('master-data/Well', str(i)) for i in range(count)]
+
+
+def get_all(path: str) -> float:
+    cache = DiskResourceCache(path)
+    start = time.perf_counter()
+    for resource_id in resource_ids(RESOURCES):
+        assert cache.get(resource_id) is not None
+    return time.perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'resources.sqlite')
+        cache = DiskResourceCache(path)
+
+        start = time.perf_counter()
+        for resource_id, resource in zip(resource_ids(RESOURCES), make_resources(RESOURCES)):
+            cache.put(resource_id, resource)
+        put_seconds = time.perf_counter() - start
+        print(f'put: {put_seconds / RESOURCES * 10 ** 6:.0f} us per resource, {cache.stats.size / 1000:.0f} kB')
+
+        start = time.perf_counter()
+        cache.put_many(zip(resource_ids(RESOURCES), make_resources(RESOURCES)))
+        put_seconds = time.perf_counter() - start
+        print(f'put_many: {put_seconds / RESOURCES * 10 ** 6:.0f} us per resource, {cache.stats.size / 1000:.0f} kB')
+
+        get_seconds = get_all(path)
+        print(f'get, 1 process: {get_seconds / RESOURCES * 10 ** 6:.0f} us per resource')
+
+        with Pool(PROCESSES) as pool:
+            get_seconds = max(pool.map(get_all, [path] * PROCESSES))
+        print(f'get, {PROCESSES} processes: {get_seconds / RESOURCES * 10 ** 6:.0f} us per resource')
+
+
+if __name__ == '__main__':
+    main()
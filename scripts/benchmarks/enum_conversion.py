@@ -0,0 +1,68 @@
+"""Micro-benchmark of the curation, lifecycle and security classification converters against the previous parsing ones.
+
+Run with `PYTHONPATH=. python scripts/benchmarks/enum_conversion.py` from the repository root.
+"""
+import timeit
+
+from osdu_commons.model.enums import SECURITY_CLASSIFICATION_TO_SRN, ResourceCurationStatus, \
+    ResourceLifecycleStatus, ResourceSecurityClassification
+from osdu_commons.utils import convert
+from osdu_commons.utils.srn import SRN, SRNFormatException
+
+NUMBER = 100000
+REPEAT = 5
+
+
+def legacy_resource_curation_status(curation_status_or_str):
+    if isinstance(curation_status_or_str, ResourceCurationStatus):
+        return curation_status_or_str
+    return ResourceCurationStatus(convert.srn(curation_status_or_str))
+
+
+def legacy_resource_lifecycle_status(lifecycle_status_or_str):
+    if isinstance(lifecycle_status_or_str, ResourceLifecycleStatus):
+        return lifecycle_status_or_str
+    return ResourceLifecycleStatus(convert.srn(lifecycle_status_or_str))
+
+
+def legacy_resource_security_classification(srn_or_str):
+    if isinstance(srn_or_str, SRN):
+        security_classification_srn = srn_or_str
+    else:
+        try:
+            security_classification_srn = SECURITY_CLASSIFICATION_TO_SRN[ResourceSecurityClassification(srn_or_str)]
+        except ValueError:
+            try:
+                security_classification_srn = SRN.from_string(srn_or_str)
+            except SRNFormatException:
+                raise TypeError(f'Cannot convert {srn_or_str} to srn')
+    if security_classification_srn not in SECURITY_CLASSIFICATION_TO_SRN.values():
+        raise TypeError(f'Wrong ResourceSecurityClassification type {security_classification_srn}')
+    return security_classification_srn
+
+
+def bench(name, function, value):
+    best = min(timeit.repeat(lambda: function(value), number=NUMBER, repeat=REPEAT))
+    print(f'{name:>32} {value.__class__.__name__:>24} {best / NUMBER * 10 ** 9:>8.0f}')
+
+
+def main():
+    cases = [
+        ('curation status', legacy_resource_curation_status, convert.resource_curation_status,
+         ['srn:reference-data/ResourceCurationStatus:CREATED:', ResourceCurationStatus.CREATED]),
+        ('lifecycle status', legacy_resource_lifecycle_status, convert.resource_lifecycle_status,
+         ['srn:reference-data/ResourceLifecycleStatus:LOADING:', ResourceLifecycleStatus.LOADING]),
+        ('security classification', legacy_resource_security_classification, convert.resource_security_classification,
+         ['RESTRICTED', 'srn:reference-data/ResourceSecurityClassification:RESTRICTED:',
+          SECURITY_CLASSIFICATION_TO_SRN[ResourceSecurityClassification.RESTRICTED]]),
+    ]
+
+    print(f'{"converter":>32} {"input":>24} {"per call [ns]":>8}')
+    for name, legacy, converter, values in cases:
+        for value in values:
+            bench(f'legacy {name}', legacy, value)
+            bench(name, converter, value)
+
+
+if __name__ == '__main__':
+    main()
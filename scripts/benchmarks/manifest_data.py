@@ -0,0 +1,59 @@
+"""Benchmark of manifest data conversion, convert.copy (deepcopy) against convert.freeze.
+
+Run with `PYTHONPATH=. python scripts/benchmarks/manifest_data.py` from the repository root.
+"""
+import timeit
+import tracemalloc
+
+import attr
+
+from osdu_commons.model.work_product import WorkProductData
+from osdu_commons.utils import convert
+
+CURVES = 10000
+REPEAT = 5
+
+
+def individual_type_properties(curves: int) -> dict:
+    return {
+        'Name': 'Well log',
+        'Curves': [
+            {'Mnemonic': f'C{i}', 'CurveUnit': 'm', 'TopDepth': float(i), 'BaseDepth': float(i + 1),
+             'Aliases': [f'alias-{i}-{j}' for j in range(3)]}
+            for i in range(curves)
+        ]
+    }
+
+
+def allocated_bytes(function) -> int:
+    tracemalloc.start()
+    result = function()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    properties = individual_type_properties(CURVES)
+    frozen = convert.freeze(properties)
+    work_product_data = WorkProductData(
+        group_type_properties={'Components': []}, individual_type_properties=properties, extension_properties={}
+    )
+
+    results = [
+        ('copy (deepcopy)', lambda: convert.copy(properties)),
+        ('freeze', lambda: convert.freeze(properties)),
+        ('freeze frozen', lambda: convert.freeze(frozen)),
+        ('evolve model', lambda: attr.evolve(work_product_data, extension_properties={'A': 1})),
+    ]
+
+    print(f'IndividualTypeProperties with {CURVES} curves')
+    print(f'{"operation":>16} {"time [ms]":>10} {"allocated [kB]":>15}')
+    for name, function in results:
+        seconds = min(timeit.repeat(function, number=1, repeat=REPEAT))
+        print(f'{name:>16} {seconds * 1000:>10.2f} {allocated_bytes(function) / 1024:>15.0f}')
+
+
+if __name__ == '__main__':
+    main()
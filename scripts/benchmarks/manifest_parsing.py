@@ -0,0 +1,79 @@
+"""Benchmark of SWPS manifest decoding and encoding and of CamelCase to snake_case key conversion.
+
+Run with `PYTHONPATH=. python scripts/benchmarks/manifest_parsing.py` from the repository root. The corpus are the
+manifests in tests/resources/manifests, also scaled up to 100 files and 10 work product components each.
+"""
+import copy
+import glob
+import json
+import os
+import re
+import timeit
+
+from osdu_commons.model.swps_manifest import SWPSManifest, manifest_from_camel_dict
+from osdu_commons.utils import convert
+
+MANIFESTS_DIR = os.path.join('tests', 'resources', 'manifests')
+FILES_PER_MANIFEST = 100
+COMPONENTS_PER_MANIFEST = 10
+REPEAT = 5
+
+
+def legacy_to_snake_case(name):
+    s1 = re.sub('([a-z0-9])([A-Z][a-z]+)', r'\1_\2', name)
+    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+
+
+def load_corpus() -> list:
+    manifests = []
+    for path in sorted(glob.glob(os.path.join(MANIFESTS_DIR, '*.json'))):
+        with open(path) as fp:
+            manifest = json.load(fp)
+        manifests.append(manifest)
+
+        scaled = copy.deepcopy(manifest)
+        scaled['Files'] = [
+            dict(file, AssociativeID=f'{file["AssociativeID"]}-{i}')
+            for i in range(FILES_PER_MANIFEST // len(manifest['Files']) + 1) for file in manifest['Files']
+        ][:FILES_PER_MANIFEST]
+        scaled['WorkProductComponents'] = manifest['WorkProductComponents'] * COMPONENTS_PER_MANIFEST
+        manifests.append(scaled)
+    return manifests
+
+
+def camel_case_keys(value) -> list:
+    keys = []
+    if isinstance(value, dict):
+        for key, item in value.items():
+            keys.append(key)
+            keys.extend(camel_case_keys(item))
+    elif isinstance(value, list):
+        for item in value:
+            keys.extend(camel_case_keys(item))
+    return keys
+
+
+def main():
+    corpus = load_corpus()
+    keys = [key for manifest in corpus for key in camel_case_keys(manifest)]
+    manifests = [manifest_from_camel_dict(manifest) for manifest in corpus]
+
+    results = [
+        ('legacy to_snake_case', len(keys), lambda: [legacy_to_snake_case(key) for key in keys]),
+        ('to_snake_case', len(keys), lambda: [convert.to_snake_case(key) for key in keys]),
+        ('generic decode', len(corpus),
+         lambda: [convert.class_from_camel_dict(SWPSManifest)(manifest) for manifest in corpus]),
+        ('generated decode', len(corpus), lambda: [manifest_from_camel_dict(manifest) for manifest in corpus]),
+        ('encode', len(corpus), lambda: [manifest.asdict() for manifest in manifests]),
+        ('round trip', len(corpus), lambda: [manifest_from_camel_dict(manifest).asdict() for manifest in corpus]),
+    ]
+
+    print(f'{len(corpus)} manifests, {len(keys)} keys')
+    print(f'{"operation":>22} {"total [ms]":>12} {"per item [us]":>14}')
+    for name, items, function in results:
+        seconds = min(timeit.repeat(function, number=10, repeat=REPEAT)) / 10
+        print(f'{name:>22} {seconds * 1000:>12.3f} {seconds / items * 10 ** 6:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
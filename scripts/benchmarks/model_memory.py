@@ -0,0 +1,62 @@
+"""Memory benchmark of attrs models with and without slots.
+
+Run with `PYTHONPATH=. python scripts/benchmarks/model_memory.py` from the repository root. Field values are shared by
+all objects, so the numbers show the overhead of the objects themselves.
+"""
+import tracemalloc
+
+import arrow
+import attr
+
+from osdu_commons.clients.delivery_client import GetResourcesResultItem
+from osdu_commons.clients.search_client import SearchResultFile
+from osdu_commons.model.aws import S3Location
+from osdu_commons.model.enums import ResourceCurationStatus, ResourceLifecycleStatus
+from osdu_commons.model.resource import Resource
+from osdu_commons.services.delivery_service import DeliveredResource
+from osdu_commons.utils.srn import SRN
+
+OBJECTS_COUNT = 100000
+
+SRN_ = SRN('master-data/Well', '1')
+S3_LOCATION = S3Location(bucket='bucket', key='key')
+NOW = arrow.utcnow()
+MODELS = [
+    (S3Location, dict(bucket='bucket', key='key')),
+    (SearchResultFile, dict(filename='file.las', srn='srn:file/las2:1:')),
+    (GetResourcesResultItem, dict(srn=SRN_, data={}, s3_location=S3_LOCATION)),
+    (DeliveredResource, dict(srn=SRN_, exists=True, data={}, s3_location=S3_LOCATION)),
+    (Resource, dict(
+        id=SRN_, type_id=SRN_, home_region_id=SRN_, hosting_region_ids=[], object_creation_date_time=NOW,
+        version_creation_date_time=NOW, curation_status=ResourceCurationStatus.CREATED,
+        lifecycle_status=ResourceLifecycleStatus.LOADING, data={}
+    )),
+]
+
+
+def without_slots(cls):
+    return attr.make_class(cls.__name__, {
+        a.name: attr.ib(validator=a.validator, converter=a.converter, default=a.default) for a in attr.fields(cls)
+    }, frozen=True)
+
+
+def bytes_per_object(cls, kwargs) -> float:
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    objects = [cls(**kwargs) for _ in range(OBJECTS_COUNT)]
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, 'filename'))
+    del objects
+    return allocated / OBJECTS_COUNT
+
+
+def main():
+    print(f'{"model":>24} {"no slots [B]":>14} {"slots [B]":>10}')
+    for cls, kwargs in MODELS:
+        print(f'{cls.__name__:>24} {bytes_per_object(without_slots(cls), kwargs):>14.0f} '
+              f'{bytes_per_object(cls, kwargs):>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
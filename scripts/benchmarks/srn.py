@@ -0,0 +1,60 @@
+"""Micro-benchmark of SRN parsing and hashing against the previous regex and attrs based implementation.
+
+Run with `PYTHONPATH=. python scripts/benchmarks/srn.py` from the repository root.
+"""
+import re
+import timeit
+from typing import Optional
+
+import attr
+from attr.validators import instance_of, optional
+
+from osdu_commons.utils.srn import SRN, SRN_PATTERN, _parse
+
+NUMBER = 100000
+REPEAT = 5
+SRN_STRINGS = [f'srn:master-data/Well:{i}:{i % 3 or ""}' for i in range(1000)]
+
+
+@attr.s(frozen=True)
+class LegacySRN:
+    type: str = attr.ib(validator=instance_of(str))
+    detail: str = attr.ib(validator=instance_of(str))
+    version: Optional[int] = attr.ib(validator=optional(instance_of(int)), default=None)
+
+    @property
+    def without_version(self) -> 'LegacySRN':
+        return LegacySRN(self.type, self.detail)
+
+    @staticmethod
+    def from_string(srn):
+        type_, detail, version = re.fullmatch(SRN_PATTERN, srn).groups()
+        return LegacySRN(type_, detail, int(version) if version != '' else None)
+
+    def __str__(self):
+        return f'srn:{self.type}:{self.detail}:{self.version or ""}'
+
+
+def bench(name, function):
+    best = min(timeit.repeat(function, number=NUMBER // len(SRN_STRINGS), repeat=REPEAT))
+    print(f'{name:>40} {best / NUMBER * 10 ** 9:>10.0f}')
+
+
+def main():
+    legacy_srns = [LegacySRN.from_string(s) for s in SRN_STRINGS]
+    srns = [SRN.from_string(s) for s in SRN_STRINGS]
+
+    print(f'{"":>40} {"per SRN [ns]":>10}')
+    for implementation, parsed in [(LegacySRN, legacy_srns), (SRN, srns)]:
+        name = implementation.__name__
+        bench(f'{name}.from_string', lambda: [implementation.from_string(s) for s in SRN_STRINGS])
+        if implementation is SRN:
+            bench('SRN.from_string without interning', lambda: [_parse.__wrapped__(s) for s in SRN_STRINGS])
+        bench(f'{name}.without_version', lambda: [srn.without_version for srn in parsed])
+        bench(f'{name} str', lambda: [str(srn) for srn in parsed])
+        bench(f'{name} hash', lambda: [hash(srn) for srn in parsed])
+        bench(f'{name} dict lookup by without_version', lambda: {srn.without_version: srn for srn in parsed})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark of Resource timestamp decoding, arrow.get against the fast path of osdu_commons.utils.timestamps.
+
+Run with `PYTHONPATH=. python scripts/benchmarks/timestamps.py` from the repository root. Timestamps are distinct, so
+the parse cache does not help; real responses repeat timestamps of bulk-created resources and decode faster.
+"""
+import timeit
+
+import arrow
+
+from osdu_commons.clients.data_api_client import DataAPIClient
+from osdu_commons.model.resource_batch import ResourceBatch
+from osdu_commons.utils.timestamps import epoch_microseconds, parse_timestamp
+
+RESOURCES = 100000
+REPEAT = 3
+
+
+def make_response_json(resources: int) -> dict:
+    start = arrow.get('2018-11-29 10:57:45')
+    resource_ids = [f'srn:master-data/Well:{i}:' for i in range(resources)]
+    return {
+        'ResourceIDs': resource_ids,
+        'ResourceData': [
+            {
+                'ResourceID': resource_id,
+                'ResourceTypeID': 'srn:type:master-data/Well:',
+                'ResourceHomeRegionID': 'srn:reference-data/OSDURegion:us-east-1:',
+                'ResourceHostRegionIDs': ['srn:reference-data/OSDURegion:us-east-1:'],
+                'ResourceObjectCreationDatetime': start.shift(seconds=i).format('YYYY-MM-DD HH:mm:ss'),
+                'ResourceVersionCreationDatetime': start.shift(seconds=i + 1).format('YYYY-MM-DD HH:mm:ss'),
+                'ResourceCurationStatus': 'srn:reference-data/ResourceCurationStatus:CREATED:',
+                'ResourceLifecycleStatus': 'srn:reference-data/ResourceLifecycleStatus:LOADING:',
+                'Data': {'IndividualTypeProperties': {'Name': f'Well {resource_id}'}}
+            } for i, resource_id in enumerate(resource_ids)
+        ],
+        'S3Location': [None] * resources,
+    }
+
+
+def best_of(function) -> float:
+    return min(timeit.repeat(function, number=1, repeat=REPEAT))
+
+
+def main():
+    response_json = make_response_json(RESOURCES)
+    timestamps = [body['ResourceObjectCreationDatetime'] for body in response_json['ResourceData']]
+
+    results = [
+        ('arrow.get', best_of(lambda: [arrow.get(value) for value in timestamps])),
+        ('parse_timestamp', best_of(lambda: [parse_timestamp(value) for value in timestamps])),
+        ('epoch_microseconds', best_of(lambda: [epoch_microseconds(value) for value in timestamps])),
+        ('decode Resources', best_of(lambda: DataAPIClient._decode_resources(response_json))),
+        ('decode ResourceBatch', best_of(lambda: ResourceBatch.from_data_api_response(response_json))),
+    ]
+
+    print(f'{RESOURCES} resources')
+    print(f'{"operation":>22} {"total [ms]":>12} {"per item [us]":>14}')
+    for name, seconds in results:
+        print(f'{name:>22} {seconds * 1000:>12.1f} {seconds / RESOURCES * 10 ** 6:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
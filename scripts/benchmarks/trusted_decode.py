@@ -0,0 +1,96 @@
+"""Benchmark of response decoding with validators (default) and in trusted mode.
+
+Run with `PYTHONPATH=. python scripts/benchmarks/trusted_decode.py` from the repository root.
+"""
+import timeit
+
+from osdu_commons.clients.collection_client import Collection
+from osdu_commons.clients.data_api_client import DataAPIClient
+from osdu_commons.clients.search_client import SearchResponse
+from osdu_commons.clients.workflow_client import Workflows
+
+ITEMS = 10000
+REPEAT = 5
+
+
+def data_api_response_json(items: int) -> dict:
+    resource_ids = [f'srn:master-data/Well:{i}:' for i in range(items)]
+    return {
+        'ResourceIDs': resource_ids,
+        'ResourceData': [
+            {
+                'ResourceID': resource_id,
+                'ResourceTypeID': 'srn:type:master-data/Well:',
+                'ResourceHomeRegionID': 'srn:reference-data/OSDURegion:us-east-1:',
+                'ResourceHostRegionIDs': ['srn:reference-data/OSDURegion:us-east-1:'],
+                'ResourceObjectCreationDatetime': '2018-11-29 10:57:45',
+                'ResourceVersionCreationDatetime': '2018-11-29 10:57:46',
+                'ResourceCurationStatus': 'srn:reference-data/ResourceCurationStatus:CREATED:',
+                'ResourceLifecycleStatus': 'srn:reference-data/ResourceLifecycleStatus:LOADING:',
+                'Data': {'IndividualTypeProperties': {'Name': f'Well {resource_id}'}}
+            } for resource_id in resource_ids
+        ],
+        'S3Location': [f's3://bucket/key/{i}' for i in range(items)],
+    }
+
+
+def search_response_json(items: int) -> dict:
+    return {
+        'results': [
+            {
+                'srn': f'srn:master-data/Well:{i}:1',
+                'files': [{'filename': f'file-{i}-{j}.las', 'srn': f'srn:file/las2:{i}-{j}:1'} for j in range(2)],
+                'Name': f'Well {i}'
+            } for i in range(items)
+        ],
+        'start': 0,
+        'count': items,
+        'total_hits': items,
+        'facets': {}
+    }
+
+
+def workflows_json(items: int) -> dict:
+    return {
+        'Batch': [
+            {'WorkflowJobID': f'job-{i}', 'State': 'SUCCEEDED', 'WorkProductID': f'srn:work-product/WellLog:{i}:1'}
+            for i in range(items)
+        ],
+        'NextToken': None
+    }
+
+
+def collections_json(items: int) -> list:
+    return [
+        {
+            'SRN': f'srn:collection/Collection:{i}:1',
+            'OwnerID': 'owner',
+            'Name': f'Collection {i}',
+            'Resources': [f'srn:master-data/Well:{j}:1' for j in range(5)],
+            'FilterSpecification': []
+        } for i in range(items)
+    ]
+
+
+def main():
+    data_api_json = data_api_response_json(ITEMS)
+    search_json = search_response_json(ITEMS)
+    workflows = workflows_json(ITEMS)
+    collections = collections_json(ITEMS)
+    decoders = [
+        ('Data API resources', lambda trusted: DataAPIClient._decode_resources(data_api_json, trusted)),
+        ('search results', lambda trusted: SearchResponse.from_json(search_json, trusted)),
+        ('workflows', lambda trusted: Workflows.from_json(workflows, trusted)),
+        ('collections', lambda trusted: [Collection.from_json(collection, trusted) for collection in collections]),
+    ]
+
+    print(f'{ITEMS} items per response')
+    print(f'{"response":>20} {"validated [ms]":>15} {"trusted [ms]":>13} {"speedup":>8}')
+    for name, decode in decoders:
+        validated = min(timeit.repeat(lambda: decode(False), number=1, repeat=REPEAT))
+        trusted = min(timeit.repeat(lambda: decode(True), number=1, repeat=REPEAT))
+        print(f'{name:>20} {validated * 1000:>15.1f} {trusted * 1000:>13.1f} {validated / trusted:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -12,5 +12,10 @@ setup(
         'retrying==1.3.3',
         'cachetools==3.0.0',
         'pampy==0.2.1',
-    ]
+    ],
+    extras_require={
+        'aio': [
+            'aiohttp>=3.5.4,<4.0.0',
+        ],
+    }
 )
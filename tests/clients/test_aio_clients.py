@@ -0,0 +1,157 @@
+import asyncio
+
+import arrow
+from aioresponses import aioresponses
+
+from osdu_commons.clients.aio.collection_client import AsyncCollectionClient
+from osdu_commons.clients.aio.data_api_client import AsyncDataAPIClient
+from osdu_commons.clients.aio.delivery_client import AsyncDeliveryClient
+from osdu_commons.clients.aio.search_client import AsyncSearchClient
+from osdu_commons.clients.aio.workflow_client import AsyncWorkflowClient
+from osdu_commons.clients.collection_client import Collection
+from osdu_commons.clients.data_api_client import GetResourcesResult
+from osdu_commons.clients.delivery_client import GetResourcesResponseNotFound, GetResourcesResponseSuccess, \
+    GetResourcesResultItem
+from osdu_commons.clients.search_client import SearchRequest
+from osdu_commons.clients.workflow_client import WorkflowJobDescription, WorkflowStatus
+from osdu_commons.model.enums import ResourceCurationStatus, ResourceLifecycleStatus
+from osdu_commons.model.resource import Resource
+from osdu_commons.utils.srn import SRN
+from tests.test_root import TEST_COLLECTION_BASE_URL, TEST_DATA_API_BASE_URL, TEST_DELIVERY_SERVICE_BASE_URL, \
+    TEST_SEARCH_SERVICE_BASE_URL, TEST_WORKFLOW_BASE_URL
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_data_api_get_resources():
+    async def scenario():
+        async with AsyncDataAPIClient(base_url=TEST_DATA_API_BASE_URL) as client:
+            with aioresponses() as mocked:
+                mocked.post(
+                    f'{TEST_DATA_API_BASE_URL}/v1/getresources',
+                    payload={
+                        'ResourceIDs': ['srn:master-data/Well:123456789123:'],
+                        'ResourceData': [
+                            {
+                                'ResourceID': 'srn:master-data/Well:123456789123:',
+                                'ResourceTypeID': 'srn:type:master-data/Well:',
+                                'ResourceHomeRegionID': 'srn:reference-data/OSDURegion:us-east-1:',
+                                'ResourceHostRegionIDs': [],
+                                'ResourceObjectCreationDatetime': '2018-11-29 10:57:45',
+                                'ResourceVersionCreationDatetime': '2018-11-29 10:57:46',
+                                'ResourceCurationStatus': 'srn:reference-data/ResourceCurationStatus:CREATED:',
+                                'ResourceLifecycleStatus': 'srn:reference-data/ResourceLifecycleStatus:LOADING:',
+                                'Data': {}
+                            }
+                        ],
+                        'S3Location': [None],
+                        'UnprocessedSRNs': ['srn:master/Unprocessed:detail-1:1']
+                    },
+                    status=200
+                )
+                return await client.get_resources([SRN('master-data/Well', '123456789123')])
+
+    assert run(scenario()) == GetResourcesResult(
+        resources=[
+            Resource(
+                id=SRN('master-data/Well', '123456789123'),
+                type_id=SRN('type', 'master-data/Well'),
+                home_region_id=SRN('reference-data/OSDURegion', 'us-east-1'),
+                hosting_region_ids=[],
+                object_creation_date_time=arrow.get('2018-11-29 10:57:45'),
+                version_creation_date_time=arrow.get('2018-11-29 10:57:46'),
+                curation_status=ResourceCurationStatus.CREATED,
+                lifecycle_status=ResourceLifecycleStatus.LOADING,
+                data={}
+            )
+        ],
+        unprocessed_srns=[SRN('master/Unprocessed', 'detail-1', 1)]
+    )
+
+
+def test_delivery_get_resources_success_and_not_found():
+    async def scenario():
+        async with AsyncDeliveryClient(base_url=TEST_DELIVERY_SERVICE_BASE_URL) as client:
+            with aioresponses() as mocked:
+                mocked.post(
+                    f'{TEST_DELIVERY_SERVICE_BASE_URL}/GetResources',
+                    payload={'Result': [{'SRN': 'srn:a:b:1', 'Data': {'c': 'd'}}], 'TemporaryCredentials': {}},
+                    status=200
+                )
+                mocked.post(
+                    f'{TEST_DELIVERY_SERVICE_BASE_URL}/GetResources',
+                    payload={'Error': {'NotFoundResourceIDs': ['srn:a:c:1']}},
+                    status=404
+                )
+                success = await client.get_resources([SRN('a', 'b', 1)])
+                not_found = await client.get_resources([SRN('a', 'c', 1)])
+        return success, not_found
+
+    success, not_found = run(scenario())
+
+    assert success == GetResourcesResponseSuccess(
+        result=[GetResourcesResultItem(srn=SRN('a', 'b', 1), data={'c': 'd'})],
+        unprocessed_srn=[],
+        temporary_credentials={}
+    )
+    assert not_found == GetResourcesResponseNotFound(not_found_resource_ids=[SRN('a', 'c', 1)])
+
+
+def test_search_iter_index_search():
+    async def scenario():
+        async with AsyncSearchClient(base_url=TEST_SEARCH_SERVICE_BASE_URL) as client:
+            with aioresponses() as mocked:
+                for start in range(2):
+                    mocked.post(
+                        f'{TEST_SEARCH_SERVICE_BASE_URL}/indexSearch',
+                        payload={
+                            'results': [{'srn': f'srn:a:{start}:', 'files': []}],
+                            'total_hits': 2,
+                            'facets': {},
+                            'start': start,
+                            'count': 1
+                        },
+                        status=200
+                    )
+                return [result async for result in client.iter_index_search(SearchRequest(count=1))]
+
+    results = run(scenario())
+
+    assert [result.srn for result in results] == ['srn:a:0:', 'srn:a:1:']
+
+
+def test_workflow_describe_workflow():
+    async def scenario():
+        async with AsyncWorkflowClient(base_url=TEST_WORKFLOW_BASE_URL) as client:
+            with aioresponses() as mocked:
+                mocked.post(
+                    f'{TEST_WORKFLOW_BASE_URL}/DescribeWorkflow',
+                    payload={'WorkflowJobID': 'job-1', 'State': 'RUNNING'},
+                    status=200
+                )
+                return await client.describe_workflow('job-1')
+
+    assert run(scenario()) == WorkflowJobDescription(workflow_job_id='job-1', state=WorkflowStatus.RUNNING)
+
+
+def test_collection_get_collection():
+    async def scenario():
+        async with AsyncCollectionClient(base_url=TEST_COLLECTION_BASE_URL) as client:
+            with aioresponses() as mocked:
+                mocked.post(
+                    f'{TEST_COLLECTION_BASE_URL}/GetCollection',
+                    payload={'SRN': 'srn:collection/abc:1:1', 'Resources': ['srn:file/abc:1:1']},
+                    status=200
+                )
+                return await client.get_collection(SRN('collection/abc', '1', 1))
+
+    collection = run(scenario())
+
+    assert isinstance(collection, Collection)
+    assert collection.resources == [SRN('file/abc', '1', 1)]
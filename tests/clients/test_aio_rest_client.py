@@ -0,0 +1,96 @@
+import asyncio
+import json
+
+import pytest
+from aioresponses import aioresponses
+
+from osdu_commons.clients.aio.rest_client import AsyncRestClient
+from osdu_commons.clients.aio.retry import aio_osdu_retry
+from osdu_commons.clients.rest_client import HttpClientException, HttpServerException, HttpNotFoundException
+
+TEST_BASE_URL = 'https://example.com'
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_post_successful():
+    async def scenario():
+        async with AsyncRestClient(base_url=TEST_BASE_URL) as rest_client:
+            with aioresponses() as mocked:
+                mocked.post(f'{TEST_BASE_URL}/Test?c=d', payload={'e': 'f'}, status=200)
+
+                response = await rest_client.post(
+                    json={'a': 'b'},
+                    path='Test',
+                    params={'c': 'd'},
+                    headers={'user-agent': 'test-test'}
+                )
+                (call,) = list(mocked.requests.values())[0]
+        return response, call
+
+    response, call = run(scenario())
+
+    assert response.status_code == 200
+    assert response.json() == {'e': 'f'}
+    assert call.kwargs['json'] == {'a': 'b'}
+    assert call.kwargs['headers'] == {'user-agent': 'test-test'}
+
+
+@pytest.mark.parametrize('status,exception', [
+    (400, HttpClientException),
+    (404, HttpNotFoundException),
+    (500, HttpServerException),
+])
+def test_post_raises_http_exceptions(status, exception):
+    async def scenario():
+        async with AsyncRestClient(base_url=TEST_BASE_URL) as rest_client:
+            with aioresponses() as mocked:
+                mocked.post(f'{TEST_BASE_URL}/Test', payload={}, status=status)
+                await rest_client.post(json={'a': 'b'}, path='Test')
+
+    with pytest.raises(exception) as e:
+        run(scenario())
+
+    assert e.value.http_status == status
+    assert json.loads(e.value.response.request.body) == {'a': 'b'}
+
+
+def test_retry_on_server_error():
+    async def scenario():
+        async with AsyncRestClient(base_url=TEST_BASE_URL) as rest_client:
+            @aio_osdu_retry(max_retries=3, wait_fixed=0, wait_random_max=0)
+            async def post():
+                return await rest_client.post(json={}, path='Test')
+
+            with aioresponses() as mocked:
+                mocked.post(f'{TEST_BASE_URL}/Test', payload={}, status=500)
+                mocked.post(f'{TEST_BASE_URL}/Test', payload={}, status=502)
+                mocked.post(f'{TEST_BASE_URL}/Test', payload={'a': 'b'}, status=200)
+                return await post()
+
+    assert run(scenario()).json() == {'a': 'b'}
+
+
+def test_no_retry_on_client_error():
+    calls = []
+
+    async def scenario():
+        async with AsyncRestClient(base_url=TEST_BASE_URL) as rest_client:
+            @aio_osdu_retry(max_retries=3, wait_fixed=0, wait_random_max=0)
+            async def post():
+                calls.append(1)
+                return await rest_client.post(json={}, path='Test')
+
+            with aioresponses() as mocked:
+                mocked.post(f'{TEST_BASE_URL}/Test', payload={}, status=400, repeat=True)
+                return await post()
+
+    with pytest.raises(HttpClientException):
+        run(scenario())
+    assert len(calls) == 1
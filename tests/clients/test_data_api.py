@@ -1,11 +1,17 @@
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import arrow
+import pytest
 import responses
 
-from osdu_commons.clients.data_api_client import GetResourcesResult, DataAPIClient
+from osdu_commons.clients.data_api_client import BatchWriteError, GetResourcesResult, DataAPIClient, ResourceExists
+from osdu_commons.clients.rest_client import HttpClientException
 from osdu_commons.model.enums import ResourceCurationStatus, ResourceLifecycleStatus
 from osdu_commons.model.resource import ResourceInit, Resource, ResourceUpdate
+from osdu_commons.utils.single_flight import SingleFlightStats
 from osdu_commons.utils.srn import SRN
 
 from tests.test_root import TEST_DATA_API_BASE_URL
@@ -309,3 +315,186 @@ def test_get_resources_response(data_api_client: DataAPIClient):
         ],
         unprocessed_srns=[SRN('master/Unprocessed', 'detail-1', 1)]
     )
+
+
+@responses.activate
+@pytest.mark.parametrize('s3_locations', [[None, None], []])
+def test_get_resources_response_with_mismatched_arrays_fails(data_api_client: DataAPIClient, s3_locations):
+    responses.add(
+        responses.POST,
+        f'{TEST_DATA_API_BASE_URL}/v1/getresources',
+        json={
+            'ResourceIDs': ['srn:master-data/Well:1:', 'srn:master-data/Well:2:'],
+            'ResourceData': [{'ResourceID': 'srn:master-data/Well:1:'}],
+            'S3Location': s3_locations,
+            'UnprocessedSRNs': []
+        },
+        status=200
+    )
+
+    with pytest.raises(ValueError, match='2 ResourceIDs, 1 ResourceData'):
+        data_api_client.get_resources(resource_ids=[SRN('master-data/Well', '1'), SRN('master-data/Well', '2')])
+
+
+@responses.activate
+def test_get_resources_trusted_decode_builds_same_resources(data_api_client: DataAPIClient):
+    responses.add(
+        responses.POST,
+        f'{TEST_DATA_API_BASE_URL}/v1/getresources',
+        json={
+            'ResourceIDs': ['srn:master-data/Well:123456789123:'],
+            'ResourceData': [
+                {
+                    'ResourceID': 'srn:master-data/Well:123456789123:',
+                    'ResourceTypeID': 'srn:type:master-data/Well:',
+                    'ResourceHomeRegionID': 'srn:reference-data/OSDURegion:us-east-1:',
+                    'ResourceHostRegionIDs': ['srn:reference-data/OSDURegion:us-east-1:'],
+                    'ResourceObjectCreationDatetime': '2018-11-29 10:57:45',
+                    'ResourceVersionCreationDatetime': '2018-11-29 10:57:46',
+                    'ResourceCurationStatus': 'srn:reference-data/ResourceCurationStatus:CREATED:',
+                    'ResourceLifecycleStatus': 'srn:reference-data/ResourceLifecycleStatus:LOADING:',
+                    'Data': {'A': 1}
+                }
+            ],
+            'S3Location': ['s3://bucket/key'],
+            'UnprocessedSRNs': []
+        },
+        status=200
+    )
+    trusted_client = DataAPIClient(TEST_DATA_API_BASE_URL, trusted_decode=True)
+
+    assert trusted_client.trusted_decode
+    assert trusted_client.get_resources([SRN('master-data', 'detail-1', 1)]) == \
+        data_api_client.get_resources([SRN('master-data', 'detail-1', 1)])
+
+
+@responses.activate
+def test_get_resources_coalesces_identical_in_flight_requests():
+    def request_callback(request):
+        time.sleep(0.2)
+        return 200, {}, json.dumps({'ResourceIDs': [], 'ResourceData': [], 'UnprocessedSRNs': []})
+
+    responses.add_callback(
+        responses.POST,
+        f'{TEST_DATA_API_BASE_URL}/v1/getresources',
+        callback=request_callback,
+        content_type='application/json'
+    )
+    data_api_client = DataAPIClient(base_url=TEST_DATA_API_BASE_URL, coalesce_requests=True)
+    barrier = threading.Barrier(3)
+
+    def get_resources():
+        barrier.wait()
+        return data_api_client.get_resources([SRN('master-data', 'detail-1', 1)])
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = [future.result() for future in [executor.submit(get_resources) for _ in range(3)]]
+
+    assert len(responses.calls) == 1
+    assert results == [GetResourcesResult(resources=[], unprocessed_srns=[])] * 3
+    assert data_api_client.single_flight_stats == SingleFlightStats(hits=2, misses=1)
+
+
+def _create_resources_callback(request):
+    resource_types = json.loads(request.body)['ResourceType']
+    if 'srn:type:invalid:' in resource_types:
+        return 400, {}, json.dumps({'Error': 'Invalid type'})
+    if 'srn:type:exists:' in resource_types:
+        return 409, {}, json.dumps({'Error': 'Resource exists'})
+    resource_ids = [f'srn:{type_[len("srn:type:"):-1]}:1:' for type_ in resource_types]
+    return 201, {}, json.dumps({
+        'ResourceIDs': resource_ids,
+        'ResourceData': [
+            {
+                'ResourceID': resource_id,
+                'ResourceTypeID': 'srn:type:master-data/Well:',
+                'ResourceHomeRegionID': 'srn:reference-data/OSDURegion:us-east-1:',
+                'ResourceHostRegionIDs': [],
+                'ResourceObjectCreationDatetime': '2018-11-29 10:57:45',
+                'ResourceVersionCreationDatetime': '2018-11-29 10:57:46',
+                'ResourceCurationStatus': 'srn:reference-data/ResourceCurationStatus:CREATED:',
+                'ResourceLifecycleStatus': 'srn:reference-data/ResourceLifecycleStatus:LOADING:',
+                'Data': {}
+            } for resource_id in resource_ids
+        ]
+    })
+
+
+@responses.activate
+def test_create_resources_is_split_into_chunks():
+    responses.add_callback(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/createresources',
+                           callback=_create_resources_callback, content_type='application/json')
+    data_api_client = DataAPIClient(base_url=TEST_DATA_API_BASE_URL, write_batch_size=2)
+    resource_inits = [ResourceInit(type=SRN('type', f'master-data/Well{i}'), new_version=False) for i in range(5)]
+
+    resources = data_api_client.create_resources(resource_inits, region_id=SRN('region', 'te-test-1'))
+
+    assert [r.id for r in resources] == [SRN(f'master-data/Well{i}', '1') for i in range(5)]
+    assert sorted(len(json.loads(call.request.body)['ResourceType']) for call in responses.calls) == [1, 2, 2]
+
+
+@responses.activate
+def test_create_resources_reports_indices_of_failed_chunks():
+    responses.add_callback(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/createresources',
+                           callback=_create_resources_callback, content_type='application/json')
+    data_api_client = DataAPIClient(base_url=TEST_DATA_API_BASE_URL, write_batch_size=2)
+    resource_inits = [ResourceInit(type=SRN('type', f'master-data/Well{i}'), new_version=False) for i in range(5)]
+    resource_inits[3] = ResourceInit(type=SRN('type', 'invalid'), new_version=False)
+
+    with pytest.raises(BatchWriteError) as e:
+        data_api_client.create_resources(resource_inits, region_id=SRN('region', 'te-test-1'))
+
+    assert e.value.failed_indices == [2, 3]
+    assert isinstance(e.value.failed_chunks[0][1], HttpClientException)
+    assert {i: r.id for i, r in e.value.resources.items()} == {i: SRN(f'master-data/Well{i}', '1') for i in [0, 1, 4]}
+
+    with pytest.raises(HttpClientException):
+        data_api_client.create_resources(resource_inits[2:4], region_id=SRN('region', 'te-test-1'))
+
+
+@responses.activate
+def test_create_resources_with_existing_resources_in_chunks_raises_resource_exists():
+    responses.add_callback(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/createresources',
+                           callback=_create_resources_callback, content_type='application/json')
+    data_api_client = DataAPIClient(base_url=TEST_DATA_API_BASE_URL, write_batch_size=2)
+    resource_inits = [ResourceInit(type=SRN('type', f'master-data/Well{i}'), new_version=False) for i in range(5)]
+    resource_inits[1] = ResourceInit(type=SRN('type', 'exists'), new_version=False)
+
+    with pytest.raises(ResourceExists) as e:
+        data_api_client.create_resources(resource_inits, region_id=SRN('region', 'te-test-1'))
+
+    assert isinstance(e.value, BatchWriteError)
+    assert e.value.failed_indices == [0, 1]
+    assert {i: r.id for i, r in e.value.resources.items()} == {i: SRN(f'master-data/Well{i}', '1') for i in [2, 3, 4]}
+
+
+@responses.activate
+def test_get_resources_as_batch(data_api_client: DataAPIClient):
+    responses.add(
+        responses.POST,
+        f'{TEST_DATA_API_BASE_URL}/v1/getresources',
+        json={
+            'ResourceIDs': ['srn:master-data/Well:1:'],
+            'ResourceData': [
+                {
+                    'ResourceID': 'srn:master-data/Well:1:',
+                    'ResourceTypeID': 'srn:type:master-data/Well:',
+                    'ResourceHomeRegionID': 'srn:reference-data/OSDURegion:us-east-1:',
+                    'ResourceHostRegionIDs': [],
+                    'ResourceObjectCreationDatetime': '2018-11-29 10:57:45',
+                    'ResourceVersionCreationDatetime': '2018-11-29 10:57:46',
+                    'ResourceCurationStatus': 'srn:reference-data/ResourceCurationStatus:CREATED:',
+                    'ResourceLifecycleStatus': 'srn:reference-data/ResourceLifecycleStatus:LOADING:',
+                    'Data': {'A': 1}
+                }
+            ],
+            'UnprocessedSRNs': ['srn:master-data/Well:2:']
+        },
+        status=200
+    )
+
+    result = data_api_client.get_resources_as_batch([SRN('master-data/Well', '1'), SRN('master-data/Well', '2')])
+
+    assert [row.id for row in result.resources] == [SRN('master-data/Well', '1')]
+    assert result.resources[0].data == {'A': 1}
+    assert result.unprocessed_srns == [SRN('master-data/Well', '2')]
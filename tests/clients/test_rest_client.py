@@ -1,10 +1,11 @@
 import json
+import threading
 
 import pytest
 import responses
 
-from osdu_commons.clients.rest_client import (HttpClientException, HttpServerException, HttpUnrecognizedException,
-                                              RestClient)
+from osdu_commons.clients.rest_client import (ConnectionPoolConfig, HttpClientException, HttpServerException,
+                                              HttpUnrecognizedException, RestClient)
 
 TEST_BASE_URL = 'https://example.com'
 
@@ -83,3 +84,63 @@ def test_post_raises_unrecognized_exception(rest_client):
             json={'a': 'b'},
             path=f'{TEST_BASE_URL}/Test',
         )
+
+
+@responses.activate
+def test_post_reuses_session_and_connection_pool(rest_client):
+    responses.add(
+        responses.POST,
+        f'{TEST_BASE_URL}/Test',
+        json={},
+        status=200
+    )
+
+    rest_client.post(json={}, path='Test')
+    session = rest_client._get_session()
+    rest_client.post(json={}, path='Test')
+
+    assert rest_client._get_session() is session
+    assert len(responses.calls) == 2
+
+
+def test_threads_share_connection_pool(rest_client):
+    sessions = []
+    threads = [threading.Thread(target=lambda: sessions.append(rest_client._get_session())) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(session) for session in sessions}) == 3
+    assert len({id(session.adapters['https://']) for session in sessions}) == 1
+
+
+def test_pool_config_is_applied():
+    rest_client = RestClient(
+        base_url=TEST_BASE_URL,
+        pool_config=ConnectionPoolConfig(pool_size=3, max_connections_per_host=7, keep_alive=False)
+    )
+
+    session = rest_client._get_session()
+    adapter = session.adapters['https://']
+
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+    assert session.headers['Connection'] == 'close'
+
+
+@responses.activate
+def test_close_in_context_manager():
+    responses.add(
+        responses.POST,
+        f'{TEST_BASE_URL}/Test',
+        json={},
+        status=200
+    )
+
+    with RestClient(base_url=TEST_BASE_URL) as rest_client:
+        rest_client.post(json={}, path='Test')
+        adapter = rest_client._get_adapter()
+
+    assert rest_client._adapter is None
+    assert rest_client._get_adapter() is not adapter
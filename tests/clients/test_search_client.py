@@ -159,3 +159,19 @@ def test_search_result_from_json():
 
     result_from_as_dict = SearchResult.converter(result.asdict())
     assert result_from_as_dict == result
+
+
+def test_search_response_trusted_decode():
+    response_json = {
+        'results': [{'srn': 'srn:c:d:1', 'files': [{'filename': 'filename', 'srn': 'srn:a:b:1'}], 'a': 1}],
+        'start': 0,
+        'count': 1,
+        'total_hits': 1,
+        'facets': {}
+    }
+
+    assert SearchResponse.from_json(response_json, trusted=True) == SearchResponse.from_json(response_json) == \
+        SearchResponse(
+            results=[SearchResult(files=[SearchResultFile('filename', 'srn:a:b:1')], srn='srn:c:d:1', data={'a': 1})],
+            total_hits=1, facets={}, start=0, count=1
+        )
@@ -11,7 +11,7 @@ from osdu_commons.clients.data_api_client import DataAPIClient
 from osdu_commons.clients.delivery_client import DeliveryClient
 from osdu_commons.clients.search_client import SearchClient
 from osdu_commons.clients.workflow_client import WorkflowClient
-from osdu_commons.services.data_api_service import DataAPIService
+from osdu_commons.services.data_api_service import DataAPIService, GetResourcesConfig
 from osdu_commons.services.delivery_service import DeliveryService
 from osdu_commons.services.search_service import SearchService
 from osdu_commons.services.workflow_service import WorkflowService
@@ -67,7 +67,8 @@ def data_api_client():
 def data_api_service(data_api_client):
     return DataAPIService(
         data_api_client=data_api_client,
-        region_id=SRN('reference-data/OSDURegion', 'us-east-1')
+        region_id=SRN('reference-data/OSDURegion', 'us-east-1'),
+        get_resources_config=GetResourcesConfig(base_delay_ms=1, max_delay_ms=1)
     )
 
 
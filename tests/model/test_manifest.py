@@ -1,5 +1,18 @@
+import attr
+
 from osdu_commons.model.swps_manifest import manifest_from_camel_dict
+from osdu_commons.utils.frozen import FrozenDict
 
 
 def test_simple_manifest(example_manifest):
     manifest_from_camel_dict(example_manifest)
+
+
+def test_manifest_properties_are_frozen(example_manifest):
+    manifest = manifest_from_camel_dict(example_manifest)
+    work_product_data = manifest.work_product.data
+
+    assert isinstance(work_product_data.individual_type_properties, FrozenDict)
+    assert work_product_data.asdict()['IndividualTypeProperties'] == \
+        example_manifest['WorkProduct']['Data']['IndividualTypeProperties']
+    assert attr.evolve(work_product_data).individual_type_properties is work_product_data.individual_type_properties
@@ -1,8 +1,12 @@
+import json
+import pickle
+
 import pytest
 import arrow
+import attr
 
 from osdu_commons.model.enums import ResourceCurationStatus, ResourceLifecycleStatus
-from osdu_commons.model.resource import Resource
+from osdu_commons.model.resource import LazyResource, Resource, decode_group_type_properties
 from osdu_commons.utils.srn import SRN
 
 
@@ -58,3 +62,65 @@ def test_resource_from_dict(resource: Resource):
     as_dict = resource.asdict()
     resource_from_dict = Resource.from_dict(as_dict)
     assert resource == resource_from_dict
+
+
+def test_lazy_resource_decodes_data_on_first_access(resource: Resource):
+    as_dict = resource.asdict(data_to_string=True)
+    lazy_resource = LazyResource.from_dict(as_dict)
+
+    assert lazy_resource.group_type_properties == {'Components': []}
+    assert lazy_resource._raw_data is as_dict['Data']
+    assert lazy_resource.asdict(data_to_string=True)['Data'] is as_dict['Data']
+    assert lazy_resource.data == resource.data
+    assert lazy_resource == LazyResource.from_dict(as_dict)
+    assert attr.evolve(lazy_resource, data={}).data == {}
+    assert pickle.loads(pickle.dumps(lazy_resource)).asdict(data_to_string=True) == as_dict
+
+
+@pytest.mark.parametrize('raw_data, group_type_properties', [
+    ('{"GroupTypeProperties": {"Components": ["a"]}, "IndividualTypeProperties": {not decoded', {'Components': ['a']}),
+    (b' {"A": {"GroupTypeProperties": 1}, "B": "\\"GroupTypeProperties\\": 2",\n "GroupTypeProperties": {"C": []}}',
+     {'C': []}),
+    ('{"A": {"GroupTypeProperties": 1}}', {}),
+    ('{}', {}),
+])
+def test_decode_group_type_properties(raw_data, group_type_properties):
+    assert decode_group_type_properties(raw_data) == group_type_properties
+
+
+def test_lazy_resource_equals_resource_with_same_content(resource: Resource):
+    lazy_resource = LazyResource.from_dict(resource.asdict(data_to_string=True))
+    other_resource = attr.evolve(resource, data={'Other': 1})
+
+    assert lazy_resource == resource
+    assert resource == lazy_resource
+    assert not lazy_resource != resource
+    assert lazy_resource != other_resource
+    assert other_resource != lazy_resource
+    assert lazy_resource != resource.asdict()
+
+
+@pytest.mark.parametrize('raw_data', ['[1, 2]', 'null'])
+def test_lazy_resource_validates_decoded_data(resource: Resource, raw_data):
+    lazy_resource = LazyResource(
+        raw_data=raw_data, **{a.name: getattr(resource, a.name) for a in attr.fields(Resource) if a.name != 'data'}
+    )
+
+    with pytest.raises(TypeError):
+        lazy_resource.data
+
+
+def test_lazy_resource_from_bytes(resource: Resource):
+    raw_data = json.dumps(resource.data).encode('utf-8')
+    lazy_resource = LazyResource(
+        raw_data=raw_data,
+        **{a.name: getattr(resource, a.name) for a in attr.fields(Resource) if a.name != 'data'}
+    )
+
+    assert lazy_resource.asdict(data_to_string=True)['Data'] == raw_data.decode('utf-8')
+    assert lazy_resource.data == resource.data
+
+
+def test_resource_is_slotted_and_picklable(resource: Resource):
+    assert not hasattr(resource, '__dict__')
+    assert pickle.loads(pickle.dumps(resource)) == resource
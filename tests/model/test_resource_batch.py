@@ -0,0 +1,94 @@
+import json
+
+import attr
+import pytest
+
+from osdu_commons.clients.data_api_client import DataAPIClient
+from osdu_commons.clients.delivery_client import GetResourcesResultItem
+from osdu_commons.model.aws import S3Location
+from osdu_commons.model.enums import ResourceLifecycleStatus
+from osdu_commons.model.resource import LazyResource
+from osdu_commons.model.resource_batch import ResourceBatch
+from osdu_commons.utils.srn import SRN
+
+
+def _resource_body(resource_id, type_id, lifecycle_status, data):
+    return {
+        'ResourceID': resource_id,
+        'ResourceTypeID': type_id,
+        'ResourceHomeRegionID': 'srn:reference-data/OSDURegion:us-east-1:',
+        'ResourceHostRegionIDs': ['srn:reference-data/OSDURegion:us-east-1:'],
+        'ResourceObjectCreationDatetime': '2018-11-29 10:57:45',
+        'ResourceVersionCreationDatetime': '2018-11-29 10:57:46',
+        'ResourceCurationStatus': 'srn:reference-data/ResourceCurationStatus:CREATED:',
+        'ResourceLifecycleStatus': f'srn:reference-data/ResourceLifecycleStatus:{lifecycle_status}:',
+        'Data': data
+    }
+
+
+@pytest.fixture()
+def response_json():
+    return {
+        'ResourceIDs': ['srn:master-data/Well:1:1', 'srn:file/las2:2:1', 'srn:file/las2:3:1'],
+        'ResourceData': [
+            _resource_body('srn:master-data/Well:1:1', 'srn:type:master-data/Well:', 'LOADING', {'A': 1}),
+            _resource_body('srn:file/las2:2:1', 'srn:type:file/las2:', 'RECEIVED', {'B': 2}),
+            _resource_body('srn:file/las2:3:1', 'srn:type:file/las2:', 'LOADING', '{"GroupTypeProperties": {}}'),
+        ],
+        'S3Location': [None, 's3://bucket/2', 's3://bucket/3'],
+    }
+
+
+def test_rows_behave_like_resources(response_json):
+    batch = ResourceBatch.from_data_api_response(response_json)
+    response_json['ResourceData'][2]['Data'] = json.loads(response_json['ResourceData'][2]['Data'])
+    resources = DataAPIClient._decode_resources(response_json)
+
+    assert len(batch) == 3
+    assert [batch[0].to_resource(), batch[1].to_resource()] == resources[:2]
+    lazy_resource = batch[2].to_resource()
+    assert isinstance(lazy_resource, LazyResource)
+    assert attr.asdict(lazy_resource) == attr.asdict(resources[2])
+    assert batch[1].s3_location == S3Location(bucket='bucket', key='2')
+    assert batch[-1].data == {'GroupTypeProperties': {}}
+    assert batch[0].lifecycle_status == ResourceLifecycleStatus.LOADING
+    assert batch[0].object_creation_date_time == resources[0].object_creation_date_time
+    assert batch[0].version_creation_epoch_microseconds == 1543489066000000
+
+
+def test_mismatched_response_arrays_fail(response_json):
+    response_json['S3Location'] = response_json['S3Location'][:2]
+
+    with pytest.raises(ValueError, match='2 S3Location'):
+        ResourceBatch.from_data_api_response(response_json)
+
+
+def test_filtering(response_json):
+    batch = ResourceBatch.from_data_api_response(response_json)
+
+    assert [row.id for row in batch.filter_by_type('file/')] == [SRN('file/las2', '2', 1), SRN('file/las2', '3', 1)]
+    assert [row.id for row in batch.filter_by_type(SRN('type', 'master-data/Well'))] == [SRN('master-data/Well', '1', 1)]
+    assert [row.id for row in batch.filter_by_type('file/').filter_by_lifecycle_status(
+        ResourceLifecycleStatus.LOADING
+    )] == [SRN('file/las2', '3', 1)]
+
+
+def test_delivery_batch():
+    credentials = {'AccessKeyId': 'key'}
+    found = ResourceBatch.from_delivery_items(
+        [GetResourcesResultItem(srn=SRN('file/las2', '1'), data={}, s3_location={'Bucket': 'b', 'Key': 'k'})],
+        credentials
+    )
+    not_found = ResourceBatch.from_delivery_items([GetResourcesResultItem(srn=SRN('file/las2', '2'))], exists=False)
+
+    batch = ResourceBatch.concat([found, not_found])
+
+    assert [(row.srn, row.exists, row.temporary_credentials) for row in batch] == [
+        (SRN('file/las2', '1'), True, credentials),
+        (SRN('file/las2', '2'), False, None),
+    ]
+    assert batch[0].s3_location == S3Location(bucket='b', key='k')
+    assert batch[0].type_id == SRN('type', 'file/las2')
+    assert [row.srn for row in batch.filter_existing()] == [SRN('file/las2', '1')]
+    with pytest.raises(ValueError):
+        batch.filter_by_lifecycle_status(ResourceLifecycleStatus.LOADING)
@@ -1,13 +1,27 @@
+import copy
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
 
 import arrow
 import pytest
 import responses
 from tests.test_root import TEST_DATA_API_BASE_URL
 
+from osdu_commons.clients.data_api_client import DataAPIClient
+from osdu_commons.clients.delivery_client import GetResourcesResponseSuccess, GetResourcesResultItem
+from osdu_commons.clients.rest_client import HttpClientException
 from osdu_commons.model.enums import ResourceCurationStatus, ResourceLifecycleStatus
-from osdu_commons.model.resource import Resource
+from osdu_commons.model.resource import Resource, ResourceUpdate
 from osdu_commons.model.smds_manifest import SMDSManifest
+from osdu_commons.model.swps_manifest import manifest_from_camel_dict
+from osdu_commons.services.data_api_service import DataAPIService, GetResourcesConfig, WriteStats, \
+    UnprocessedResourcesException
+from osdu_commons.services.delivery_service import DeliveredResource, DeliveryService
+from osdu_commons.utils.batching import BatchingConfig, MissingBatchResult
+from osdu_commons.utils.disk_resource_cache import DiskResourceCache
+from osdu_commons.utils.resource_cache import ResourceCache
 from osdu_commons.utils.srn import SRN
 
 
@@ -387,3 +401,434 @@ def test_create_smds_from_manifest(data_api_service):
     resource_id = data_api_service.create_smds_from_manifest(manifest)
 
     assert resource_id == SRN.from_string('srn:master-data/Wellbore:12345678912301:')
+
+
+def _resource_data(resource_id):
+    return {
+        'ResourceID': resource_id,
+        'ResourceTypeID': 'srn:type:master-data/Well:',
+        'ResourceHomeRegionID': 'srn:reference-data/OSDURegion:us-east-1:',
+        'ResourceHostRegionIDs': [],
+        'ResourceObjectCreationDatetime': '2018-11-29 10:57:45',
+        'ResourceVersionCreationDatetime': '2018-11-29 10:57:46',
+        'ResourceCurationStatus': 'srn:reference-data/ResourceCurationStatus:CREATED:',
+        'ResourceLifecycleStatus': 'srn:reference-data/ResourceLifecycleStatus:LOADING:',
+        'Data': {}
+    }
+
+
+def _add_get_resources_callback(resource_data=_resource_data, missing_suffix=None, unprocessed_suffix=None,
+                                with_s3_locations=False):
+    def request_callback(request):
+        resource_ids = [
+            resource_id for resource_id in json.loads(request.body)['ResourceIDs']
+            if not (missing_suffix and resource_id.endswith(missing_suffix))
+        ]
+        unprocessed_ids = [
+            resource_id for resource_id in resource_ids if unprocessed_suffix and resource_id.endswith(unprocessed_suffix)
+        ]
+        processed_ids = [resource_id for resource_id in resource_ids if resource_id not in unprocessed_ids]
+        body = {
+            'ResourceIDs': processed_ids,
+            'ResourceData': [resource_data(resource_id) for resource_id in processed_ids],
+            'UnprocessedSRNs': unprocessed_ids
+        }
+        if with_s3_locations:
+            body['S3Location'] = [f's3://bucket/{resource_id}' for resource_id in processed_ids]
+        return 200, {}, json.dumps(body)
+
+    responses.add_callback(
+        responses.POST,
+        f'{TEST_DATA_API_BASE_URL}/v1/getresources',
+        callback=request_callback,
+        content_type='application/json'
+    )
+
+
+@responses.activate
+def test_get_all_resources_with_batching_merges_concurrent_lookups(data_api_client):
+    _add_get_resources_callback(missing_suffix=':missing:')
+    data_api_service = DataAPIService(
+        data_api_client=data_api_client,
+        region_id=SRN('reference-data/OSDURegion', 'us-east-1'),
+        batching=BatchingConfig(max_wait_ms=200)
+    )
+    srns = [SRN('master-data/Well', str(i)) for i in range(5)]
+
+    with ThreadPoolExecutor(max_workers=len(srns)) as executor:
+        results = list(executor.map(lambda srn: data_api_service.get_all_resources([srn]), srns))
+    with pytest.raises(MissingBatchResult):
+        data_api_service.get_all_resources([SRN('master-data/Well', 'missing')])
+    data_api_service.close()
+
+    assert [resources[0].id for resources in results] == srns
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_get_all_resources_with_cache_invalidated_on_update(data_api_client):
+    _add_get_resources_callback()
+    responses.add(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/updateresources', json={
+        'ResourceIDs': [], 'ResourceData': [], 'S3Location': []
+    }, status=200)
+    data_api_service = DataAPIService(
+        data_api_client=data_api_client,
+        region_id=SRN('reference-data/OSDURegion', 'us-east-1'),
+        resource_cache=ResourceCache()
+    )
+    well_id, other_well_id = SRN('master-data/Well', '1'), SRN('master-data/Well', '2')
+
+    data_api_service.get_all_resources([well_id])
+    resources = data_api_service.get_all_resources([other_well_id, well_id])
+    data_api_service._update_resources(
+        [ResourceUpdate(id=well_id, data={}, lifecycle_status=ResourceLifecycleStatus.LOADING)],
+        region_id=SRN('reference-data/OSDURegion', 'us-east-1')
+    )
+    data_api_service.get_all_resources([well_id, other_well_id])
+
+    assert [r.id for r in resources] == [other_well_id, well_id]
+    assert [
+        (call.request.url.rsplit('/', 1)[-1], json.loads(call.request.body)['ResourceIDs']) for call in responses.calls
+    ] == [
+        ('getresources', [str(well_id)]),
+        ('getresources', [str(other_well_id)]),
+        ('updateresources', [str(well_id)]),
+        ('getresources', [str(well_id)]),
+    ]
+    assert data_api_service.resource_cache_stats.hits == 2
+
+
+@pytest.mark.parametrize('make_cache', [
+    lambda tmp_path: ResourceCache(),
+    lambda tmp_path: DiskResourceCache(str(tmp_path / 'cache.sqlite')),
+])
+@responses.activate
+def test_resource_cache_shared_with_delivery_service(data_api_client, tmp_path, make_cache):
+    _add_get_resources_callback()
+    resource_cache = make_cache(tmp_path)
+    well_id = SRN('master-data/Well', '1')
+    delivery_client = Mock()
+    delivery_client.get_resources = Mock(return_value=GetResourcesResponseSuccess(
+        result=[GetResourcesResultItem(srn=well_id, data={'A': 1})], temporary_credentials={}, unprocessed_srn=[]
+    ))
+    delivery_service = DeliveryService(delivery_client, resource_cache=resource_cache)
+    data_api_service = DataAPIService(
+        data_api_client=data_api_client,
+        region_id=SRN('reference-data/OSDURegion', 'us-east-1'),
+        resource_cache=resource_cache
+    )
+
+    delivered = list(delivery_service.get_resources([well_id])) + list(delivery_service.get_resources([well_id]))
+    resources = data_api_service.get_all_resources([well_id]) + data_api_service.get_all_resources([well_id])
+
+    assert [type(resource) for resource in delivered] == [DeliveredResource] * 2
+    assert [type(resource) for resource in resources] == [Resource] * 2
+    assert delivery_client.get_resources.call_count == 1
+    assert len(responses.calls) == 1
+    assert resource_cache.stats.hits == 2
+
+
+def _tree_resource_data(tree):
+    def resource_data(resource_id):
+        return dict(
+            _resource_data(resource_id),
+            ResourceTypeID=f'srn:type:{SRN.from_string(resource_id).type}:',
+            Data={'GroupTypeProperties': tree.get(resource_id, {})}
+        )
+    return resource_data
+
+
+WP_ID = 'srn:work-product/WellLog:1:'
+WPC_IDS = [f'srn:work-product-component/WellLog:{i}:' for i in range(3)]
+FILE_IDS = [f'srn:file/las2:{i}:' for i in range(3)]
+TREE = {
+    WP_ID: {'Components': WPC_IDS, 'Artefacts': [{'ResourceID': 'srn:file/pdf:1:'}]},
+    WPC_IDS[0]: {'Files': [FILE_IDS[0], FILE_IDS[1]]},
+    WPC_IDS[1]: {'Files': [FILE_IDS[1]]},
+    WPC_IDS[2]: {'Files': [FILE_IDS[2]]},
+}
+
+
+@responses.activate
+def test_iter_resources_tree_breadth_first_fetches_levels(data_api_service):
+    _add_get_resources_callback(_tree_resource_data(TREE))
+
+    resources = list(data_api_service.iter_resources_tree(
+        SRN.from_string(WP_ID), with_artefacts=True, breadth_first=True
+    ))
+
+    assert [str(r.id) for r in resources] == [WP_ID] + WPC_IDS + ['srn:file/pdf:1:'] + FILE_IDS
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_iter_resources_tree_depth_limit_and_type_filter(data_api_service):
+    _add_get_resources_callback(_tree_resource_data(TREE))
+
+    for breadth_first in [False, True]:
+        limited = data_api_service.iter_resources_tree(
+            SRN.from_string(WP_ID), with_artefacts=True, breadth_first=breadth_first, max_depth=1
+        )
+        filtered = data_api_service.iter_resources_tree(
+            SRN.from_string(WP_ID), with_artefacts=True, breadth_first=breadth_first,
+            type_filter=lambda type_: not type_.startswith('file/')
+        )
+
+        assert [str(r.id) for r in limited] == [WP_ID] + WPC_IDS + ['srn:file/pdf:1:']
+        assert [str(r.id) for r in filtered] == [WP_ID] + WPC_IDS
+
+
+@responses.activate
+def test_get_all_resources_splits_large_requests(data_api_service):
+    _add_get_resources_callback()
+    srns = [SRN('master-data/Well', str(i)) for i in range(250)]
+
+    resources = data_api_service.get_all_resources(srns)
+
+    assert [r.id for r in resources] == srns
+    assert sorted(len(json.loads(call.request.body)['ResourceIDs']) for call in responses.calls) == [50, 100, 100]
+
+
+@responses.activate
+def test_get_all_resources_keeps_partial_results_when_budget_runs_out(data_api_client):
+    _add_get_resources_callback(unprocessed_suffix=':throttled:')
+    data_api_service = DataAPIService(
+        data_api_client=data_api_client,
+        region_id=SRN('reference-data/OSDURegion', 'us-east-1'),
+        get_resources_config=GetResourcesConfig(max_attempts=1000, time_budget_seconds=0.2, base_delay_ms=10,
+                                                max_delay_ms=50)
+    )
+
+    with pytest.raises(UnprocessedResourcesException) as e:
+        data_api_service.get_all_resources([SRN('master-data/Well', '1'), SRN('master-data/Well', 'throttled')])
+
+    assert [r.id for r in e.value.resources] == [SRN('master-data/Well', '1')]
+    assert e.value.unprocessed_srns == [SRN('master-data/Well', 'throttled')]
+    assert 1 < len(responses.calls) < 1000
+
+
+def _add_work_product_callbacks():
+    created_ids = []
+    lock = threading.Lock()
+
+    def create_callback(request):
+        resource_types = json.loads(request.body)['ResourceType']
+        if any('Invalid' in type_ for type_ in resource_types):
+            return 400, {}, json.dumps({'Error': 'Invalid type'})
+        with lock:
+            resource_ids = [
+                f'srn:{SRN.from_string(type_).detail}:{len(created_ids) + i}:' for i, type_ in enumerate(resource_types)
+            ]
+            created_ids.extend(resource_ids)
+        return 201, {}, json.dumps({
+            'ResourceIDs': resource_ids,
+            'ResourceData': [_resource_data(resource_id) for resource_id in resource_ids],
+        })
+
+    responses.add_callback(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/createresources', callback=create_callback,
+                           content_type='application/json')
+    _add_get_resources_callback(with_s3_locations=True)
+    responses.add(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/updateresources', json={
+        'ResourceIDs': [], 'ResourceData': [], 'S3Location': []
+    }, status=200)
+    return created_ids
+
+
+@responses.activate
+def test_create_work_product_from_manifest(data_api_service, example_manifest):
+    created_ids = _add_work_product_callbacks()
+    manifest = manifest_from_camel_dict(example_manifest)
+
+    result = data_api_service.create_work_product_from_manifest(manifest)
+
+    updates = {
+        resource_id: json.loads(data)['Data']
+        for call in responses.calls if call.request.url.endswith('updateresources')
+        for resource_id, data in zip(json.loads(call.request.body)['ResourceIDs'],
+                                     json.loads(call.request.body)['ResourceData'])
+    }
+    wp_id = next(id_ for id_ in created_ids if id_.startswith('srn:work-product/'))
+    wpc_ids = [id_ for id_ in created_ids if id_.startswith('srn:work-product-component/')]
+    file_ids = [id_ for id_ in created_ids if id_.startswith('srn:file/')]
+    assert str(result.work_product.id) == wp_id
+    assert sorted(result.file_associative_id_to_file_location_map) == sorted(f.associative_id for f in manifest.files)
+    assert all(location.key in file_ids for location in result.file_associative_id_to_file_location_map.values())
+    assert updates[wp_id]['GroupTypeProperties']['Components'][-len(wpc_ids):] == wpc_ids
+    assert set(result.step_timings) == {
+        'create_files', 'create_wpcs', 'create_wp', 'update_files', 'get_files', 'update_wpcs', 'update_wp', 'get_wp'
+    }
+
+
+@responses.activate
+def test_create_work_products_from_manifests_merges_calls_and_isolates_errors(data_api_service, example_manifest):
+    created_ids = _add_work_product_callbacks()
+    invalid_manifest = copy.deepcopy(example_manifest)
+    invalid_manifest['WorkProduct']['ResourceTypeID'] = 'srn:type:work-product/Invalid:'
+    manifests = [manifest_from_camel_dict(m) for m in [example_manifest, invalid_manifest, example_manifest]]
+    resources_per_manifest = len(manifests[0].files) + len(manifests[0].work_product_components) + 1
+
+    outcomes = data_api_service.create_work_products_from_manifests(manifests, batch_size=2 * resources_per_manifest)
+
+    assert [outcome.succeeded for outcome in outcomes] == [True, False, True]
+    assert isinstance(outcomes[1].error, HttpClientException)
+    assert [str(outcome.result.work_product.id) for outcome in outcomes if outcome.succeeded] == [
+        id_ for id_ in created_ids if id_.startswith('srn:work-product/')
+    ]
+    assert sorted(outcomes[2].result.file_associative_id_to_file_location_map) == sorted(
+        f.associative_id for f in manifests[2].files
+    )
+    assert [call.request.url.rsplit('/', 1)[-1] for call in responses.calls] == [
+        'createresources', 'createresources', 'createresources', 'createresources', 'updateresources', 'getresources'
+    ]
+
+
+@responses.activate
+def test_create_work_products_from_manifests_repeats_only_failed_chunks(example_manifest):
+    created_ids = _add_work_product_callbacks()
+    invalid_manifest = copy.deepcopy(example_manifest)
+    invalid_manifest['WorkProduct']['ResourceTypeID'] = 'srn:type:work-product/Invalid:'
+    manifests = [manifest_from_camel_dict(m) for m in [example_manifest, invalid_manifest, example_manifest]]
+    resources_per_manifest = len(manifests[0].files) + len(manifests[0].work_product_components) + 1
+    data_api_service = DataAPIService(
+        data_api_client=DataAPIClient(base_url=TEST_DATA_API_BASE_URL, write_batch_size=resources_per_manifest),
+        region_id=SRN('reference-data/OSDURegion', 'us-east-1'),
+    )
+
+    outcomes = data_api_service.create_work_products_from_manifests(manifests, batch_size=3 * resources_per_manifest)
+
+    assert [outcome.succeeded for outcome in outcomes] == [True, False, True]
+    assert len(created_ids) == 2 * resources_per_manifest
+    assert sorted(str(outcome.result.work_product.id) for outcome in outcomes if outcome.succeeded) == sorted(
+        id_ for id_ in created_ids if id_.startswith('srn:work-product/')
+    )
+    assert [call.request.url.rsplit('/', 1)[-1] for call in responses.calls].count('createresources') == 4
+
+
+@responses.activate
+@pytest.mark.parametrize('write_batch_size', [None, 2])
+def test_upsert_smds_manifests_versions_only_existing_resources(write_batch_size):
+    data_api_service = DataAPIService(
+        data_api_client=DataAPIClient(base_url=TEST_DATA_API_BASE_URL, write_batch_size=write_batch_size),
+        region_id=SRN('reference-data/OSDURegion', 'us-east-1'),
+    )
+    existing_keys = {'1', '3'}
+    create_requests, created_keys = [], []
+
+    def create_callback(request):
+        body = json.loads(request.body)
+        create_requests.append(body)
+        if any(key in existing_keys and not new_version for key, new_version in zip(body['Keys'], body['NewVersion'])):
+            return 409, {}, json.dumps({'Error': 'Resource exists'})
+        created_keys.extend(body['Keys'])
+        resource_ids = [
+            f'srn:master-data/Wellbore:{key}:{2 if new_version else 1}'
+            for key, new_version in zip(body['Keys'], body['NewVersion'])
+        ]
+        return 201, {}, json.dumps({
+            'ResourceIDs': resource_ids,
+            'ResourceData': [_resource_data(resource_id) for resource_id in resource_ids],
+        })
+
+    responses.add_callback(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/createresources', callback=create_callback,
+                           content_type='application/json')
+    responses.add(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/updateresources', json={
+        'ResourceIDs': [], 'ResourceData': [], 'S3Location': []
+    }, status=200)
+    manifests = [
+        SMDSManifest(
+            resource_id=SRN('master-data/Wellbore', str(i)),
+            resource_type_id=SRN('type', 'master-data/Wellbore'),
+            resource_security_classification=SRN('reference-data/ResourceSecurityClassification', 'RESTRICTED'),
+            data={'Index': i}
+        ) for i in range(5)
+    ]
+
+    outcomes = data_api_service.upsert_smds_manifests(manifests)
+
+    assert [outcome.resource_id for outcome in outcomes] == [
+        SRN('master-data/Wellbore', str(i), 2 if str(i) in existing_keys else 1) for i in range(5)
+    ]
+    assert [body['Keys'] for body in create_requests if body['NewVersion'][0]] == [['1', '3']]
+    assert sorted(created_keys) == ['0', '1', '2', '3', '4']
+    update_calls = [call for call in responses.calls if call.request.url.endswith('updateresources')]
+    assert sum(len(json.loads(call.request.body)['ResourceIDs']) for call in update_calls) == 5
+
+
+@responses.activate
+def test_upsert_smds_manifests_fails_whole_batch_without_bisecting_other_errors(data_api_service):
+    responses.add(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/createresources', json={'Error': 'Bad'}, status=400)
+    manifests = [
+        SMDSManifest(
+            resource_id=SRN('master-data/Wellbore', str(i)),
+            resource_type_id=SRN('type', 'master-data/Wellbore'),
+            resource_security_classification=SRN('reference-data/ResourceSecurityClassification', 'RESTRICTED'),
+            data={'Index': i}
+        ) for i in range(4)
+    ]
+
+    outcomes = data_api_service.upsert_smds_manifests(manifests)
+
+    assert all(isinstance(outcome.error, HttpClientException) for outcome in outcomes)
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_update_resources_skips_unchanged_writes(data_api_client):
+    _add_get_resources_callback(lambda resource_id: dict(_resource_data(resource_id), Data={'B': 2, 'A': [1]}))
+    responses.add(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/updateresources', json={
+        'ResourceIDs': ['srn:master-data/Well:2:'], 'ResourceData': [_resource_data('srn:master-data/Well:2:')],
+        'S3Location': []
+    }, status=200)
+    data_api_service = DataAPIService(
+        data_api_client=data_api_client,
+        region_id=SRN('reference-data/OSDURegion', 'us-east-1'),
+        skip_unchanged_writes=True
+    )
+    unchanged_id, changed_id = SRN('master-data/Well', '1'), SRN('master-data/Well', '2')
+
+    resources = data_api_service._update_resources([
+        ResourceUpdate(id=unchanged_id, data={'A': [1], 'B': 2}, lifecycle_status=ResourceLifecycleStatus.LOADING),
+        ResourceUpdate(id=changed_id, data={'A': [1], 'B': 3}),
+    ], region_id=SRN('reference-data/OSDURegion', 'us-east-1'))
+
+    update_calls = [call for call in responses.calls if call.request.url.endswith('updateresources')]
+    assert [json.loads(call.request.body)['ResourceIDs'] for call in update_calls] == [[str(changed_id)]]
+    assert [resource.id for resource in resources] == [unchanged_id, changed_id]
+    assert resources[0].data == {'A': [1], 'B': 2}
+    assert data_api_service.write_stats == WriteStats(written=1, skipped=1)
+
+
+@responses.activate
+def test_update_resources_counts_only_successful_writes(data_api_service):
+    responses.add(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/updateresources', json={'Error': 'Bad'}, status=400)
+
+    with pytest.raises(HttpClientException):
+        data_api_service._update_resources(
+            [ResourceUpdate(id=SRN('master-data/Well', '1'), data={'A': 1})],
+            region_id=SRN('reference-data/OSDURegion', 'us-east-1')
+        )
+
+    assert data_api_service.write_stats == WriteStats(written=0, skipped=0)
+
+
+@responses.activate
+def test_update_resources_returns_current_resources_when_all_are_unchanged(data_api_client):
+    responses.add(responses.POST, f'{TEST_DATA_API_BASE_URL}/v1/getresources', json={
+        'ResourceIDs': ['srn:master-data/Well:1:'],
+        'ResourceData': [dict(_resource_data('srn:master-data/Well:1:'), Data={'A': 1})],
+        'UnprocessedSRNs': []
+    }, status=200)
+    data_api_service = DataAPIService(
+        data_api_client=data_api_client,
+        region_id=SRN('reference-data/OSDURegion', 'us-east-1'),
+        skip_unchanged_writes=True
+    )
+
+    resources = data_api_service._update_resources(
+        [ResourceUpdate(id=SRN('master-data/Well', '1'), data={'A': 1})],
+        region_id=SRN('reference-data/OSDURegion', 'us-east-1')
+    )
+
+    assert [(resource.id, resource.data) for resource in resources] == [(SRN('master-data/Well', '1'), {'A': 1})]
+    assert len(responses.calls) == 1
+    assert data_api_service.write_stats == WriteStats(written=0, skipped=1)
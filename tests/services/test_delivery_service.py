@@ -1,3 +1,5 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Iterable
 from unittest.mock import Mock
 
@@ -8,6 +10,8 @@ from osdu_commons.clients.delivery_client import GetResourcesResponseSuccess, Ge
      GetResourcesResultItem
 from osdu_commons.model.aws import S3Location
 from osdu_commons.services.delivery_service import DeliveryService, DeliveredResource
+from osdu_commons.utils.batching import BatchingConfig
+from osdu_commons.utils.disk_resource_cache import DiskResourceCache
 from osdu_commons.utils.srn import SRN
 
 
@@ -64,3 +68,118 @@ def test_get_resources_multiple_requests(srns, delivery_service: DeliveryService
     assert list(get_resources_response) == [
         DeliveredResource(srn=res['srn'], data=res['data'], s3_location=res['s3_location'],
                           temporary_credentials=credentials, exists=True) for res in resources]
+
+
+def test_get_resource_with_batching_routes_found_and_not_found_resources():
+    found_srn, not_found_srn = SRN('a', 'found', 1), SRN('a', 'not-found', 1)
+    credentials = Mock(spec=dict)
+
+    def get_resources(srns):
+        if not_found_srn in srns:
+            return GetResourcesResponseNotFound(not_found_resource_ids=[not_found_srn])
+        return create_resource_response_success([{'srn': srn} for srn in srns], credentials)
+
+    delivery_client_mock = Mock()
+    delivery_client_mock.get_resources = Mock(side_effect=get_resources)
+    delivery_service = DeliveryService(delivery_client_mock, batching=BatchingConfig(max_wait_ms=200))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        found, not_found = executor.map(delivery_service.get_resource, [found_srn, not_found_srn])
+    delivery_service.close()
+
+    assert found == DeliveredResource(srn=found_srn, temporary_credentials=credentials, exists=True)
+    assert not_found == DeliveredResource(srn=not_found_srn, exists=False)
+    assert delivery_client_mock.get_resources.call_count == 2
+    assert set(delivery_client_mock.get_resources.call_args_list[0][0][0]) == {found_srn, not_found_srn}
+    assert delivery_client_mock.get_resources.call_args_list[1][0][0] == [found_srn]
+
+
+def test_get_resources_as_batch(delivery_service: DeliveryService):
+    found_srn, not_found_srn = SRN('a', 'found', 1), SRN('a', 'not-found', 1)
+    credentials = {'AccessKeyId': 'key'}
+    delivery_service._delivery_client = create_delivery_client_mock([
+        GetResourcesResponseNotFound(not_found_resource_ids=[not_found_srn]),
+        create_resource_response_success([{'srn': found_srn, 'data': {'A': 1}}], credentials),
+    ])
+
+    batch = delivery_service.get_resources_as_batch([found_srn, not_found_srn])
+
+    assert [(row.srn, row.exists, row.data, row.temporary_credentials) for row in batch] == [
+        (not_found_srn, False, None, None),
+        (found_srn, True, {'A': 1}, credentials),
+    ]
+
+
+def test_get_resources_with_cache_skips_cached_data_resources(tmp_path, monkeypatch):
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+    data_srn, file_srn, not_found_srn = SRN('a', 'data', 1), SRN('a', 'file', 1), SRN('a', 'not-found', 1)
+    credentials = {'AccessKeyId': 'key'}
+    s3_location = S3Location(bucket='bucket', key='key')
+
+    def get_resources(srns):
+        if not_found_srn in srns:
+            return GetResourcesResponseNotFound(not_found_resource_ids=[not_found_srn])
+        return create_resource_response_success([
+            {'srn': srn, 'data': {'A': 1}, 's3_location': s3_location if srn == file_srn else None} for srn in srns
+        ], credentials)
+
+    delivery_client_mock = Mock()
+    delivery_client_mock.get_resources = Mock(side_effect=get_resources)
+    delivery_service = DeliveryService(
+        delivery_client_mock, resource_cache=DiskResourceCache(str(tmp_path / 'cache.sqlite'), namespace='delivery')
+    )
+
+    fetched = list(delivery_service.get_resources([data_srn, file_srn, not_found_srn]))
+    cached = list(delivery_service.get_resources([data_srn, file_srn, not_found_srn]))
+
+    assert sorted(fetched, key=lambda resource: resource.srn) == [
+        DeliveredResource(srn=data_srn, data={'A': 1}, temporary_credentials=credentials, exists=True),
+        DeliveredResource(srn=file_srn, data={'A': 1}, s3_location=s3_location, temporary_credentials=credentials,
+                          exists=True),
+        DeliveredResource(srn=not_found_srn, exists=False),
+    ]
+    assert cached[0] == DeliveredResource(srn=data_srn, data={'A': 1}, exists=True)
+    assert {resource.srn for resource in cached[1:]} == {file_srn, not_found_srn}
+    assert [set(call[0][0]) for call in delivery_client_mock.get_resources.call_args_list] == [
+        {data_srn, file_srn, not_found_srn}, {data_srn, file_srn},
+        {file_srn, not_found_srn}, {file_srn},
+    ]
+
+
+def test_get_components_of_type(delivery_service: DeliveryService):
+    work_product_srn = SRN('work-product/WellLog', '1', 1)
+    log_srn, other_srn = SRN('work-product-component/WellLog', '2', 1), SRN('work-product-component/Document', '3', 1)
+    credentials = {'AccessKeyId': 'key'}
+    delivery_service._delivery_client = create_delivery_client_mock([
+        create_resource_response_success([{
+            'srn': work_product_srn,
+            'data': {'GroupTypeProperties': {'Components': [str(log_srn), str(other_srn)]}}
+        }], credentials),
+        create_resource_response_success([{'srn': log_srn, 'data': {}}], credentials),
+    ])
+
+    components = list(delivery_service.get_components_of_type(work_product_srn, 'work-product-component/WellLog'))
+
+    assert components == [DeliveredResource(srn=log_srn, data={}, temporary_credentials=credentials, exists=True)]
+    assert delivery_service._delivery_client.get_resources.call_args_list[1][0][0] == [log_srn]
+
+
+def test_get_resources_as_batch_with_cache_shares_entries_with_get_resources(tmp_path):
+    data_srn, file_srn = SRN('a', 'data', 1), SRN('a', 'file', 1)
+    s3_location = S3Location(bucket='bucket', key='key')
+    delivery_client_mock = Mock()
+    delivery_client_mock.get_resources = Mock(side_effect=lambda srns: create_resource_response_success([
+        {'srn': srn, 'data': {'A': 1}, 's3_location': s3_location if srn == file_srn else None} for srn in srns
+    ], {'AccessKeyId': 'key'}))
+    delivery_service = DeliveryService(
+        delivery_client_mock, resource_cache=DiskResourceCache(str(tmp_path / 'cache.sqlite'), namespace='delivery')
+    )
+
+    list(delivery_service.get_resources([data_srn]))
+    batch = delivery_service.get_resources_as_batch([data_srn, file_srn])
+    delivery_service.get_resources_as_batch([data_srn, file_srn])
+
+    assert sorted((row.srn, row.data, row.s3_location) for row in batch) == [
+        (data_srn, {'A': 1}, None), (file_srn, {'A': 1}, s3_location)
+    ]
+    assert [call[0][0] for call in delivery_client_mock.get_resources.call_args_list] == [[data_srn], [file_srn], [file_srn]]
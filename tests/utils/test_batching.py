@@ -0,0 +1,78 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from osdu_commons.utils.batching import BatchingConfig, MicroBatcher, MissingBatchResult
+
+
+class RecordingBatchFunction:
+    def __init__(self, missing=(), exception=None):
+        self.calls = []
+        self._missing = missing
+        self._exception = exception
+        self._lock = threading.Lock()
+
+    def __call__(self, keys):
+        with self._lock:
+            self.calls.append(keys)
+        if self._exception is not None:
+            raise self._exception
+        return {key: key * 10 for key in keys if key not in self._missing}
+
+
+def test_concurrent_lookups_are_sent_in_one_batch():
+    batch_function = RecordingBatchFunction()
+    with MicroBatcher(batch_function, BatchingConfig(max_batch_size=100, max_wait_ms=200)) as batcher:
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(batcher.get, range(10)))
+
+    assert results == [key * 10 for key in range(10)]
+    assert len(batch_function.calls) == 1
+    assert sorted(batch_function.calls[0]) == list(range(10))
+
+
+def test_batches_are_split_by_max_batch_size():
+    batch_function = RecordingBatchFunction()
+    with MicroBatcher(batch_function, BatchingConfig(max_batch_size=3, max_wait_ms=200)) as batcher:
+        results = batcher.get_many(range(7))
+
+    assert results == [key * 10 for key in range(7)]
+    assert [len(keys) for keys in batch_function.calls] == [3, 3, 1]
+
+
+def test_duplicated_keys_are_fetched_once():
+    batch_function = RecordingBatchFunction()
+    with MicroBatcher(batch_function, BatchingConfig(max_wait_ms=50)) as batcher:
+        results = batcher.get_many([1, 1, 2])
+
+    assert results == [10, 10, 20]
+    assert batch_function.calls == [[1, 2]]
+
+
+def test_missing_result_fails_only_its_caller():
+    batch_function = RecordingBatchFunction(missing=(2,))
+    with MicroBatcher(batch_function, BatchingConfig(max_wait_ms=50)) as batcher:
+        futures = [batcher.submit(key) for key in [1, 2]]
+
+        assert futures[0].result() == 10
+        with pytest.raises(MissingBatchResult):
+            futures[1].result()
+
+
+def test_exception_fails_all_callers_of_batch():
+    batch_function = RecordingBatchFunction(exception=ValueError('boom'))
+    with MicroBatcher(batch_function, BatchingConfig(max_wait_ms=50)) as batcher:
+        futures = [batcher.submit(key) for key in [1, 2]]
+
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_submit_to_closed_batcher_fails():
+    batcher = MicroBatcher(RecordingBatchFunction())
+    batcher.close()
+
+    with pytest.raises(RuntimeError):
+        batcher.submit(1)
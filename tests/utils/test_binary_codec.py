@@ -0,0 +1,210 @@
+import json
+import marshal
+import os
+import pickle
+from array import array
+from datetime import datetime
+
+import arrow
+import attr
+import pytest
+
+from osdu_commons.clients.workflow_client import Workflows, WorkflowStatus
+from osdu_commons.model.resource import LazyResource, Resource
+from osdu_commons.model.resource_batch import ResourceBatch
+from osdu_commons.model.swps_manifest import manifest_from_camel_dict
+from osdu_commons.utils import binary_codec
+from osdu_commons.utils.binary_codec import BinaryFormatError, OUT_OF_BAND_THRESHOLD, dumps, loads
+from osdu_commons.utils.frozen import FrozenDict
+from osdu_commons.utils.srn import SRN
+
+RESOURCE_FIELDS = dict(
+    id='srn:master-data/Well:1:',
+    type_id='srn:type:master-data/Well:',
+    home_region_id='srn:reference-data/OSDURegion:us-east-1:',
+    hosting_region_ids=['srn:reference-data/OSDURegion:us-east-1:'],
+    object_creation_date_time='2018-11-29 10:57:45',
+    version_creation_date_time=arrow.get('2018-11-29T10:57:45.5+02:00'),
+    curation_status='srn:reference-data/ResourceCurationStatus:CREATED:',
+    lifecycle_status='srn:reference-data/ResourceLifecycleStatus:LOADING:',
+    security_classification='srn:reference-data/ResourceSecurityClassification:RESTRICTED:',
+)
+
+
+@pytest.fixture()
+def resource():
+    return Resource(data={'Name': 'Well 1', 'Depths': [1.5, None], 'Shape': (1, 2), 'Raw': b'\x00'}, **RESOURCE_FIELDS)
+
+
+@pytest.mark.parametrize('trusted', [True, False])
+def test_manifest_round_trip(example_manifest, trusted):
+    manifest = manifest_from_camel_dict(example_manifest)
+
+    decoded = loads(dumps(manifest), trusted=trusted)
+
+    assert decoded == manifest
+    assert isinstance(decoded.work_product.data.individual_type_properties, FrozenDict)
+
+
+def test_resource_round_trip(resource):
+    decoded = loads(dumps(resource))
+
+    assert decoded == resource
+    assert decoded.version_creation_date_time.utcoffset() == resource.version_creation_date_time.utcoffset()
+    assert decoded.data['Shape'] == (1, 2)
+
+
+def test_workflows_round_trip():
+    workflows = Workflows.from_json({
+        'Batch': [{'WorkflowJobID': 'job-1', 'State': 'RUNNING', 'WorkProductID': 'srn:work-product/WellLog:1:1'}],
+        'NextToken': 'token'
+    })
+
+    decoded = loads(dumps(workflows))
+
+    assert decoded == workflows
+    assert decoded.batch[0].state is WorkflowStatus.RUNNING
+
+
+def test_shared_objects_are_decoded_once(resource):
+    first, second = loads(dumps([resource, resource]))
+
+    assert first is second
+
+
+def test_lazy_resource_raw_data_goes_out_of_band():
+    raw_data = json.dumps({'Name': 'x' * OUT_OF_BAND_THRESHOLD}).encode()
+    resource = LazyResource(raw_data=raw_data, **RESOURCE_FIELDS)
+    buffers = []
+
+    payload = dumps(resource, buffer_callback=buffers.append)
+    decoded = loads(payload, buffers=[bytes(buffer) for buffer in buffers])
+
+    assert len(payload) < len(raw_data)
+    assert [bytes(buffer) for buffer in buffers] == [raw_data]
+    assert decoded._raw_data == raw_data
+    assert decoded.data == resource.data
+    assert attr.asdict(decoded) == attr.asdict(resource)
+
+
+def test_missing_buffer_fails():
+    buffers = []
+    payload = dumps(b'x' * OUT_OF_BAND_THRESHOLD, buffer_callback=buffers.append)
+
+    with pytest.raises(BinaryFormatError):
+        loads(payload)
+
+
+def test_resource_batch_round_trip(resource):
+    batch = ResourceBatch.from_resources([resource] * 3)
+
+    decoded = loads(dumps(batch))
+
+    assert isinstance(decoded._object_creation_timestamps, array)
+    assert [attr.asdict(row) for row in decoded.to_resources()] == [attr.asdict(row) for row in batch.to_resources()]
+
+
+def test_validators_run_unless_trusted(resource):
+    object.__setattr__(resource, 'data', ['not', 'a', 'dict'])
+    payload = dumps(resource)
+
+    assert loads(payload, trusted=True).data == ['not', 'a', 'dict']
+    with pytest.raises(TypeError):
+        loads(payload, trusted=False)
+
+
+def dumps_with_state(obj, edit, monkeypatch) -> bytes:
+    """ Encodes obj with its attribute names and values changed by edit, as if written by another version. """
+    cls = type(obj)
+    names = binary_codec._state_names(cls)
+    state = dict(zip(names, binary_codec._Pickler.dispatch_table[cls](obj)[1][1:]))
+    names, values = edit(names, state)
+    monkeypatch.setitem(binary_codec._Pickler.dispatch_table, cls, lambda value: (cls, (names, *values)))
+    return dumps(obj)
+
+
+def test_missing_attributes_get_defaults(resource, monkeypatch):
+    def drop_security_classification(names, state):
+        del state['security_classification']
+        return tuple(state), tuple(state.values())
+
+    decoded = loads(dumps_with_state(resource, drop_security_classification, monkeypatch))
+
+    assert decoded.security_classification is None
+    assert decoded.id == resource.id
+
+
+def test_unknown_attributes_fail(resource, monkeypatch):
+    def rename_attribute(names, state):
+        return ('unknown',) + names[1:], tuple(state.values())
+
+    with pytest.raises(BinaryFormatError, match='unknown'):
+        loads(dumps_with_state(resource, rename_attribute, monkeypatch))
+
+
+def test_wrong_number_of_attributes_fails(resource, monkeypatch):
+    with pytest.raises(BinaryFormatError, match='number'):
+        loads(dumps_with_state(resource, lambda names, state: (names, tuple(state.values())[1:]), monkeypatch))
+
+
+@pytest.mark.parametrize('value', [os.system, binary_codec.dumps, RuntimeError])
+def test_globals_other_than_models_are_not_resolved(value):
+    payload = binary_codec.MAGIC + bytes([binary_codec.FORMAT_VERSION]) + pickle.dumps(value, 4)
+
+    with pytest.raises(BinaryFormatError):
+        loads(payload)
+
+
+def global_payload(module: str, name: str) -> bytes:
+    """ Payload of just a reference to name in module, as pickle writes classes and functions. """
+    return binary_codec.MAGIC + bytes([binary_codec.FORMAT_VERSION]) + pickle.PROTO + bytes([4]) + b''.join(
+        pickle.SHORT_BINUNICODE + bytes([len(text)]) + text.encode() for text in [module, name]
+    ) + pickle.STACK_GLOBAL + pickle.STOP
+
+
+@pytest.mark.parametrize('module, name', [
+    ('osdu_commons.utils.disk_resource_cache', 'threading.Thread'),
+    ('osdu_commons.utils.binary_codec', 'arrow.Arrow'),
+    ('osdu_commons.utils.resource_cache', 'TTLCache'),
+    ('osdu_commons.model.resource', 'Resource.__init__'),
+    ('osdu_commons.utils.disk_resource_cache', 'DiskResourceCache'),
+])
+def test_classes_other_than_models_of_package_are_not_resolved(module, name):
+    with pytest.raises(BinaryFormatError, match=name):
+        loads(global_payload(module, name), trusted=True)
+
+
+def test_model_classes_are_resolved_where_they_are_defined_only():
+    assert callable(loads(global_payload('osdu_commons.model.resource', 'Resource')))
+    with pytest.raises(BinaryFormatError, match='defined'):
+        loads(global_payload('osdu_commons.model.resource_batch', 'Resource'))
+
+
+def test_model_classes_are_not_called(resource):
+    payload = binary_codec.MAGIC + bytes([binary_codec.FORMAT_VERSION]) + pickle.dumps(resource, 4)
+
+    with pytest.raises(BinaryFormatError):
+        loads(payload)
+
+
+@pytest.mark.parametrize('payload', [
+    b'', b'{"a": 1}', binary_codec.MAGIC + b'\x01' + marshal.dumps(1),
+    binary_codec.MAGIC + bytes([binary_codec.FORMAT_VERSION]) + b'\x80\x04garbage',
+])
+def test_foreign_payloads_fail(payload):
+    with pytest.raises(BinaryFormatError):
+        loads(payload)
+
+
+@pytest.mark.parametrize('value', [object(), {'key': object()}, datetime(2018, 11, 29), lambda: None])
+def test_unsupported_types_fail(value):
+    with pytest.raises(BinaryFormatError):
+        dumps(value)
+
+
+@pytest.mark.parametrize('value', [
+    None, 1, 'a', [1, (2, 3)], {'a': {1, 2}}, {(1, 2): 3}, frozenset(['a']), bytearray(b'ab'), memoryview(b'ab'),
+    SRN('master-data/Well', '1', 2), array('q', [1, 2]), WorkflowStatus.RUNNING,
+])
+def test_values_round_trip(value):
+    assert loads(dumps(value)) == value
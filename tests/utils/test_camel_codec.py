@@ -0,0 +1,99 @@
+import json
+
+import attr
+import pytest
+from attr.validators import instance_of
+
+from osdu_commons.model.file import FileGroupTypeProperties, ManifestFile
+from osdu_commons.model.smds_manifest import SMDSManifest
+from osdu_commons.model.swps_manifest import SWPSManifest, manifest_from_camel_dict
+from osdu_commons.model.work_product_component import WorkProductComponentArtefact
+from osdu_commons.utils import convert
+from osdu_commons.utils.camel_codec import camel_codec, decode_camel, encode_camel
+from osdu_commons.utils.srn import SRN
+
+SMDS_MANIFEST = {
+    'ResourceID': 'srn:master-data/Well:1:',
+    'ResourceTypeID': 'srn:type:master-data/Well:',
+    'ResourceSecurityClassification': 'srn:reference-data/ResourceSecurityClassification:RESTRICTED:',
+    'Data': {'Name': 'Well 1', 'Depths': [1, 2]},
+    'Description': 'Well',
+    'OriginalResourceID': None,
+}
+
+
+def test_decode_equals_generic_converter(example_manifest):
+    manifest = manifest_from_camel_dict(example_manifest)
+
+    assert manifest == convert.class_from_camel_dict(SWPSManifest)(example_manifest)
+
+
+def test_round_trip_keeps_json(example_manifest):
+    manifest = manifest_from_camel_dict(example_manifest)
+
+    assert json.loads(json.dumps(manifest.asdict())) == example_manifest
+    assert manifest_from_camel_dict(manifest.asdict()) == manifest
+
+
+def test_smds_round_trip():
+    manifest = decode_camel(SMDSManifest, SMDS_MANIFEST)
+
+    assert manifest.resource_id == SRN('master-data/Well', '1')
+    assert manifest.asdict() == SMDS_MANIFEST
+
+
+def test_missing_keys_get_defaults():
+    artefact = decode_camel(WorkProductComponentArtefact, {'RoleID': 'srn:role:a:', 'ResourceID': 'srn:file/x:1:'})
+
+    assert artefact == WorkProductComponentArtefact(role_id='srn:role:a:', resource_id='srn:file/x:1:')
+    assert list(artefact.asdict()) == ['RoleID', 'ResourceTypeID', 'ResourceID']
+
+
+def test_encode_omits_none():
+    properties = decode_camel(FileGroupTypeProperties, {'FileSize': 10, 'Checksum': None})
+
+    assert properties.asdict() == {'FileSize': 10}
+
+
+@pytest.mark.parametrize('camel_dict', [
+    {'RoleID': 'srn:role:a:', 'ResourceID': 'srn:file/x:1:', 'Unknown': 1},
+    {'RoleID': 'srn:role:a:'},
+])
+def test_unexpected_keys_fail_like_generic_converter(camel_dict):
+    with pytest.raises(TypeError):
+        decode_camel(WorkProductComponentArtefact, camel_dict)
+
+
+def test_validators_run(example_manifest):
+    file = dict(example_manifest['Files'][0], AssociativeID=1)
+
+    with pytest.raises(TypeError, match='associative_id'):
+        decode_camel(ManifestFile, file)
+
+
+def test_instances_pass_through(example_manifest):
+    manifest = manifest_from_camel_dict(example_manifest)
+
+    assert decode_camel(SWPSManifest, manifest) is manifest
+
+
+def test_encode_requires_registration():
+    @attr.s
+    class NotRegistered:
+        name = attr.ib(validator=instance_of(str))
+
+    with pytest.raises(TypeError, match='NotRegistered'):
+        encode_camel(NotRegistered('a'))
+
+
+def test_post_init_runs():
+    @camel_codec()
+    @attr.s(slots=True)
+    class WithPostInit:
+        value: int = attr.ib()
+        double: int = attr.ib(init=False, default=0)
+
+        def __attrs_post_init__(self):
+            self.double = 2 * self.value
+
+    assert decode_camel(WithPostInit, {'Value': 2}).double == 4
@@ -1,7 +1,61 @@
+import pytest
+
+from osdu_commons.model.enums import ResourceCurationStatus, ResourceLifecycleStatus
+from osdu_commons.model.file import FileGroupTypeProperties
 from osdu_commons.model.swps_manifest import manifest_from_camel_dict
+from osdu_commons.utils import convert
+from osdu_commons.utils.srn import SRNFormatException
 
 
 def test_manifest_as_dict_preserves_same_structure(example_manifest):
     manifest_obj = manifest_from_camel_dict(example_manifest)
     manifest_back_to_json = manifest_obj.asdict()
     assert manifest_back_to_json == example_manifest
+
+
+@pytest.mark.parametrize('name,snake_case_name', [
+    ('AssociativeID', 'associative_id'),
+    ('ResourceTypeID', 'resource_type_id'),
+    ('IndividualTypeProperties', 'individual_type_properties'),
+    ('FileSource', 'file_source'),
+    ('resourceID', 'resource_id'),
+    ('already_snake', 'already_snake'),
+])
+def test_to_snake_case(name, snake_case_name):
+    assert convert.to_snake_case(name) == snake_case_name
+
+
+def test_class_from_camel_dict_is_cached_per_class():
+    converter = convert.class_from_camel_dict(FileGroupTypeProperties)
+
+    assert convert.class_from_camel_dict(FileGroupTypeProperties) is converter
+    assert converter({'FileSource': 'a', 'FileSize': 1}) == FileGroupTypeProperties(file_source='a', file_size=1)
+    assert converter({'FileSource': 'b'}) == FileGroupTypeProperties(file_source='b')
+    with pytest.raises(TypeError):
+        converter({'UnknownKey': 1})
+
+
+@pytest.mark.parametrize('converter,value,expected', [
+    (convert.resource_curation_status, 'srn:reference-data/ResourceCurationStatus:CURATED:', ResourceCurationStatus.CURATED),
+    (convert.resource_curation_status, ResourceCurationStatus.CURATED.value, ResourceCurationStatus.CURATED),
+    (convert.resource_curation_status, ResourceCurationStatus.CURATED, ResourceCurationStatus.CURATED),
+    (convert.resource_lifecycle_status, 'srn:reference-data/ResourceLifecycleStatus:DELETED:', ResourceLifecycleStatus.DELETED),
+    (convert.resource_lifecycle_status, ResourceLifecycleStatus.DELETED.value, ResourceLifecycleStatus.DELETED),
+    (convert.resource_lifecycle_status, ResourceLifecycleStatus.DELETED, ResourceLifecycleStatus.DELETED),
+])
+def test_status_conversion(converter, value, expected):
+    assert converter(value) is expected
+
+
+@pytest.mark.parametrize('converter,value,exception', [
+    (convert.resource_curation_status, 'srn:reference-data/ResourceCurationStatus:UNKNOWN:', ValueError),
+    (convert.resource_curation_status, 'CURATED', SRNFormatException),
+    (convert.resource_curation_status, ResourceLifecycleStatus.DELETED.value, ValueError),
+    (convert.resource_curation_status, ['CURATED'], TypeError),
+    (convert.resource_lifecycle_status, 'srn:reference-data/ResourceLifecycleStatus:DELETED:1', ValueError),
+    (convert.resource_lifecycle_status, ResourceCurationStatus.CURATED, TypeError),
+    (convert.resource_lifecycle_status, {}, TypeError),
+])
+def test_status_conversion_of_unknown_values(converter, value, exception):
+    with pytest.raises(exception):
+        converter(value)
@@ -0,0 +1,61 @@
+import threading
+import time
+
+import pytest
+
+from osdu_commons.utils.dag import DagStep, run_dag
+
+
+def test_independent_steps_run_concurrently_and_get_dependency_results():
+    barrier = threading.Barrier(2, timeout=1)
+
+    def independent(value):
+        barrier.wait()
+        return value
+
+    dag_result = run_dag([
+        DagStep('sum', lambda a, b: a + b, ['a', 'b']),
+        DagStep('a', lambda: independent(1)),
+        DagStep('b', lambda: independent(2)),
+    ])
+
+    assert dag_result.results == {'a': 1, 'b': 2, 'sum': 3}
+    assert dag_result.timings['sum'].start >= max(dag_result.timings['a'].end, dag_result.timings['b'].end)
+
+
+def test_critical_path_follows_last_finished_dependency():
+    def sleep(seconds):
+        time.sleep(seconds)
+
+    dag_result = run_dag([
+        DagStep('fast', lambda: sleep(0)),
+        DagStep('slow', lambda: sleep(0.1)),
+        DagStep('last', lambda fast, slow: None, ['fast', 'slow']),
+    ])
+
+    assert dag_result.critical_path() == ['slow', 'last']
+    assert dag_result.timings['slow'].duration >= 0.1
+
+
+def test_failing_step_stops_dependent_steps():
+    calls = []
+
+    def fail():
+        raise KeyError('boom')
+
+    with pytest.raises(KeyError):
+        run_dag([
+            DagStep('fail', fail),
+            DagStep('dependent', lambda fail: calls.append(fail), ['fail']),
+        ])
+
+    assert calls == []
+
+
+@pytest.mark.parametrize('steps', [
+    [DagStep('a', lambda b: None, ['b']), DagStep('b', lambda a: None, ['a'])],
+    [DagStep('a', lambda missing: None, ['missing'])],
+])
+def test_invalid_dag_is_rejected(steps):
+    with pytest.raises(ValueError):
+        run_dag(steps)
@@ -0,0 +1,177 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from osdu_commons.model.resource import Resource
+from osdu_commons.utils import binary_codec
+from osdu_commons.utils.disk_resource_cache import DEFAULT_MAX_SIZE_BYTES, DiskResourceCache
+from osdu_commons.utils.resource_cache import ResourceCacheStats
+from osdu_commons.utils.srn import SRN
+
+WELL_ID = SRN('master-data/Well', '123')
+
+
+def _resource(resource_id: SRN) -> Resource:
+    return Resource(
+        id=resource_id,
+        type_id=f'srn:type:{resource_id.type}:',
+        home_region_id='srn:reference-data/OSDURegion:us-east-1:',
+        hosting_region_ids=['srn:reference-data/OSDURegion:us-east-1:'],
+        object_creation_date_time='2018-11-29 10:57:45',
+        version_creation_date_time='2018-11-29 10:57:45',
+        curation_status='srn:reference-data/ResourceCurationStatus:CREATED:',
+        lifecycle_status='srn:reference-data/ResourceLifecycleStatus:LOADING:',
+        security_classification='srn:reference-data/ResourceSecurityClassification:RESTRICTED:',
+        data={'Name': 'Well'},
+    )
+
+
+@pytest.fixture()
+def cache_path(tmp_path):
+    return str(tmp_path / 'resources.sqlite')
+
+
+def test_latest_and_pinned_versions_are_cached_separately(cache_path):
+    cache = DiskResourceCache(cache_path)
+    latest = _resource(WELL_ID.with_version(2))
+    first = _resource(WELL_ID.with_version(1))
+
+    cache.put(WELL_ID, latest)
+    cache.put(WELL_ID.with_version(1), first)
+
+    assert cache.get(WELL_ID) == latest
+    assert cache.get(WELL_ID.with_version(2)) == latest
+    assert cache.get(WELL_ID.with_version(1)) == first
+    assert cache.get(WELL_ID.with_version(3)) is None
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.invalidations) == (3, 1, 0)
+
+
+def test_entries_are_shared_between_caches_of_one_file(cache_path):
+    writer, reader = DiskResourceCache(cache_path), DiskResourceCache(cache_path)
+    other_namespace = DiskResourceCache(cache_path, namespace='delivery')
+
+    writer.put(WELL_ID, _resource(WELL_ID.with_version(1)))
+
+    assert reader.get(WELL_ID) == _resource(WELL_ID.with_version(1))
+    assert other_namespace.get(WELL_ID) is None
+
+
+def test_invalidate_removes_all_versions_in_all_namespaces_and_kinds(cache_path):
+    cache, other_namespace = DiskResourceCache(cache_path), DiskResourceCache(cache_path, namespace='delivery')
+    other_id = SRN('master-data/Well', '456')
+    cache.put(WELL_ID, _resource(WELL_ID.with_version(2)))
+    cache.put(WELL_ID, {'Name': 'Well'}, kind='other')
+    cache.put(other_id, _resource(other_id))
+    other_namespace.put(WELL_ID.with_version(1), _resource(WELL_ID.with_version(1)))
+
+    assert cache.get(WELL_ID, kind='other') == {'Name': 'Well'}
+
+    cache.invalidate([WELL_ID.with_version(2)])
+
+    assert cache.get(WELL_ID) is None
+    assert cache.get(WELL_ID, kind='other') is None
+    assert other_namespace.get(WELL_ID.with_version(1)) is None
+    assert cache.get(other_id) == _resource(other_id)
+    assert cache.stats.invalidations == 4
+
+
+def test_ttl_depends_on_type_prefix(cache_path):
+    cache = DiskResourceCache(
+        cache_path, ttl_seconds=0.1, ttl_seconds_by_type_prefix={'reference-data/': 60, 'reference-data/Short': 0.1}
+    )
+    region_id = SRN('reference-data/OSDURegion', 'us-east-1')
+    short_id = SRN('reference-data/ShortLived', '1')
+    for resource_id in [WELL_ID, region_id, short_id]:
+        cache.put(resource_id, _resource(resource_id))
+
+    time.sleep(0.2)
+
+    assert cache.get(WELL_ID) is None
+    assert cache.get(short_id) is None
+    assert cache.get(region_id) == _resource(region_id)
+
+
+def test_size_is_bounded_by_evicting_oldest_entries(cache_path):
+    cache = DiskResourceCache(cache_path)
+    cache.put(WELL_ID, _resource(WELL_ID))
+    entry_size = cache.stats.size
+    cache = DiskResourceCache(cache_path, max_size_bytes=int(entry_size * 3.5))
+
+    resource_ids = [SRN('master-data/Well', str(i)) for i in range(5)]
+    for resource_id in resource_ids:
+        cache.put(resource_id, _resource(resource_id))
+
+    assert [cache.get(resource_id) is not None for resource_id in [WELL_ID] + resource_ids] == [
+        False, False, False, True, True, True
+    ]
+    assert cache.stats.size <= cache.stats.max_size
+
+
+def test_clear_removes_only_own_namespace(cache_path):
+    cache, other_namespace = DiskResourceCache(cache_path), DiskResourceCache(cache_path, namespace='delivery')
+    cache.put(WELL_ID, _resource(WELL_ID))
+    other_namespace.put(WELL_ID, _resource(WELL_ID))
+
+    cache.clear()
+
+    assert cache.get(WELL_ID) is None
+    assert other_namespace.get(WELL_ID) == _resource(WELL_ID)
+    assert cache.stats.size == other_namespace.stats.size > 0
+
+
+def test_put_many_stores_payload_once_per_version(cache_path):
+    cache = DiskResourceCache(cache_path)
+    resources = [_resource(SRN('master-data/Well', str(i), 1)) for i in range(3)]
+
+    cache.put_many([(resource.id.without_version, resource) for resource in resources])
+
+    assert [cache.get(resource.id.without_version) for resource in resources] == resources
+    assert [cache.get(resource.id) for resource in resources] == resources
+    assert cache.stats.size == sum(len(binary_codec.dumps(resource)) for resource in resources)
+
+
+def test_latest_version_pointing_at_evicted_version_is_a_miss(cache_path):
+    cache = DiskResourceCache(cache_path)
+    cache.put(WELL_ID, _resource(WELL_ID.with_version(1)))
+    cache._connection().execute('DELETE FROM resources WHERE key = ?', (str(WELL_ID.with_version(1)),))
+
+    assert cache.get(WELL_ID) is None
+
+
+def test_database_is_private_to_its_owner(cache_path):
+    DiskResourceCache(cache_path).put(WELL_ID, _resource(WELL_ID))
+
+    assert [os.stat(path).st_mode & 0o777 for path in [cache_path, f'{cache_path}-wal']] == [0o600, 0o600]
+
+
+def test_invalid_payloads_are_misses(cache_path):
+    cache = DiskResourceCache(cache_path)
+    resource = _resource(WELL_ID)
+    object.__setattr__(resource, 'data', ['not', 'a', 'dict'])
+
+    cache.put(WELL_ID, resource)
+
+    assert cache.get(WELL_ID) is None
+    assert cache.stats.misses == 1
+
+
+def test_concurrent_readers_and_writers(cache_path):
+    cache = DiskResourceCache(cache_path)
+    resource_ids = [SRN('master-data/Well', str(i)) for i in range(50)]
+
+    def put_and_get(resource_id):
+        DiskResourceCache(cache_path).put(resource_id, _resource(resource_id))
+        return cache.get(resource_id)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        resources = list(executor.map(put_and_get, resource_ids))
+    cache.close()
+
+    assert resources == [_resource(resource_id) for resource_id in resource_ids]
+    assert DiskResourceCache(cache_path).stats == ResourceCacheStats(
+        hits=0, misses=0, invalidations=0, size=sum(len(binary_codec.dumps(resource)) for resource in resources),
+        max_size=DEFAULT_MAX_SIZE_BYTES,
+    )
@@ -0,0 +1,71 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from osdu_commons.utils.frozen import FrozenDict, FrozenList, freeze, thaw
+
+VALUE = {'a': [1, {'b': 'c'}], 'd': None, 'e': (1.5, [True])}
+
+
+def test_freeze_keeps_value():
+    frozen = freeze(VALUE)
+
+    assert frozen == VALUE
+    assert isinstance(frozen, FrozenDict)
+    assert isinstance(frozen['a'], FrozenList)
+    assert isinstance(frozen['a'][1], FrozenDict)
+    assert isinstance(frozen['e'][1], FrozenList)
+    assert json.dumps(frozen, sort_keys=True) == json.dumps(VALUE, sort_keys=True)
+
+
+def test_freeze_is_isolated_from_source():
+    source = {'a': [1]}
+    frozen = freeze(source)
+
+    source['a'].append(2)
+
+    assert frozen == {'a': [1]}
+
+
+def test_frozen_values_are_shared():
+    frozen = freeze(VALUE)
+
+    assert freeze(frozen) is frozen
+    assert copy.copy(frozen) is frozen
+    assert copy.deepcopy(frozen) is frozen
+
+
+@pytest.mark.parametrize('mutate', [
+    lambda frozen: frozen.__setitem__('x', 1),
+    lambda frozen: frozen.update({'x': 1}),
+    lambda frozen: frozen.pop('a'),
+    lambda frozen: frozen['a'].append(1),
+    lambda frozen: frozen['a'].__setitem__(0, 2),
+    lambda frozen: frozen['a'][1].clear(),
+])
+def test_frozen_values_are_immutable(mutate):
+    frozen = freeze(VALUE)
+
+    with pytest.raises(TypeError):
+        mutate(frozen)
+    assert frozen == VALUE
+
+
+def test_thaw():
+    thawed = thaw(freeze(VALUE))
+
+    thawed['a'][1]['b'] = 'x'
+
+    assert type(thawed) is dict and type(thawed['a']) is list
+    assert thawed['a'][1] == {'b': 'x'}
+
+
+def test_pickle():
+    frozen = freeze(VALUE)
+
+    unpickled = pickle.loads(pickle.dumps(frozen))
+
+    assert unpickled == frozen
+    assert isinstance(unpickled['a'][1], FrozenDict)
@@ -0,0 +1,79 @@
+import time
+from types import SimpleNamespace
+
+from osdu_commons.utils.resource_cache import ResourceCache, ResourceCacheStats
+from osdu_commons.utils.srn import SRN
+
+WELL_ID = SRN('master-data/Well', '123')
+
+
+def _resource(resource_id):
+    return SimpleNamespace(id=resource_id)
+
+
+def test_latest_and_pinned_versions_are_cached_separately():
+    cache = ResourceCache()
+    latest = _resource(WELL_ID.with_version(2))
+    first = _resource(WELL_ID.with_version(1))
+
+    cache.put(WELL_ID, latest)
+    cache.put(WELL_ID.with_version(1), first)
+
+    assert cache.get(WELL_ID) is latest
+    assert cache.get(WELL_ID.with_version(2)) is latest
+    assert cache.get(WELL_ID.with_version(1)) is first
+    assert cache.get(WELL_ID.with_version(3)) is None
+    assert cache.stats == ResourceCacheStats(hits=3, misses=1, invalidations=0, size=3, max_size=1024)
+
+
+def test_put_many_caches_kinds_separately():
+    cache = ResourceCache()
+    other_id = SRN('master-data/Well', '456')
+
+    cache.put_many([(WELL_ID, _resource(WELL_ID.with_version(2))), (other_id, _resource(other_id))])
+    cache.put_many([(WELL_ID, {'Name': 'Well'})], kind='other')
+
+    assert cache.get(WELL_ID).id == WELL_ID.with_version(2)
+    assert cache.get(other_id).id == other_id
+    assert cache.get(WELL_ID, kind='other') == {'Name': 'Well'}
+    assert cache.get(other_id, kind='other') is None
+    assert cache.stats.size == 4
+
+
+def test_invalidate_removes_all_versions():
+    cache = ResourceCache()
+    cache.put(WELL_ID, _resource(WELL_ID.with_version(2)))
+    cache.put(WELL_ID.with_version(1), _resource(WELL_ID.with_version(1)))
+    other_id = SRN('master-data/Well', '456')
+    cache.put(other_id, _resource(other_id))
+
+    cache.invalidate([WELL_ID.with_version(2)])
+
+    assert cache.get(WELL_ID) is None
+    assert cache.get(WELL_ID.with_version(1)) is None
+    assert cache.get(other_id) is not None
+    assert cache.stats.invalidations == 3
+
+
+def test_entries_expire_and_size_is_bounded():
+    cache = ResourceCache(max_size=2, ttl_seconds=0.1)
+    for i in range(3):
+        cache.put(SRN('master-data/Well', str(i)), _resource(SRN('master-data/Well', str(i))))
+
+    assert cache.stats.size == 2
+    time.sleep(0.2)
+    assert cache.get(SRN('master-data/Well', '2')) is None
+
+
+def test_invalidate_uses_index_bounded_by_cache_size():
+    cache = ResourceCache(max_size=4)
+    resource_ids = [SRN('master-data/Well', str(i)) for i in range(20)]
+    for resource_id in resource_ids:
+        cache.put(resource_id, _resource(resource_id.with_version(1)))
+
+    cache.invalidate([resource_ids[-1], resource_ids[0]])
+
+    assert len(cache._keys_by_id) <= 2 * 4
+    assert cache.get(resource_ids[-1]) is None
+    assert cache.get(resource_ids[-2].with_version(1)) is not None
+    assert cache.stats.invalidations == 2
@@ -46,3 +46,9 @@ def test_resource_security_classification_correct(valid_input, expected_output):
 def test_resource_security_classification_bad(bad_input):
     with pytest.raises(TypeError):
         resource_security_classification(bad_input)
+
+
+@pytest.mark.parametrize('bad_input', [None, ['RESTRICTED'], {'RESTRICTED': 1}])
+def test_resource_security_classification_bad_type(bad_input):
+    with pytest.raises(TypeError):
+        resource_security_classification(bad_input)
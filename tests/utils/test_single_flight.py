@@ -0,0 +1,59 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from osdu_commons.utils.single_flight import SingleFlight, SingleFlightStats
+
+
+def test_concurrent_calls_share_one_execution():
+    single_flight = SingleFlight()
+    calls = []
+    barrier = threading.Barrier(5)
+
+    def function():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    def call():
+        barrier.wait()
+        return single_flight.do('key', function)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = [future.result() for future in [executor.submit(call) for _ in range(5)]]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert single_flight.stats == SingleFlightStats(hits=4, misses=1)
+
+
+def test_exception_is_shared_by_concurrent_calls():
+    single_flight = SingleFlight()
+    barrier = threading.Barrier(3)
+
+    def function():
+        time.sleep(0.2)
+        raise ValueError('boom')
+
+    def call():
+        barrier.wait()
+        return single_flight.do('key', function)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(call) for _ in range(3)]
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert single_flight.stats == SingleFlightStats(hits=2, misses=1)
+
+
+def test_sequential_calls_are_not_coalesced():
+    single_flight = SingleFlight()
+
+    assert single_flight.do('key', lambda: 1) == 1
+    assert single_flight.do('key', lambda: 2) == 2
+    assert single_flight.do('other-key', lambda: 3) == 3
+    assert single_flight.stats == SingleFlightStats(hits=0, misses=3)
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from osdu_commons.utils.srn import SRN, SRNFormatException
@@ -74,3 +76,30 @@ def test_without_version(value, expected):
 ])
 def test_with_version(value, new_version, expected):
     assert value.with_version(new_version) == expected
+
+
+def test_from_string_interns_parsed_srns():
+    srn = SRN.from_string('srn:type:/abc/def:1')
+
+    assert SRN.from_string('srn:type:/abc/def:1') is srn
+    assert srn.without_version is srn.without_version
+    assert hash(srn) == hash(SRN('type', '/abc/def', 1))
+
+
+def test_srn_is_immutable_and_picklable():
+    srn = SRN('type', 'detail', 1)
+
+    with pytest.raises(AttributeError):
+        srn.version = 2
+    assert pickle.loads(pickle.dumps(srn)) == srn
+    assert sorted([SRN('type', 'b'), SRN('type', 'a')]) == [SRN('type', 'a'), SRN('type', 'b')]
+
+
+@pytest.mark.parametrize('type_,detail,version', [
+    (1, 'detail', None),
+    ('type', None, None),
+    ('type', 'detail', '1'),
+])
+def test_invalid_field_types(type_, detail, version):
+    with pytest.raises(TypeError):
+        SRN(type_, detail, version)
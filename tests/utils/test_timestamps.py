@@ -0,0 +1,31 @@
+import arrow
+import pytest
+
+from osdu_commons.utils.timestamps import epoch_microseconds, from_epoch_microseconds, parse_timestamp
+
+
+@pytest.mark.parametrize('value', [
+    '2018-11-29 10:57:45',
+    '2018-11-29T10:57:45',
+    '2018-11-29T10:57:45.123Z',
+    '2018-11-29T10:57:45.123456+00:00',
+    '2018-11-29T10:57:45+02:00',
+    '2018-11-29',
+    1543489065,
+])
+def test_matches_arrow(value):
+    expected = arrow.get(value)
+
+    timestamp = parse_timestamp(value)
+
+    assert timestamp == expected
+    assert timestamp.utcoffset() == expected.utcoffset()
+    assert epoch_microseconds(value) == expected.timestamp * 1000000 + expected.microsecond
+    assert from_epoch_microseconds(epoch_microseconds(value)) == expected
+
+
+def test_invalid_timestamp():
+    with pytest.raises(ValueError):
+        parse_timestamp('2018-13-29 10:57:45')
+    with pytest.raises(ValueError):
+        epoch_microseconds('2018-11-29 25:57:45')
@@ -0,0 +1,61 @@
+from typing import List
+
+import attr
+import pytest
+from attr.validators import instance_of
+
+from osdu_commons.clients.collection_client import Collection
+from osdu_commons.utils import convert
+from osdu_commons.utils.srn import SRN
+from osdu_commons.utils.trusted import constructor, is_trusted_decode, resolve_trusted_decode, set_trusted_decode
+
+
+@attr.s(frozen=True, slots=True)
+class Example:
+    srn: SRN = attr.ib(validator=instance_of(SRN), converter=convert.srn)
+    count: int = attr.ib(validator=instance_of(int), default=1)
+    items: List[int] = attr.ib(default=attr.Factory(list))
+    description: str = attr.ib(default=attr.Factory(lambda self: f'{self.srn} x {self.count}', takes_self=True))
+
+
+def test_untrusted_constructor_is_class():
+    assert constructor(Example, trusted=False) is Example
+
+
+def test_trusted_constructor_builds_equal_objects():
+    trusted = constructor(Example, trusted=True)
+
+    assert trusted(srn='srn:a:b:1') == Example(srn='srn:a:b:1')
+    assert trusted(srn='srn:a:b:1', count=2, items=[1]) == Example(srn='srn:a:b:1', count=2, items=[1])
+    assert trusted(srn='srn:a:b:1').items is not trusted(srn='srn:a:b:1').items
+
+
+def test_trusted_constructor_skips_validators():
+    trusted = constructor(Example, trusted=True)
+
+    assert trusted(srn='srn:a:b:1', count='many').count == 'many'
+    with pytest.raises(TypeError):
+        Example(srn='srn:a:b:1', count='many')
+    with pytest.raises(TypeError):
+        trusted(srn='srn:a:b:1', unknown=1)
+    with pytest.raises(TypeError):
+        trusted()
+
+
+def test_from_json_uses_trusted_constructor():
+    json_object = {'SRN': 'srn:collection:1:', 'OwnerID': 1, 'FilterSpecification': []}
+
+    with pytest.raises(TypeError):
+        Collection.from_json(json_object)
+    assert Collection.from_json(json_object, trusted=True).owner_id == 1
+
+
+def test_global_trusted_decode():
+    assert not is_trusted_decode()
+    set_trusted_decode(True)
+    try:
+        assert resolve_trusted_decode(None)
+        assert not resolve_trusted_decode(False)
+    finally:
+        set_trusted_decode(False)
+    assert not resolve_trusted_decode(None)